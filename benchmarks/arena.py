@@ -0,0 +1,47 @@
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from benchmarks.synthetic import Generator
+from gedcom5.arena import ArenaGEDCOM
+from gedcom5.parser import GEDCOM5Parser
+
+
+def measure(load: Callable[[], object]) -> Dict[str, float]:
+    gc.collect()
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    gedcom = load()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del gedcom
+    return {'seconds': elapsed, 'retained_bytes': retained, 'peak_bytes': peak}
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description='Memory retained by a Tag tree and by an arena')
+    args.add_argument('--individuals', type=int, default=10000)
+    args.add_argument('--seed', type=int, default=0)
+    options = args.parse_args(argv)
+    doc = Generator(individuals=options.individuals, seed=options.seed).text()
+    baseline = None
+    for name, load in (('tree', lambda: GEDCOM5Parser().parse_string(doc)),
+                       ('arena', lambda: ArenaGEDCOM.from_string(doc))):
+        result = measure(load)
+        baseline = baseline or result
+        ratio = result['retained_bytes'] / baseline['retained_bytes']
+        print(
+            f'{name:>14}: {result["retained_bytes"] / 1e6:8.1f} MB retained ({ratio:.2f}x), '
+            f'{result["peak_bytes"] / 1e6:8.1f} MB peak, {result["seconds"]:.3f}s'
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
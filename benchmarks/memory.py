@@ -0,0 +1,50 @@
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+from benchmarks.synthetic import Generator
+from gedcom5.parser import GEDCOM5Parser
+
+
+def measure(doc: str, parser: GEDCOM5Parser) -> Dict[str, float]:
+    gc.collect()
+    start = time.perf_counter()
+    parser.parse_string(doc)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    gedcom = parser.parse_string(doc)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del gedcom
+    return {'seconds': elapsed, 'retained_bytes': retained, 'peak_bytes': peak}
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description='Memory retained by a parsed tree, with value interning and compact records')
+    args.add_argument('--individuals', type=int, default=10000)
+    args.add_argument('--seed', type=int, default=0)
+    options = args.parse_args(argv)
+    doc = Generator(individuals=options.individuals, seed=options.seed).text()
+    baseline = None
+    parsers = (
+        ('default', GEDCOM5Parser()),
+        ('intern_values', GEDCOM5Parser(intern_values=True)),
+        ('compact', GEDCOM5Parser(compact=True)),
+    )
+    for name, parser in parsers:
+        result = measure(doc, parser)
+        baseline = baseline or result
+        ratio = result['retained_bytes'] / baseline['retained_bytes']
+        print(
+            f'{name:>14}: {result["retained_bytes"] / 1e6:8.1f} MB retained ({ratio:.2f}x), '
+            f'{result["peak_bytes"] / 1e6:8.1f} MB peak, {result["seconds"]:.3f}s'
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+from io import BytesIO
+from typing import Callable, Dict
+
+from benchmarks.synthetic import Generator
+from gedcom5.gedcom import GEDCOM
+from gedcom5.parser import GEDCOM5Parser
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def version() -> str:
+    try:
+        return metadata.version('gedcom5')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def run(individuals: int, seed: int, repeat: int) -> Dict[str, object]:
+    doc = Generator(individuals=individuals, seed=seed).text()
+    data = doc.encode('utf-8')
+    lines = doc.splitlines()
+    parser = GEDCOM5Parser()
+    results: Dict[str, object] = {
+        'version': version(),
+        'python': platform.python_version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'individuals': individuals,
+        'seed': seed,
+        'lines': len(lines),
+        'bytes': len(data),
+    }
+
+    elapsed = best_of(lambda: parser.parse_string(doc), repeat)
+    results['parse_string_seconds'] = elapsed
+    results['parse_lines_per_second'] = len(lines) / elapsed
+    results['parse_megabytes_per_second'] = len(data) / elapsed / 1e6
+    results['parse_stream_seconds'] = best_of(lambda: parser.parse_stream(BytesIO(data)), repeat)
+
+    def build_and_resolve():
+        gedcom = GEDCOM()
+        parser._build(gedcom, lines)
+        start = time.perf_counter()
+        gedcom.resolve()
+        return time.perf_counter() - start
+    results['resolve_seconds'] = min(build_and_resolve() for _ in range(repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    gedcom = parser.parse_string(doc)
+    results['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    results['as_text_seconds'] = best_of(lambda: '\n'.join(record.as_text() for record in gedcom), repeat)
+    queries = {
+        'find_birth_dates': lambda: gedcom.find('INDI.BIRT.DATE'),
+        'xref_lookup': lambda: [gedcom._xref[f'@I{index}@'] for index in range(1, individuals + 1)],
+        'birth_years': lambda: [indi.birth_year for indi in gedcom.indi],
+        'surname_scan': lambda: [indi for indi in gedcom.indi if indi.family_name == 'Smith'],
+    }
+    results['queries_seconds'] = {name: best_of(query, repeat) for name, query in queries.items()}
+    return results
+
+
+def compare(baseline: Dict[str, object], results: Dict[str, object], prefix: str = '') -> Dict[str, float]:
+    ratios = dict()
+    for key, value in results.items():
+        old = baseline.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            ratios.update(compare(old, value, f'{prefix}{key}.'))
+        elif key.endswith('_seconds') or key.endswith('_bytes'):
+            if isinstance(old, (int, float)) and old > 0:
+                ratios[f'{prefix}{key}'] = value / old
+        elif prefix and isinstance(old, (int, float)) and old > 0:
+            ratios[f'{prefix}{key}'] = value / old
+    return ratios
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description='GEDCOM parser benchmarks on synthetic data')
+    args.add_argument('--individuals', type=int, default=10000)
+    args.add_argument('--seed', type=int, default=0)
+    args.add_argument('--repeat', type=int, default=3)
+    args.add_argument('--output', help='write results as JSON to this file')
+    args.add_argument('--compare', help='JSON results of an earlier run to report ratios against')
+    options = args.parse_args(argv)
+    results = run(options.individuals, options.seed, options.repeat)
+    if options.compare:
+        with open(options.compare) as fp:
+            results['ratios'] = compare(json.load(fp), results)
+    text = json.dumps(results, indent=2)
+    if options.output:
+        with open(options.output, 'w') as fp:
+            fp.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
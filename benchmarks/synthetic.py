@@ -0,0 +1,206 @@
+import random
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional
+
+SURNAMES = [
+    ('Smith', 40), ('Jones', 30), ('Brown', 25), ('Taylor', 20), ('Williams', 20), ('Wilson', 15),
+    ('Johnson', 15), ('Davies', 12), ('Robinson', 10), ('Wright', 10), ('Thompson', 9), ('Evans', 9),
+    ('Walker', 8), ('White', 8), ('Roberts', 7), ('Green', 7), ('Hall', 6), ('Wood', 6), ('Jackson', 5),
+    ('Clarke', 5), ('Schmidt', 4), ('Müller', 4), ('Kowalski', 3), ('Dubois', 3), ('García', 3),
+    ("O'Brien", 2), ('MacDonald', 2), ('van der Berg', 1), ('Nguyen', 1), ('Łukasik', 1),
+]
+MALE = ['John', 'William', 'James', 'George', 'Thomas', 'Charles', 'Henry', 'Robert', 'Joseph', 'Edward']
+FEMALE = ['Mary', 'Elizabeth', 'Sarah', 'Ann', 'Margaret', 'Jane', 'Emma', 'Alice', 'Catherine', 'Ellen']
+PLACES = [
+    ('Leeds', 'Yorkshire', 'England', 'United Kingdom', 'N53.8', 'W1.55'),
+    ('York', 'Yorkshire', 'England', 'United Kingdom', 'N53.96', 'W1.08'),
+    ('Bath', 'Somerset', 'England', 'United Kingdom', 'N51.38', 'W2.36'),
+    ('Cork', 'County Cork', 'Munster', 'Ireland', 'N51.9', 'W8.47'),
+    ('Boston', 'Suffolk', 'Massachusetts', 'USA', 'N42.36', 'W71.06'),
+    ('Salem', 'Essex', 'Massachusetts', 'USA', 'N42.52', 'W70.9'),
+    ('Albany', 'Albany', 'New York', 'USA', 'N42.65', 'W73.76'),
+    ('Hobart', 'Hobart', 'Tasmania', 'Australia', 'S42.88', 'E147.33'),
+]
+MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+WORDS = [
+    'born', 'farm', 'parish', 'register', 'letter', 'family', 'moved', 'town', 'church', 'records',
+    'census', 'emigrated', 'married', 'witness', 'estate', 'will', 'children', 'according', 'to', 'the',
+]
+
+
+class Person:
+    def __init__(self, sex: str, birth: int):
+        self.sex = sex
+        self.birth = birth
+        self.death: Optional[int] = None
+        self.famc: Optional[int] = None
+        self.fams: List[int] = []
+
+
+class Family:
+    def __init__(self, husb: Optional[int], wife: Optional[int], marriage: int):
+        self.husb = husb
+        self.wife = wife
+        self.marriage = marriage
+        self.chil: List[int] = []
+
+
+class Generator:
+    def __init__(self, individuals: int = 1000, seed: int = 0):
+        self.individuals = individuals
+        self.families = max(1, individuals // 3)
+        self.sources = max(1, individuals // 20)
+        self.notes = max(1, individuals // 10)
+        self.random = random.Random(seed)
+        self._surnames = [name for name, _ in SURNAMES]
+        self._weights = [weight for _, weight in SURNAMES]
+
+    def plan(self):
+        """Lay out people and families so parents are born, and married, before their children"""
+        births = sorted(self.random.randint(1700, 1950) for _ in range(self.individuals))
+        self.people = [Person(self.random.choice('MF'), birth) for birth in births]
+        men = [index for index, person in enumerate(self.people) if person.sex == 'M']
+        women = [index for index, person in enumerate(self.people) if person.sex == 'F']
+        husbands = sorted(self.random.sample(men, min(len(men), self.families)))
+        wives = sorted(self.random.sample(women, min(len(women), self.families)))
+        families = []
+        for index in range(self.families):
+            husb = husbands[index] if index < len(husbands) else None
+            wife = wives[index] if index < len(wives) else None
+            births = [self.people[spouse].birth for spouse in (husb, wife) if spouse is not None]
+            families.append(Family(husb, wife, max(births, default=1700) + self.random.randint(18, 30)))
+        families.sort(key=lambda family: family.marriage)
+        self.family_plan = families
+        for number, family in enumerate(families):
+            for spouse in (family.husb, family.wife):
+                if spouse is not None:
+                    self.people[spouse].fams.append(number)
+        marriages = [family.marriage for family in families]
+        for index, person in enumerate(self.people):
+            if self.random.random() < 0.9:
+                low = bisect_left(marriages, person.birth - 20)
+                high = bisect_right(marriages, person.birth)
+                if low < high:
+                    person.famc = self.random.randrange(low, high)
+                    families[person.famc].chil.append(index)
+        for person in self.people:
+            if person.birth < 1920 or self.random.random() < 0.3:
+                death = person.birth + self.random.randint(0, 95)
+                for number in person.fams:
+                    family = families[number]
+                    death = max([death, family.marriage] + [self.people[child].birth for child in family.chil])
+                person.death = death
+
+    def lines(self) -> Iterator[str]:
+        self.plan()
+        yield from self.header()
+        for index in range(1, self.individuals + 1):
+            yield from self.individual(index)
+        for index in range(1, self.families + 1):
+            yield from self.family(index)
+        for index in range(1, self.sources + 1):
+            yield from self.source(index)
+        for index in range(1, self.notes + 1):
+            yield from self.note(index)
+        yield '0 TRLR'
+
+    def text(self) -> str:
+        return '\n'.join(self.lines())
+
+    def header(self) -> List[str]:
+        return [
+            '0 HEAD',
+            '1 GEDC',
+            '2 VERS 5.5.1',
+            '2 FORM LINEAGE-LINKED',
+            '1 CHAR UTF-8',
+            '1 SOUR SYNTHETIC',
+            '1 PLAC',
+            '2 FORM City, County, State, Country',
+            '1 SUBM @U1@',
+            '0 @U1@ SUBM',
+            '1 NAME Benchmark',
+        ]
+
+    def date(self, year: int) -> str:
+        choice = self.random.random()
+        month = self.random.choice(MONTHS)
+        day = self.random.randint(1, 28)
+        if choice < 0.55:
+            return f'{day} {month} {year}'
+        if choice < 0.7:
+            return f'{month} {year}'
+        if choice < 0.8:
+            return f'{year}'
+        if choice < 0.9:
+            return f'{self.random.choice(["ABT", "BEF", "AFT", "EST", "CAL"])} {year}'
+        return f'BET {year - 2} AND {year + 2}'
+
+    def place(self, level: int) -> List[str]:
+        city, county, state, country, lati, long = self.random.choice(PLACES)
+        lines = [f'{level} PLAC {city}, {county}, {state}, {country}']
+        if self.random.random() < 0.3:
+            lines.extend([f'{level + 1} MAP', f'{level + 2} LATI {lati}', f'{level + 2} LONG {long}'])
+        return lines
+
+    def event(self, tag: str, year: int) -> List[str]:
+        lines = [f'1 {tag}', f'2 DATE {self.date(year)}']
+        if self.random.random() < 0.8:
+            lines.extend(self.place(2))
+        if self.random.random() < 0.3:
+            lines.extend([f'2 SOUR @S{self.random.randint(1, self.sources)}@', '3 PAGE p. 12', '3 QUAY 2'])
+        return lines
+
+    def individual(self, index: int) -> List[str]:
+        person = self.people[index - 1]
+        sex = person.sex
+        given = self.random.choice(MALE if sex == 'M' else FEMALE)
+        surname = self.random.choices(self._surnames, self._weights)[0]
+        lines = [
+            f'0 @I{index}@ INDI',
+            f'1 NAME {given} /{surname}/',
+            f'2 GIVN {given}',
+            f'2 SURN {surname}',
+            f'1 SEX {sex}',
+            *self.event('BIRT', person.birth),
+        ]
+        if person.death is not None:
+            lines.extend(self.event('DEAT', person.death))
+        if self.random.random() < 0.3:
+            lines.append(f'1 OCCU {self.random.choice(["Farmer", "Labourer", "Miner", "Clerk", "Weaver"])}')
+        if person.famc is not None:
+            lines.append(f'1 FAMC @F{person.famc + 1}@')
+        for number in person.fams:
+            lines.append(f'1 FAMS @F{number + 1}@')
+        if self.random.random() < 0.2:
+            lines.append(f'1 NOTE @N{self.random.randint(1, self.notes)}@')
+        lines.extend(['1 CHAN', f'2 DATE {self.random.randint(1, 28)} {self.random.choice(MONTHS)} 2020'])
+        return lines
+
+    def family(self, index: int) -> List[str]:
+        family = self.family_plan[index - 1]
+        lines = [f'0 @F{index}@ FAM']
+        if family.husb is not None:
+            lines.append(f'1 HUSB @I{family.husb + 1}@')
+        if family.wife is not None:
+            lines.append(f'1 WIFE @I{family.wife + 1}@')
+        lines.extend(f'1 CHIL @I{child + 1}@' for child in family.chil)
+        lines.extend(self.event('MARR', family.marriage))
+        return lines
+
+    def source(self, index: int) -> List[str]:
+        return [
+            f'0 @S{index}@ SOUR',
+            f'1 TITL Parish register {index}',
+            f'1 AUTH {self.random.choice(self._surnames)}',
+            f'1 PUBL Archive {index}',
+        ]
+
+    def note(self, index: int) -> List[str]:
+        lines = [f'0 @N{index}@ NOTE {self.sentence()}']
+        for _ in range(self.random.randint(0, 4)):
+            lines.append(f'1 {self.random.choice(["CONT", "CONC"])} {self.sentence()}')
+        return lines
+
+    def sentence(self) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(self.random.randint(4, 12)))
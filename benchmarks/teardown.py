@@ -0,0 +1,72 @@
+import argparse
+import gc
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.synthetic import Generator
+from gedcom5.parser import GEDCOM5Parser
+
+
+class GCTimer:
+    """Counts collections and sums the time spent in them through ``gc.callbacks``."""
+
+    def __init__(self):
+        self.collections = 0
+        self.seconds = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]):
+        if phase == 'start':
+            self._start = time.perf_counter()
+        else:
+            self.collections += 1
+            self.seconds += time.perf_counter() - self._start
+
+    def __enter__(self) -> 'GCTimer':
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *args):
+        gc.callbacks.remove(self)
+
+
+def measure(doc: str, parser: GEDCOM5Parser) -> Dict[str, float]:
+    gc.collect()
+    with GCTimer() as timer:
+        start = time.perf_counter()
+        gedcom = parser.parse_string(doc)
+        parse = time.perf_counter() - start
+    collections, gc_seconds = timer.collections, timer.seconds
+    start = time.perf_counter()
+    del gedcom
+    gc.collect()
+    teardown = time.perf_counter() - start
+    return {
+        'parse_seconds': parse, 'parse_gc_collections': collections, 'parse_gc_seconds': gc_seconds,
+        'teardown_seconds': teardown,
+    }
+
+
+def main(argv: List[str] = None):
+    args = argparse.ArgumentParser(description='Parse and teardown cost with weak parents and deferred GC')
+    args.add_argument('--individuals', type=int, default=10000)
+    args.add_argument('--seed', type=int, default=0)
+    options = args.parse_args(argv)
+    doc = Generator(individuals=options.individuals, seed=options.seed).text()
+    configs = (
+        ('strong, gc on', GEDCOM5Parser()),
+        ('strong, gc deferred', GEDCOM5Parser(defer_gc=True)),
+        ('weak, gc deferred', GEDCOM5Parser(weak_parents=True, defer_gc=True)),
+    )
+    for name, parser in configs:
+        result = measure(doc, parser)
+        print(
+            f'{name:>20}: parse {result["parse_seconds"]:.3f}s '
+            f'({result["parse_gc_collections"]} collections, {result["parse_gc_seconds"]:.3f}s), '
+            f'teardown {result["teardown_seconds"]:.3f}s'
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import sys
+import time
+from os.path import dirname, join
+
+from gedcom5.tokenizer import LINE
+
+
+def split_tokens(line: str):
+    if line.startswith('\ufeff'):
+        line = line[1:]
+    tokens = line.lstrip().split(' ')
+    if not tokens[0].isdigit():
+        return None
+    level = int(tokens[0])
+    tokens = tokens[1:]
+    xref_id = tokens[0] if tokens[0].startswith('@') and tokens[0].endswith('@') else None
+    if xref_id:
+        tokens = tokens[1:]
+    tag = tokens[0]
+    tokens = tokens[1:]
+    value = ' '.join(tokens) if tokens else None
+    return level, xref_id, tag, value
+
+
+def regex_tokens(line: str, line_match=LINE.fullmatch):
+    match = line_match(line)
+    if match is None:
+        return None
+    level, xref_id, tag, value = match.groups()
+    return int(level), xref_id, tag, value
+
+
+def measure(tokenize, lines, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            tokenize(line)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(lines) / best
+
+
+def main(path: str, copies: int = 2000, repeat: int = 5):
+    with open(path, 'rb') as fp:
+        lines = fp.read().decode('utf-8').splitlines() * copies
+    for name, tokenize in (('split', split_tokens), ('regex', regex_tokens)):
+        print(f'{name:>6}: {measure(tokenize, lines, repeat):,.0f} lines/s')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else join(dirname(__file__), '..', 'tests', '555SAMPLE.GED'))
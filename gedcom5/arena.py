@@ -0,0 +1,388 @@
+import weakref
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Type
+
+from gedcom5.charset import iter_lines
+from gedcom5.parser import GEDCOM5Parser, ParseError
+from gedcom5.tag import Tag
+from gedcom5.tokenizer import LINE, invalid_line
+
+NONE = -1
+RECORD_TAGS = ('HEAD', 'FAM', 'INDI', 'OBJE', 'NOTE', 'REPO', 'SOUR', 'SUBN', 'SUBM')
+
+
+class Arena:
+    """A parsed file held as parallel arrays, one slot per line, in file order.
+
+    ``parent``, ``first_child`` and ``next_sibling`` are line indices (``NONE`` for none) and ``xref`` and
+    ``value`` index ``strings``; every distinct string is stored once.
+    """
+
+    def __init__(self):
+        self.level = array('H')
+        self.tag = array('H')
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.xref = array('i')
+        self.value = array('i')
+        self.strings: List[str] = []
+        self.tags: List[str] = []
+        self.records = array('i')
+        self.xrefs: Dict[str, int] = dict()
+        self._string_ids: Dict[str, int] = dict()
+        self._tag_ids: Dict[str, int] = dict()
+
+    def __len__(self):
+        return len(self.level)
+
+    def _string(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        n = self._string_ids.get(value)
+        if n is None:
+            n = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return n
+
+    def _tag(self, tag: str) -> int:
+        n = self._tag_ids.get(tag)
+        if n is None:
+            n = self._tag_ids[tag] = len(self.tags)
+            self.tags.append(tag)
+        return n
+
+    def load(self, lines: Iterable[str]):
+        line_match = LINE.fullmatch
+        levels, parents, first_child, next_sibling = self.level, self.parent, self.first_child, self.next_sibling
+        stack: List[int] = []
+        last_child: Dict[int, int] = dict()
+        last_record = NONE
+        line_num = 0
+        for line in lines:
+            line_num += 1
+            match = line_match(line)
+            if match is None:
+                msg = f'Error at line {line_num}.\n{line}\n{invalid_line(line)}'
+                raise ParseError(msg, line_num=line_num, line=line)
+            level, xref_id, tag, value = match.groups()
+            level = int(level)
+            index = len(levels)
+            while stack and levels[stack[-1]] >= level:
+                last_child.pop(stack.pop(), None)
+            parent = stack[-1] if stack else NONE
+            levels.append(level)
+            self.tag.append(self._tag(tag))
+            parents.append(parent)
+            first_child.append(NONE)
+            next_sibling.append(NONE)
+            self.xref.append(self._string(xref_id))
+            self.value.append(self._string(value))
+            if parent == NONE:
+                if last_record != NONE:
+                    next_sibling[last_record] = index
+                last_record = index
+                self.records.append(index)
+                if xref_id is not None:
+                    self.xrefs[xref_id] = index
+            elif parent in last_child:
+                next_sibling[last_child[parent]] = index
+            else:
+                first_child[parent] = index
+            if parent != NONE:
+                last_child[parent] = index
+            stack.append(index)
+        self._string_ids = dict()
+
+    def children(self, index: int) -> Iterator[int]:
+        child = self.first_child[index]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    def end(self, index: int) -> int:
+        """One past the last line of the subtree rooted at ``index``."""
+        level = self.level[index]
+        levels = self.level
+        end = index + 1
+        while end < len(levels) and levels[end] > level:
+            end += 1
+        return end
+
+    def text(self, index: int) -> str:
+        out = f'{self.level[index]}'
+        if self.xref[index] != NONE:
+            out = out + f' {self.strings[self.xref[index]]}'
+        out = out + f' {self.tags[self.tag[index]]}'
+        if self.value[index] != NONE:
+            out = out + f' {self.strings[self.value[index]]}'
+        return out
+
+
+class Node:
+    """A read-only view of one line of an :class:`Arena`."""
+
+    __slots__ = ('_gedcom', '_index')
+
+    def __init__(self, gedcom: 'ArenaGEDCOM', index: int):
+        self._gedcom = gedcom
+        self._index = index
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and other._gedcom is self._gedcom and other._index == self._index
+
+    def __hash__(self):
+        return hash((id(self._gedcom), self._index))
+
+    def __str__(self):
+        return self._gedcom.arena.text(self._index)
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def level(self) -> int:
+        return self._gedcom.arena.level[self._index]
+
+    @property
+    def tag(self) -> str:
+        arena = self._gedcom.arena
+        return arena.tags[arena.tag[self._index]]
+
+    @property
+    def xref_id(self) -> Optional[str]:
+        arena = self._gedcom.arena
+        xref = arena.xref[self._index]
+        return arena.strings[xref] if xref != NONE else None
+
+    @property
+    def value(self) -> Optional[str]:
+        arena = self._gedcom.arena
+        value = arena.value[self._index]
+        return arena.strings[value] if value != NONE else None
+
+    @property
+    def parent(self):
+        parent = self._gedcom.arena.parent[self._index]
+        return self._gedcom.node(parent) if parent != NONE else self._gedcom
+
+    def nodes(self) -> List['Node']:
+        return [self._gedcom.node(child) for child in self._gedcom.arena.children(self._index)]
+
+    def as_text(self) -> str:
+        arena = self._gedcom.arena
+        return '\n'.join(arena.text(n) for n in range(self._index, arena.end(self._index)))
+
+    def find(self, tags: str) -> List['Node']:
+        return self._gedcom.find_from([self._index], tags)
+
+    def find_first(self, tags: str, default=None) -> Optional['Node']:
+        nodes = self.find(tags)
+        if len(nodes) > 0:
+            return nodes[0]
+        return default
+
+
+class Record(Node):
+    """A view of a level 0 record.
+
+    Typed accessors (``birth_year``, ``famc``, ``husb`` ...) build the record's ``Tag`` tree on first use, and
+    ``isinstance(record, INDI)`` holds without building it. Pointers in a built record refer to other views.
+    """
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, gedcom: 'ArenaGEDCOM', index: int):
+        Node.__init__(self, gedcom, index)
+        self._tag: Optional[Tag] = None
+
+    @property
+    def __class__(self):
+        return self._gedcom.tag_class(self._index)
+
+    def materialize(self) -> Tag:
+        if self._tag is None:
+            self._tag = self._gedcom.materialize(self._index)
+        return self._tag
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __getitem__(self, item: int) -> Tag:
+        return self.materialize()[item]
+
+
+class ArenaGEDCOM:
+    """A read-only GEDCOM over an :class:`Arena`, exposing records as lazy :class:`Record` views."""
+
+    def __init__(self, arena: Arena, parser: Optional[GEDCOM5Parser] = None):
+        self.arena = arena
+        self.level = -1
+        self._tags = (parser or GEDCOM5Parser())._tags
+        self._records: Optional[List[Record]] = None
+        self._by_tag: Dict[str, List[Record]] = dict()
+        self._built: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> 'ArenaGEDCOM':
+        arena = Arena()
+        arena.load(lines)
+        return cls(arena)
+
+    @classmethod
+    def from_string(cls, doc: str) -> 'ArenaGEDCOM':
+        return cls.from_lines(doc.splitlines())
+
+    @classmethod
+    def from_stream(cls, fp: BinaryIO, encoding: Optional[str] = None) -> 'ArenaGEDCOM':
+        return cls.from_lines(iter_lines(fp, encoding=encoding))
+
+    @classmethod
+    def from_path(cls, path: str, encoding: Optional[str] = None) -> 'ArenaGEDCOM':
+        with open(path, 'rb') as fp:
+            return cls.from_stream(fp, encoding=encoding)
+
+    def _index(self):
+        self._records = [Record(self, index) for index in self.arena.records]
+        for record in self._records:
+            self._by_tag.setdefault(record.tag, []).append(record)
+
+    @property
+    def records(self) -> List[Record]:
+        if self._records is None:
+            self._index()
+        return self._records
+
+    def __len__(self):
+        return len(self.arena.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, item: int) -> Record:
+        return self.records[item]
+
+    def _of(self, tag: str) -> List[Record]:
+        if self._records is None:
+            self._index()
+        return self._by_tag.setdefault(tag, [])
+
+    @property
+    def head(self) -> List[Record]:
+        return self._of('HEAD')
+
+    @property
+    def indi(self) -> List[Record]:
+        return self._of('INDI')
+
+    @property
+    def fam(self) -> List[Record]:
+        return self._of('FAM')
+
+    @property
+    def obje(self) -> List[Record]:
+        return self._of('OBJE')
+
+    @property
+    def note(self) -> List[Record]:
+        return self._of('NOTE')
+
+    @property
+    def repo(self) -> List[Record]:
+        return self._of('REPO')
+
+    @property
+    def sour(self) -> List[Record]:
+        return self._of('SOUR')
+
+    @property
+    def subn(self) -> List[Record]:
+        return self._of('SUBN')
+
+    @property
+    def subm(self) -> List[Record]:
+        return self._of('SUBM')
+
+    def xref(self, xref_id: str) -> Optional[Record]:
+        index = self.arena.xrefs.get(xref_id)
+        return self.node(index) if index is not None else None
+
+    def node(self, index: int) -> Node:
+        if self.arena.parent[index] == NONE:
+            return self.records[self._record_number(index)]
+        return Node(self, index)
+
+    def _record_number(self, index: int) -> int:
+        records = self.arena.records
+        low, high = 0, len(records)
+        while low < high:
+            mid = (low + high) // 2
+            if records[mid] < index:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def tag_class(self, index: int) -> Type[Tag]:
+        return self._tags.get(self.arena.tags[self.arena.tag[index]], Tag)
+
+    def find_from(self, indices: List[int], tags: str) -> List[Node]:
+        arena = self.arena
+        for tag in tags.split('.'):
+            indices = [child for index in indices for child in arena.children(index)
+                       if arena.tags[arena.tag[child]] == tag]
+        return [self.node(index) for index in indices]
+
+    def find(self, tags: str) -> List[Node]:
+        first, _, rest = tags.partition('.')
+        indices = [index for index in self.arena.records if self.arena.tags[self.arena.tag[index]] == first]
+        if not rest:
+            return [self.node(index) for index in indices]
+        return self.find_from(indices, rest)
+
+    def find_first(self, tags: str, default=None) -> Optional[Node]:
+        nodes = self.find(tags)
+        if len(nodes) > 0:
+            return nodes[0]
+        return default
+
+    def materialize(self, index: int) -> Tag:
+        """Build the typed ``Tag`` tree of the record at line ``index``; pointers resolve to record views."""
+        built = self._built.get(index)
+        if built is not None:
+            return built
+        arena = self.arena
+        tags = self._tags
+        strings = arena.strings
+        stack: List[Tag] = []
+        root = None
+        for n in range(index, arena.end(index)):
+            level = arena.level[n]
+            tag = arena.tags[arena.tag[n]]
+            xref_id = strings[arena.xref[n]] if arena.xref[n] != NONE else None
+            value = strings[arena.value[n]] if arena.value[n] != NONE else None
+            while stack and stack[-1].level >= level:
+                stack.pop()
+            parent = stack[-1] if stack else None
+            if tag in tags:
+                entry = tags[tag](level=level, parent=parent, xref_id=xref_id, value=value)
+            else:
+                entry = Tag(level=level, parent=parent, xref_id=xref_id, tag=tag, value=value)
+            if parent is None:
+                root = entry
+            else:
+                parent.append(entry)
+                if entry.ref is not None and entry.ref in arena.xrefs:
+                    entry.ref = self.node(arena.xrefs[entry.ref])
+            stack.append(entry)
+        root.parent = self
+        self._built[index] = root
+        return root
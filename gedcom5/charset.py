@@ -0,0 +1,244 @@
+import codecs
+import re
+import unicodedata
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from gedcom5.limits import LimitGuard
+
+CHUNK_SIZE = 1 << 16
+PEEK_SIZE = 1 << 14
+
+_SPACING = {
+    0xA1: 'Ł', 0xA2: 'Ø', 0xA3: 'Đ', 0xA4: 'Þ', 0xA5: 'Æ', 0xA6: 'Œ', 0xA7: 'ʹ',
+    0xA8: '·', 0xA9: '♭', 0xAA: '®', 0xAB: '±', 0xAC: 'Ơ', 0xAD: 'Ư', 0xAE: 'ʼ',
+    0xB0: 'ʻ', 0xB1: 'ł', 0xB2: 'ø', 0xB3: 'đ', 0xB4: 'þ', 0xB5: 'æ', 0xB6: 'œ',
+    0xB7: 'ʺ', 0xB8: 'ı', 0xB9: '£', 0xBA: 'ð', 0xBC: 'ơ', 0xBD: 'ư', 0xBE: '□',
+    0xBF: '■', 0xC0: '°', 0xC1: 'ℓ', 0xC2: '℗', 0xC3: '©', 0xC4: '♯', 0xC5: '¿',
+    0xC6: '¡', 0xC7: 'ß', 0xC8: '€', 0xCD: 'e', 0xCE: 'o', 0xCF: 'ß',
+}
+
+_COMBINING = {
+    0xE0: '\u0309', 0xE1: '\u0300', 0xE2: '\u0301', 0xE3: '\u0302', 0xE4: '\u0303', 0xE5: '\u0304',
+    0xE6: '\u0306', 0xE7: '\u0307', 0xE8: '\u0308', 0xE9: '\u030c', 0xEA: '\u030a', 0xEB: '\ufe20',
+    0xEC: '\ufe21', 0xED: '\u0315', 0xEE: '\u030b', 0xEF: '\u0310', 0xF0: '\u0327', 0xF1: '\u0328',
+    0xF2: '\u0323', 0xF3: '\u0324', 0xF4: '\u0325', 0xF5: '\u0333', 0xF6: '\u0332', 0xF7: '\u0326',
+    0xF8: '\u031c', 0xF9: '\u032e', 0xFA: '\ufe22', 0xFB: '\ufe23', 0xFE: '\u0313',
+}
+
+_DECODE_TABLE = {byte: '\ufffd' for byte in range(0x80, 0x100)}
+_DECODE_TABLE.update(_SPACING)
+_DECODE_TABLE.update(_COMBINING)
+_DECODE_IGNORE = {byte: (None if char == '\ufffd' else char) for byte, char in _DECODE_TABLE.items()}
+_UNDEFINED = re.compile(b'[' + re.escape(bytes(byte for byte, char in _DECODE_TABLE.items() if char == '\ufffd')) + b']')
+_COMBINING_BYTES = bytes(_COMBINING)
+_MARKS = '[' + ''.join(_COMBINING.values()) + ']+'
+_MARKS_BEFORE_BASE = re.compile(f'({_MARKS})([^\r\n])')
+_BASE_BEFORE_MARKS = re.compile(f'(.)({_MARKS})', re.DOTALL)
+
+_ENCODE_TABLE = {ord(char): chr(byte) for byte, char in _SPACING.items() if byte not in (0xCD, 0xCE, 0xC7)}
+_ENCODE_TABLE.update({ord(char): chr(byte) for byte, char in _COMBINING.items()})
+_UNENCODABLE = re.compile('[^\x00-\x7f' + re.escape(''.join(map(chr, _ENCODE_TABLE))) + ']')
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+_CHAR = re.compile(rb'[\r\n][ \t]*1[ \t]+CHAR[ \t]+([^\r\n]*)')
+
+CHARSETS = {
+    'ANSEL': 'ansel',
+    'ASCII': 'ascii',
+    'ANSI': 'cp1252',
+    'IBMPC': 'cp437',
+    'IBM WINDOWS': 'cp1252',
+    'LATIN1': 'latin-1',
+    'ISO-8859-1': 'latin-1',
+    'ISO8859-1': 'latin-1',
+    'MACINTOSH': 'mac-roman',
+    'UTF-8': 'utf-8',
+    'UTF8': 'utf-8',
+    'UNICODE': 'utf-8',
+}
+
+
+def ansel_decode(data: bytes, errors: str = 'strict') -> str:
+    if data.isascii():
+        return data.decode('ascii')
+    if errors == 'strict':
+        match = _UNDEFINED.search(data)
+        if match is not None:
+            raise UnicodeDecodeError('ansel', data, match.start(), match.end(), 'character maps to <undefined>')
+    text = data.decode('latin-1').translate(_DECODE_IGNORE if errors == 'ignore' else _DECODE_TABLE)
+    text = _MARKS_BEFORE_BASE.sub(r'\2\1', text)
+    return unicodedata.normalize('NFC', text)
+
+
+def ansel_encode(text: str, errors: str = 'strict') -> bytes:
+    text = unicodedata.normalize('NFD', text)
+    if errors == 'strict':
+        match = _UNENCODABLE.search(text)
+        if match is not None:
+            raise UnicodeEncodeError('ansel', text, match.start(), match.end(), 'character maps to <undefined>')
+    else:
+        text = _UNENCODABLE.sub('' if errors == 'ignore' else '?', text)
+    text = _BASE_BEFORE_MARKS.sub(r'\2\1', text)
+    return text.translate(_ENCODE_TABLE).encode('latin-1')
+
+
+class AnselIncrementalDecoder(codecs.IncrementalDecoder):
+    def __init__(self, errors='strict'):
+        codecs.IncrementalDecoder.__init__(self, errors)
+        self._pending = b''
+
+    def decode(self, data: bytes, final=False) -> str:
+        data = self._pending + data
+        if final:
+            self._pending = b''
+        else:
+            keep = len(data.rstrip(_COMBINING_BYTES))
+            self._pending = data[keep:]
+            data = data[:keep]
+        return ansel_decode(data, self.errors)
+
+    def reset(self):
+        self._pending = b''
+
+    def getstate(self):
+        return self._pending, 0
+
+    def setstate(self, state):
+        self._pending = state[0]
+
+
+class AnselIncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(self, text: str, final=False) -> bytes:
+        return ansel_encode(text, self.errors)
+
+
+def _search(name: str) -> Optional[codecs.CodecInfo]:
+    if name != 'ansel':
+        return None
+    return codecs.CodecInfo(
+        name='ansel',
+        encode=lambda text, errors='strict': (ansel_encode(text, errors), len(text)),
+        decode=lambda data, errors='strict': (ansel_decode(bytes(data), errors), len(data)),
+        incrementalencoder=AnselIncrementalEncoder,
+        incrementaldecoder=AnselIncrementalDecoder,
+    )
+
+
+codecs.register(_search)
+
+
+def detect_encoding(head: bytes) -> Tuple[str, int]:
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    if head.startswith(b'0\x00'):
+        return 'utf-16-le', 0
+    if head.startswith(b'\x000'):
+        return 'utf-16-be', 0
+    match = _CHAR.search(head)
+    if match is not None:
+        charset = match.group(1).decode('ascii', 'replace').strip().upper()
+        return CHARSETS.get(charset, 'utf-8'), 0
+    return 'utf-8', 0
+
+
+class UndecodableLine(RuntimeError):
+    def __init__(self, line_num: int, line: str, msg: str):
+        RuntimeError.__init__(self, msg)
+        self.line_num = line_num
+        self.line = line
+
+
+class LineDecoder:
+    def __init__(self, encoding: Optional[str] = None, guard: Optional[LimitGuard] = None, errors: str = 'strict'):
+        self.encoding = encoding
+        self.guard = guard
+        self.errors = errors
+        self.line_num = 0
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self._head = b''
+        self._pending: List[str] = []
+        self._pending_size = 0
+
+    def _start(self, head: bytes) -> bytes:
+        bom = 0
+        if self.encoding is None:
+            self.encoding, bom = detect_encoding(head)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        return head[bom:]
+
+    def _decode(self, chunk: bytes, final=False) -> str:
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as ex:
+            data = bytes(ex.object)
+            text = ''.join(self._pending) + data[:ex.start].decode(self.encoding, 'replace')
+            lines = (text + '\x00').splitlines()
+            msg = f'Cannot decode {data[ex.start:ex.end]!r} as {self.encoding}: {ex.reason}'
+            raise UndecodableLine(self.line_num + len(lines), lines[-1][:-1], msg) from ex
+
+    def _hold(self, text: str):
+        self._pending.append(text)
+        self._pending_size += len(text)
+
+    def _take(self) -> str:
+        text = ''.join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        return text
+
+    def feed(self, chunk: bytes) -> List[str]:
+        if self._decoder is None:
+            self._head += chunk
+            if self.encoding is None and len(self._head) < PEEK_SIZE:
+                if self.guard is not None:
+                    self.guard.check_read(len(self._head))
+                return []
+            chunk = self._start(self._head)
+            self._head = b''
+        text = self._decode(chunk)
+        if self._pending and self._pending[-1].endswith('\r'):
+            held = self._pending.pop()
+            self._pending_size -= len(held)
+            text = held + text
+        last = len(text) - 1
+        cut = max(text.rfind('\n', 0, last), text.rfind('\r', 0, last))
+        if cut < 0:
+            self._hold(text)
+            if self.guard is not None:
+                self.guard.check_read(self._pending_size)
+            return []
+        if text[cut] == '\r' and text[cut + 1] == '\n':
+            cut += 1
+        lines = (self._take() + text[:cut + 1]).splitlines()
+        self._hold(text[cut + 1:])
+        if self.guard is not None:
+            self.guard.check_read(self._pending_size)
+        self.line_num += len(lines)
+        return lines
+
+    def finish(self) -> List[str]:
+        chunk = b''
+        if self._decoder is None:
+            chunk = self._start(self._head)
+            self._head = b''
+        lines = (self._take() + self._decode(chunk, final=True)).splitlines()
+        self.line_num += len(lines)
+        return lines
+
+
+def iter_lines(
+    fp: BinaryIO, encoding: Optional[str] = None, chunk_size: int = CHUNK_SIZE, guard: Optional[LimitGuard] = None,
+    errors: str = 'strict'
+) -> Iterator[str]:
+    decoder = LineDecoder(encoding, guard=guard, errors=errors)
+    chunk = fp.read(max(chunk_size, PEEK_SIZE))
+    while chunk:
+        yield from decoder.feed(chunk)
+        chunk = fp.read(chunk_size)
+    yield from decoder.finish()
@@ -0,0 +1,42 @@
+from typing import Dict, Optional
+
+BLANK_LINE = 'blank-line'
+STRAY_CR = 'stray-cr'
+MISSING_LEVEL = 'missing-level'
+MISSING_TAG = 'missing-tag'
+LEVEL_JUMP = 'level-jump'
+UNKNOWN_TAG = 'unknown-tag'
+UNEXPECTED_TAG = 'unexpected-tag'
+DANGLING_POINTER = 'dangling-pointer'
+UNDECODABLE = 'undecodable'
+
+
+class Diagnostic:
+    """A problem found and recovered from while parsing in recover mode.
+
+    ``xref`` is the xref id of the level 0 record the line belongs to, if it has one.
+    """
+
+    def __init__(
+        self, line_num: int, code: str, message: str, xref: Optional[str] = None, line: Optional[str] = None
+    ):
+        self.line_num = line_num
+        self.code = code
+        self.message = message
+        self.xref = xref
+        self.line = line
+
+    def __str__(self):
+        out = f'line {self.line_num}: {self.code}: {self.message}'
+        if self.xref is not None:
+            out = out + f' ({self.xref})'
+        return out
+
+    def __repr__(self):
+        return f'Diagnostic({self.as_dict()!r})'
+
+    def as_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            'line_num': self.line_num, 'code': self.code, 'message': self.message, 'xref': self.xref,
+            'line': self.line
+        }
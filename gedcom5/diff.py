@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Union
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.incremental import record_digest, record_key
+from gedcom5.tag import Tag
+
+
+class Change:
+    """A single difference between two GEDCOM trees.
+
+    ``xref`` identifies the level 0 record (its xref id, or ``TAG#n`` for records without one) and
+    ``path`` the tag within it as ``TAG[n].TAG[n]`` where ``n`` counts siblings with the same tag.
+    """
+
+    def __init__(
+        self, op: str, xref: str, path: str = '', old: Optional[str] = None, new: Optional[str] = None,
+        text: Optional[List[str]] = None
+    ):
+        self.op = op
+        self.xref = xref
+        self.path = path
+        self.old = old
+        self.new = new
+        self.text = text
+
+    def __eq__(self, other):
+        return isinstance(other, Change) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f'Change({self.as_dict()!r})'
+
+    def as_dict(self) -> Dict[str, Union[str, List[str]]]:
+        out = {'op': self.op, 'xref': self.xref}
+        if self.path:
+            out['path'] = self.path
+        if self.old is not None:
+            out['old'] = self.old
+        if self.new is not None:
+            out['new'] = self.new
+        if self.text is not None:
+            out['text'] = self.text
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Union[str, List[str]]]) -> 'Change':
+        return cls(
+            data['op'], data['xref'], path=data.get('path', ''), old=data.get('old'), new=data.get('new'),
+            text=data.get('text')
+        )
+
+
+def records(gedcom: GEDCOM) -> Dict[str, Tag]:
+    seen = dict()
+    return {record_key(record.xref_id, record.tag, seen): record for record in gedcom}
+
+
+def content_digest(record: Tag) -> str:
+    lines = record.as_text().split('\n')
+    lines[0] = f'0 {record.tag}' if record.value is None else f'0 {record.tag} {record.value}'
+    return record_digest(lines)
+
+
+def diff(old: GEDCOM, new: GEDCOM) -> List[Change]:
+    old_records = records(old)
+    new_records = records(new)
+    changes: List[Change] = []
+    unmatched_old = {key: record for key, record in old_records.items() if key not in new_records}
+    by_digest: Dict[str, List[str]] = dict()
+    for key, record in unmatched_old.items():
+        if record.xref_id is not None:
+            by_digest.setdefault(content_digest(record), []).append(key)
+    for key, record in new_records.items():
+        if key in old_records:
+            if old_records[key].tag == record.tag:
+                _diff_children(key, '', old_records[key], record, changes)
+            else:
+                changes.append(Change('remove_record', key))
+                changes.append(Change('add_record', key, text=record.as_text().split('\n')))
+            continue
+        candidates = by_digest.get(content_digest(record)) if record.xref_id is not None else None
+        if candidates:
+            old_key = candidates.pop()
+            del unmatched_old[old_key]
+            changes.append(Change('renumber', old_key, old=old_key, new=key))
+        else:
+            changes.append(Change('add_record', key, text=record.as_text().split('\n')))
+    for key in unmatched_old:
+        changes.append(Change('remove_record', key))
+    return changes
+
+
+def _diff_children(key: str, path: str, old: Tag, new: Tag, changes: List[Change]):
+    if old.value != new.value:
+        changes.append(Change('replace', key, path=path, old=old.value, new=new.value))
+    old_children = _by_tag(old)
+    new_children = _by_tag(new)
+    prefix = f'{path}.' if path else ''
+    for tag, items in new_children.items():
+        previous = old_children.get(tag, [])
+        for index, item in enumerate(items):
+            if index < len(previous):
+                _diff_children(key, f'{prefix}{tag}[{index}]', previous[index], item, changes)
+            else:
+                changes.append(Change('add', key, path=path, text=item.as_text().split('\n')))
+    for tag, items in old_children.items():
+        count = len(new_children.get(tag, []))
+        for index in range(len(items) - 1, count - 1, -1):
+            changes.append(Change('remove', key, path=f'{prefix}{tag}[{index}]'))
+
+
+def _by_tag(tag: Tag) -> Dict[str, List[Tag]]:
+    out: Dict[str, List[Tag]] = dict()
+    for item in tag:
+        out.setdefault(item.tag, []).append(item)
+    return out
@@ -0,0 +1,153 @@
+from multiprocessing import Pool
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.graph import parents
+from gedcom5.names import double_metaphone, name_parts, normalize
+from gedcom5.tag import INDI
+
+THRESHOLD = 0.8
+WINDOW = 2
+CHUNK = 2048
+
+WEIGHTS = {'surname': 0.3, 'given': 0.25, 'birth': 0.2, 'death': 0.05, 'place': 0.1, 'parents': 0.1}
+
+# Feature tuples are plain data so that scoring can run in worker processes without pickling the tree.
+ENTRY, SURNAMES, CODES, GIVEN, BIRTH, DEATH, PLACE, SEX, PARENTS = range(9)
+
+Features = Tuple[
+    int, FrozenSet[str], FrozenSet[str], FrozenSet[str], Optional[int], Optional[int], Optional[Tuple[str, ...]],
+    Optional[str], FrozenSet[str]
+]
+
+
+class Match:
+    def __init__(self, first: INDI, second: INDI, score: float):
+        self.first = first
+        self.second = second
+        self.score = score
+
+    def __repr__(self):
+        return f'Match({self.first.xref_id}, {self.second.xref_id}, {self.score:.3f})'
+
+
+def features(entry: int, indi: INDI) -> Features:
+    surnames = set()
+    given = set()
+    for surname_list, given_list in name_parts(indi):
+        surnames.update(surname_list)
+        given.update(given_list)
+    codes = {code for surname in surnames for code in double_metaphone(surname) if code}
+    place = None
+    for birt in indi.birt:
+        if birt.plac is not None and birt.plac.value:
+            place = tuple(normalize(part) for part in birt.plac.value.split(','))
+            break
+    sex = indi.sex.value if indi.sex is not None and indi.sex.value in ('M', 'F') else None
+    family = set()
+    for parent in parents(indi):
+        for surname_list, given_list in name_parts(parent):
+            family.update(f'{given} {surname}' for surname in surname_list for given in given_list[:1])
+    return (
+        entry, frozenset(surnames), frozenset(codes), frozenset(given), indi.birth_year, indi.death_year, place, sex,
+        frozenset(family)
+    )
+
+
+def blocks(people: Iterable[Features], window: int = WINDOW) -> Dict[Tuple[str, Optional[int]], List[Features]]:
+    """Group people by surname code and birth year bucket; people without a birth year share one bucket."""
+    out = dict()
+    size = window + 1
+    for person in people:
+        bucket = person[BIRTH] // size if person[BIRTH] is not None else None
+        for code in person[CODES]:
+            out.setdefault((code, bucket), []).append(person)
+    return out
+
+
+def candidate_pairs(people: Iterable[Features], window: int = WINDOW) -> List[Tuple[Features, Features]]:
+    grouped = blocks(people, window)
+    seen = set()
+    out = []
+    for (code, bucket), members in grouped.items():
+        others = grouped.get((code, bucket + 1), []) if bucket is not None else []
+        for n, first in enumerate(members):
+            for second in members[n + 1:] + others:
+                key = (first[ENTRY], second[ENTRY]) if first[ENTRY] < second[ENTRY] else (second[ENTRY], first[ENTRY])
+                if key[0] != key[1] and key not in seen:
+                    seen.add(key)
+                    out.append((first, second))
+    return out
+
+
+def _overlap(first: FrozenSet[str], second: FrozenSet[str]) -> Optional[float]:
+    if not first or not second:
+        return None
+    return len(first & second) / min(len(first), len(second))
+
+
+def _years(first: Optional[int], second: Optional[int], window: int) -> Optional[float]:
+    if first is None or second is None:
+        return None
+    return max(0.0, 1 - abs(first - second) / (2 * (window + 1)))
+
+
+def score(first: Features, second: Features, window: int = WINDOW) -> float:
+    """Weighted similarity in [0, 1]; fields missing on either side count as 0.5."""
+    if first[SEX] is not None and second[SEX] is not None and first[SEX] != second[SEX]:
+        return 0.0
+    if first[BIRTH] is not None and second[BIRTH] is not None and abs(first[BIRTH] - second[BIRTH]) > window:
+        return 0.0
+    surname = None
+    if first[SURNAMES] and second[SURNAMES]:
+        surname = 1.0 if first[SURNAMES] & second[SURNAMES] else 0.8 if first[CODES] & second[CODES] else 0.0
+    place = None
+    if first[PLACE] is not None and second[PLACE] is not None:
+        if first[PLACE] == second[PLACE]:
+            place = 1.0
+        else:
+            place = 0.75 if first[PLACE][0] == second[PLACE][0] else 0.0
+    similarity = {
+        'surname': surname,
+        'given': _overlap(first[GIVEN], second[GIVEN]),
+        'birth': _years(first[BIRTH], second[BIRTH], window),
+        'death': _years(first[DEATH], second[DEATH], window),
+        'place': place,
+        'parents': _overlap(first[PARENTS], second[PARENTS]),
+    }
+    return sum(weight * (0.5 if similarity[name] is None else similarity[name]) for name, weight in WEIGHTS.items())
+
+
+def _score_pairs(args: Tuple[List[Tuple[Features, Features]], float, int]) -> List[Tuple[int, int, float]]:
+    pairs, threshold, window = args
+    out = []
+    for first, second in pairs:
+        value = score(first, second, window)
+        if value >= threshold:
+            out.append((first[ENTRY], second[ENTRY], value))
+    return out
+
+
+def find_duplicates(
+    gedcom: GEDCOM, threshold: float = THRESHOLD, window: int = WINDOW, processes: Optional[int] = None
+) -> List[Match]:
+    """Likely duplicate individuals, best first.
+
+    Only people sharing a Double Metaphone surname code and a birth year within ``window`` (or both without
+    one) are compared. With ``processes`` the candidate pairs are scored in a process pool.
+    """
+    individuals = gedcom.indi
+    people = [features(entry, indi) for entry, indi in enumerate(individuals)]
+    pairs = candidate_pairs(people, window)
+    work = [(pairs[n:n + CHUNK], threshold, window) for n in range(0, len(pairs), CHUNK)]
+    if processes is not None and len(work) > 1:
+        with Pool(processes) as pool:
+            results = pool.map(_score_pairs, work)
+    else:
+        results = [_score_pairs(item) for item in work]
+    found = [item for result in results for item in result]
+    found.sort(key=lambda item: (-item[2], min(item[0], item[1]), max(item[0], item[1])))
+    return [
+        Match(individuals[min(first, second)], individuals[max(first, second)], value)
+        for first, second, value in found
+    ]
@@ -1,4 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from gedcom5.diagnostics import Diagnostic
+from gedcom5.graph import parents
+from gedcom5.names import NameIndex
+from gedcom5.places import PlaceIndex
+from gedcom5.spatial import SpatialIndex
 from gedcom5.tag import Tag, UnexpectedTag, INDI, FAM, HEAD, OBJE, NOTE, REPO, SOUR, SUBN, SUBM
 
 
@@ -14,6 +19,8 @@ class GEDCOM:
         self._items: List[Tag] = []
         self._xref = dict()
         self._to_resolve = []
+        self.hashes: Dict[str, str] = dict()
+        self.diagnostics: List[Diagnostic] = []
         self.head: List[HEAD] = []
         self.fam: List[FAM] = []
         self.indi: List[INDI] = []
@@ -23,6 +30,11 @@ class GEDCOM:
         self.sour: List[SOUR] = []
         self.subn: List[SUBN] = []
         self.subm: List[SUBM] = []
+        self._order: Optional[List[INDI]] = None
+        self._generation: Dict[int, int] = dict()
+        self._names: Optional[NameIndex] = None
+        self._places: Optional[PlaceIndex] = None
+        self._spatial: Optional[SpatialIndex] = None
 
     def __len__(self):
         return len(self._items)
@@ -39,13 +51,37 @@ class GEDCOM:
 
     def resolve(self, strict=False):
         for item in self._to_resolve:
+            if not isinstance(item.ref, str):
+                continue
             if item.ref in self._xref:
                 item.ref = self._xref[item.ref]
             elif strict:
                 raise InvalidGEDCOM(f'Missing {item.ref} in gedcom')
 
+    def reindex(self, strict=False):
+        items = self._items
+        diagnostics = self.diagnostics
+        GEDCOM.__init__(self)
+        self.diagnostics = diagnostics
+        pending = []
+        for item in items:
+            item.parent = self
+            self.append(item)
+            pending.append(item)
+        while pending:
+            item = pending.pop()
+            if item.ref is not None:
+                item.ref = item.value
+                self.register(item)
+            pending.extend(item._items)
+        self.resolve(strict=strict)
+
     def append(self, item: Tag, strict=False):
         self._items.append(item)
+        self._order = None
+        self._names = None
+        self._places = None
+        self._spatial = None
         if item.xref_id is not None:
             self._xref[item.xref_id] = item
         if isinstance(item, HEAD):
@@ -72,6 +108,72 @@ class GEDCOM:
             raise UnexpectedTag(item, self)
         return False
 
+    def invalidate(self):
+        """Drop cached derived data after changing records in place."""
+        self._order = None
+        self._generation = dict()
+        self._names = None
+        self._places = None
+        self._spatial = None
+
+    def name_index(self) -> NameIndex:
+        """Surname and given name index over every NAME, FONE and ROMN, built on first use."""
+        if self._names is None:
+            self._names = NameIndex(self.indi)
+        return self._names
+
+    def place_index(self) -> PlaceIndex:
+        """Place hierarchy of every PLAC, using the HEAD.PLAC.FORM jurisdictions, built on first use."""
+        if self._places is None:
+            self._places = PlaceIndex(self)
+        return self._places
+
+    def spatial_index(self) -> SpatialIndex:
+        """Grid index of events whose PLAC has MAP coordinates, built on first use."""
+        if self._spatial is None:
+            self._spatial = SpatialIndex(self)
+        return self._spatial
+
+    def topological_order(self) -> List[INDI]:
+        """Individuals with parents before children; anyone in or below an ancestry cycle comes last."""
+        if self._order is None:
+            self._topology()
+        return self._order
+
+    def generation(self, indi: INDI) -> Optional[int]:
+        """Longest distance from a founder (0), or ``None`` for anyone in or below an ancestry cycle."""
+        if self._order is None:
+            self._topology()
+        return self._generation.get(id(indi))
+
+    def _topology(self):
+        children = {id(indi): [] for indi in self.indi}
+        pending = dict()
+        for indi in self.indi:
+            seen = set()
+            for parent in parents(indi):
+                key = id(parent)
+                if key in children and key not in seen:
+                    seen.add(key)
+                    children[key].append(indi)
+            pending[id(indi)] = len(seen)
+        order = [indi for indi in self.indi if pending[id(indi)] == 0]
+        generation = {id(indi): 0 for indi in order}
+        depth = dict()
+        for indi in order:
+            below = generation[id(indi)] + 1
+            for child in children[id(indi)]:
+                key = id(child)
+                depth[key] = max(depth.get(key, 0), below)
+                pending[key] -= 1
+                if pending[key] == 0:
+                    generation[key] = depth[key]
+                    order.append(child)
+        if len(order) < len(self.indi):
+            order.extend(indi for indi in self.indi if pending[id(indi)] > 0)
+        self._order = order
+        self._generation = generation
+
     def find(self, tags: str) -> List[Tag]:
         nodes = [self]
         for tag in tags.split('.'):
@@ -0,0 +1,118 @@
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterator, List
+
+from gedcom5.tag import FAM, INDI
+
+if TYPE_CHECKING:
+    from gedcom5.gedcom import GEDCOM
+
+
+class Cycle:
+    """Individuals that are their own ancestors, and the families linking them."""
+
+    def __init__(self, individuals: List[INDI], families: List[FAM]):
+        self.individuals = individuals
+        self.families = families
+
+    def __repr__(self):
+        indi = ' '.join(str(item.xref_id) for item in self.individuals)
+        fam = ' '.join(str(item.xref_id) for item in self.families)
+        return f'Cycle(individuals=[{indi}], families=[{fam}])'
+
+
+def parents(indi: INDI) -> List[INDI]:
+    out = []
+    for famc in indi.famc:
+        fam = famc.ref
+        if isinstance(fam, FAM):
+            for spouse in (fam.husb, fam.wife):
+                if spouse is not None and isinstance(spouse.ref, INDI):
+                    out.append(spouse.ref)
+    return out
+
+
+def children(indi: INDI) -> List[INDI]:
+    out = []
+    for fams in indi.fams:
+        fam = fams.ref
+        if isinstance(fam, FAM):
+            out.extend(chil.ref for chil in fam.chil if isinstance(chil.ref, INDI))
+    return out
+
+
+def ancestors(indi: INDI) -> Iterator[INDI]:
+    """Breadth first, each ancestor once and never ``indi`` itself, so cyclic data terminates."""
+    return _walk(indi, parents)
+
+
+def descendants(indi: INDI) -> Iterator[INDI]:
+    """Breadth first, each descendant once and never ``indi`` itself, so cyclic data terminates."""
+    return _walk(indi, children)
+
+
+def _walk(indi: INDI, step: Callable[[INDI], List[INDI]]) -> Iterator[INDI]:
+    seen = {id(indi)}
+    pending = deque([indi])
+    while pending:
+        for item in step(pending.popleft()):
+            if id(item) not in seen:
+                seen.add(id(item))
+                pending.append(item)
+                yield item
+
+
+def cycles(gedcom: 'GEDCOM') -> List[Cycle]:
+    """Find ancestry cycles with an iterative Tarjan SCC over child -> parent edges."""
+    index = dict()
+    low = dict()
+    on_stack = set()
+    stack = []
+    out = []
+    for root in gedcom.indi:
+        if id(root) in index:
+            continue
+        work = [(root, iter(parents(root)))]
+        index[id(root)] = low[id(root)] = len(index)
+        stack.append(root)
+        on_stack.add(id(root))
+        while work:
+            node, edges = work[-1]
+            for parent in edges:
+                if id(parent) not in index:
+                    index[id(parent)] = low[id(parent)] = len(index)
+                    stack.append(parent)
+                    on_stack.add(id(parent))
+                    work.append((parent, iter(parents(parent))))
+                    break
+                if id(parent) in on_stack:
+                    low[id(node)] = min(low[id(node)], index[id(parent)])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    low[id(caller)] = min(low[id(caller)], low[id(node)])
+                if low[id(node)] == index[id(node)]:
+                    component = []
+                    while True:
+                        item = stack.pop()
+                        on_stack.discard(id(item))
+                        component.append(item)
+                        if item is node:
+                            break
+                    if len(component) > 1 or any(item is node for item in parents(node)):
+                        out.append(_cycle(component))
+    return out
+
+
+def _cycle(component: List[INDI]) -> Cycle:
+    members = {id(item) for item in component}
+    families = []
+    seen = set()
+    for indi in component:
+        for famc in indi.famc:
+            fam = famc.ref
+            if isinstance(fam, FAM) and id(fam) not in seen:
+                if any(spouse is not None and id(spouse.ref) in members for spouse in (fam.husb, fam.wife)):
+                    seen.add(id(fam))
+                    families.append(fam)
+    return Cycle(list(reversed(component)), families)
@@ -0,0 +1,41 @@
+from hashlib import blake2b
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.tokenizer import RECORD
+
+
+def record_key(xref_id: Optional[str], tag: str, seen: Dict[str, int]) -> str:
+    if xref_id is not None:
+        return xref_id
+    count = seen.get(tag, 0)
+    seen[tag] = count + 1
+    return f'{tag}#{count}'
+
+
+def record_digest(lines: List[str]) -> str:
+    digest = blake2b(digest_size=16)
+    for line in lines:
+        digest.update(line.lstrip('\ufeff').encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def record_hashes(gedcom: GEDCOM) -> Dict[str, str]:
+    seen = dict()
+    return {
+        record_key(record.xref_id, record.tag, seen): record_digest(record.as_text().split('\n'))
+        for record in gedcom
+    }
+
+
+def split_records(lines: Iterable[str]) -> Iterator[List[str]]:
+    record_match = RECORD.match
+    record = []
+    for line in lines:
+        if record and record_match(line):
+            yield record
+            record = []
+        record.append(line)
+    if record:
+        yield record
@@ -0,0 +1,114 @@
+import sys
+from itertools import islice
+from time import monotonic
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+CHECK_EVERY = 1024
+
+
+class LimitExceeded(RuntimeError):
+    def __init__(self, reason: str, limit):
+        super().__init__(f'Parse aborted: {reason} limit {limit} exceeded')
+        self.reason = reason
+        self.limit = limit
+
+
+class CancelToken:
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class ParseLimits:
+    def __init__(
+        self, max_lines: Optional[int] = None, max_bytes: Optional[int] = None, max_depth: Optional[int] = None,
+        max_tags: Optional[int] = None, timeout: Optional[float] = None, deadline: Optional[float] = None,
+        cancel: Optional[CancelToken] = None, check_every: int = CHECK_EVERY, max_line_length: Optional[int] = None
+    ):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_tags = max_tags
+        self.timeout = timeout
+        self.deadline = deadline
+        self.cancel = cancel
+        self.check_every = max(check_every, 1)
+        self.max_line_length = max_line_length
+
+    def guard(
+        self, fp: Optional[BinaryIO] = None, position: Optional[Callable[[], int]] = None
+    ) -> 'LimitGuard':
+        return LimitGuard(self, fp=fp, position=position)
+
+
+class LimitGuard:
+    def __init__(
+        self, limits: ParseLimits, fp: Optional[BinaryIO] = None, position: Optional[Callable[[], int]] = None
+    ):
+        self.limits = limits
+        self.fp = fp
+        self.position = position
+        self.max_depth = limits.max_depth if limits.max_depth is not None else sys.maxsize
+        self.max_tags = limits.max_tags if limits.max_tags is not None else sys.maxsize
+        self.started = monotonic()
+        deadline = limits.deadline
+        if limits.timeout is not None:
+            timeout_deadline = self.started + limits.timeout
+            deadline = timeout_deadline if deadline is None else min(deadline, timeout_deadline)
+        self.deadline = deadline
+        self.lines = 0
+        self.chars = 0
+
+    @property
+    def elapsed(self) -> float:
+        return monotonic() - self.started
+
+    @property
+    def bytes_read(self) -> int:
+        if self.position is not None:
+            return self.position()
+        if self.fp is not None:
+            try:
+                return self.fp.tell()
+            except (OSError, ValueError):
+                pass
+        return self.chars
+
+    def wrap(self, lines: Iterable[str]) -> Iterator[str]:
+        limits = self.limits
+        iterator = iter(lines)
+        while True:
+            size = limits.check_every
+            if limits.max_lines is not None:
+                size = min(size, limits.max_lines - self.lines + 1)
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            self.lines += len(batch)
+            self.chars += sum(map(len, batch)) + len(batch)
+            if limits.max_line_length is not None and max(map(len, batch)) > limits.max_line_length:
+                raise LimitExceeded('max_line_length', limits.max_line_length)
+            if limits.max_lines is not None and self.lines > limits.max_lines:
+                yield from batch[:-1]
+            self.check()
+            yield from batch
+
+    def check_read(self, pending: int):
+        """Checks made as each chunk is read, before it has been split into lines"""
+        limits = self.limits
+        if limits.max_line_length is not None and pending > limits.max_line_length:
+            raise LimitExceeded('max_line_length', limits.max_line_length)
+        self.check()
+
+    def check(self):
+        limits = self.limits
+        if limits.cancel is not None and limits.cancel.cancelled:
+            raise LimitExceeded('cancel', True)
+        if limits.max_lines is not None and self.lines > limits.max_lines:
+            raise LimitExceeded('max_lines', limits.max_lines)
+        if limits.max_bytes is not None and self.bytes_read > limits.max_bytes:
+            raise LimitExceeded('max_bytes', limits.max_bytes)
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise LimitExceeded('deadline', self.deadline)
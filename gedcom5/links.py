@@ -0,0 +1,109 @@
+from typing import Iterable, Iterator, List, Optional
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.tag import Tag, CHIL, FAM, FAMC, FAMS, HUSB, INDI, WIFE
+
+RECIPROCAL = {
+    'FAMC': ('CHIL',),
+    'FAMS': ('HUSB', 'WIFE'),
+    'CHIL': ('FAMC',),
+    'HUSB': ('FAMS',),
+    'WIFE': ('FAMS',),
+}
+
+TYPES = {'FAMC': FAMC, 'FAMS': FAMS, 'CHIL': CHIL, 'HUSB': HUSB, 'WIFE': WIFE}
+
+
+class Asymmetry:
+    """A family link whose target record has no tag pointing back."""
+
+    def __init__(self, item: Tag):
+        self.item = item
+        self.source = item.parent
+        self.target = item.ref
+        self.missing = RECIPROCAL[item.tag]
+
+    def __repr__(self):
+        return f'Asymmetry({self.source.xref_id} {self.item.tag} {self.target.xref_id})'
+
+    @property
+    def message(self) -> str:
+        return f'{self.target.xref_id} has no {"/".join(self.missing)} pointing back to {self.source.xref_id}'
+
+
+def family_links(gedcom: GEDCOM) -> Iterator[Tag]:
+    for record in gedcom:
+        if isinstance(record, INDI):
+            target = FAM
+        elif isinstance(record, FAM):
+            target = INDI
+        else:
+            continue
+        for item in record:
+            if item.tag in RECIPROCAL and isinstance(item.ref, target):
+                yield item
+
+
+def asymmetry(item: Tag) -> Optional[Asymmetry]:
+    """Check a single resolved family link; ``None`` when the target points back."""
+    source = item.parent
+    target = item.ref
+    if not isinstance(source, INDI) or not isinstance(target, FAM):
+        if not isinstance(source, FAM) or not isinstance(target, INDI):
+            return None
+    tags = RECIPROCAL.get(item.tag, ())
+    if not tags or any(back.ref is source for back in target if back.tag in tags):
+        return None
+    return Asymmetry(item)
+
+
+def check(gedcom: GEDCOM) -> List[Asymmetry]:
+    items = list(family_links(gedcom))
+    present = {(id(item.parent), id(item.ref), item.tag) for item in items}
+    return [
+        Asymmetry(item) for item in items
+        if not any((id(item.ref), id(item.parent), tag) in present for tag in RECIPROCAL[item.tag])
+    ]
+
+
+def repair(gedcom: GEDCOM, asymmetries: Optional[Iterable[Asymmetry]] = None) -> List[Tag]:
+    """Append the missing reciprocal tags and return them.
+
+    A missing HUSB/WIFE is chosen from the individual's SEX, falling back to whichever slot is free. Links
+    that would need a second HUSB or WIFE are left alone.
+    """
+    if asymmetries is None:
+        asymmetries = check(gedcom)
+    added = []
+    for entry in asymmetries:
+        tag = _reciprocal_tag(entry)
+        if tag is None:
+            continue
+        target = entry.target
+        if any(item.tag == tag and item.ref is entry.source for item in target):
+            continue
+        item = TYPES[tag](level=target.level + 1, parent=target, value=entry.source.xref_id)
+        item.ref = entry.source
+        target.append(item)
+        gedcom.register(item)
+        added.append(item)
+    if added:
+        gedcom.hashes.clear()
+        gedcom.invalidate()
+    return added
+
+
+def _reciprocal_tag(entry: Asymmetry) -> Optional[str]:
+    if len(entry.missing) == 1:
+        return entry.missing[0]
+    fam = entry.target
+    sex = entry.source.sex.value if entry.source.sex is not None else None
+    if sex == 'M':
+        return 'HUSB' if fam.husb is None else None
+    if sex == 'F':
+        return 'WIFE' if fam.wife is None else None
+    if fam.husb is None:
+        return 'HUSB'
+    if fam.wife is None:
+        return 'WIFE'
+    return None
@@ -0,0 +1,88 @@
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.tag import Tag
+
+_XREF = re.compile(r'@([^0-9@]*)([0-9]*)@')
+
+
+class MergeError(RuntimeError):
+    def __init__(self, reason):
+        super().__init__(f'Cannot merge: {reason}')
+
+
+class XrefAllocator:
+    """Hands out unused xref ids, numbering on from the highest in use for each prefix."""
+
+    def __init__(self, used: Iterable[str]):
+        self.used = set(used)
+        self.next: Dict[str, int] = dict()
+        for xref in self.used:
+            match = _XREF.fullmatch(xref)
+            if match is not None and match.group(2):
+                prefix = match.group(1)
+                self.next[prefix] = max(self.next.get(prefix, 1), int(match.group(2)) + 1)
+
+    def allocate(self, xref: str) -> str:
+        match = _XREF.fullmatch(xref)
+        prefix = match.group(1) if match is not None else 'X'
+        n = self.next.get(prefix, 1)
+        while f'@{prefix}{n}@' in self.used:
+            n += 1
+        self.next[prefix] = n + 1
+        new = f'@{prefix}{n}@'
+        self.used.add(new)
+        return new
+
+
+def merge(base: GEDCOM, other: GEDCOM, unify: Optional[Iterable[Tuple[Tag, Tag]]] = None) -> Dict[str, str]:
+    """Move the records of ``other`` into ``base`` and return the xref remap table.
+
+    Colliding xrefs in ``other`` are renumbered and every pointer in ``other`` is rewritten. ``unify`` pairs a
+    ``base`` record with an ``other`` record describing the same thing: the ``other`` record is dropped, its
+    pointers are redirected to the ``base`` record and any of its lines the ``base`` record lacks are copied
+    across. ``other`` must not be used afterwards. Indexes are rebuilt once at the end.
+    """
+    unified: Dict[int, Tag] = dict()
+    remap: Dict[str, str] = dict()
+    for kept, dropped in unify or ():
+        if kept.xref_id is None or dropped.xref_id is None:
+            raise MergeError('only records with an xref can be unified')
+        unified[id(dropped)] = kept
+        remap[dropped.xref_id] = kept.xref_id
+    moved = [record for record in other if record.xref_id is not None and id(record) not in unified]
+    allocator = XrefAllocator([*base._xref, *(record.xref_id for record in moved)])
+    for record in moved:
+        if record.xref_id in base._xref:
+            remap[record.xref_id] = allocator.allocate(record.xref_id)
+    for record in other:
+        if record.xref_id in remap and id(record) not in unified:
+            record.xref_id = remap[record.xref_id]
+        pending = [record]
+        while pending:
+            item = pending.pop()
+            if item.ref is not None and item.value in remap:
+                item.value = remap[item.value]
+            pending.extend(item._items)
+    items = [record for record in base if record.tag != 'TRLR']
+    trailer = [record for record in base if record.tag == 'TRLR']
+    for record in other:
+        kept = unified.get(id(record))
+        if kept is not None:
+            _unify(kept, record)
+        elif record.xref_id is not None or record.tag not in ('HEAD', 'TRLR'):
+            items.append(record)
+    base._items = items + trailer
+    base.reindex()
+    return remap
+
+
+def _unify(kept: Tag, dropped: Tag):
+    present = {item.as_text() for item in kept}
+    for item in dropped:
+        text = item.as_text()
+        if text not in present:
+            present.add(text)
+            item.parent = kept
+            kept.append(item)
@@ -0,0 +1,485 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from gedcom5.tag import Tag, INDI
+
+EXACT = 'exact'
+PREFIX = 'prefix'
+SOUNDEX = 'soundex'
+METAPHONE = 'metaphone'
+MATCHES = (EXACT, PREFIX, SOUNDEX, METAPHONE)
+
+_SOUNDEX = {
+    letter: digit
+    for letters, digit in (('BFPV', '1'), ('CGJKQSXZ', '2'), ('DT', '3'), ('L', '4'), ('MN', '5'), ('R', '6'))
+    for letter in letters
+}
+_VOWELS = 'AEIOUY'
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_SEPARATORS = re.compile(r'[\s,]+')
+
+
+def fold(text: str) -> str:
+    """Case fold and strip accents so that e.g. ``Müller`` and ``MULLER`` compare equal."""
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+
+
+def normalize(text: str) -> str:
+    return ' '.join(_PUNCTUATION.sub('', fold(text)).split())
+
+
+def _letters(text: str) -> str:
+    return ''.join(c for c in fold(text).upper() if 'A' <= c <= 'Z')
+
+
+def soundex(name: str) -> str:
+    letters = _letters(name)
+    if not letters:
+        return ''
+    out = letters[0]
+    last = _SOUNDEX.get(letters[0], '')
+    for letter in letters[1:]:
+        code = _SOUNDEX.get(letter, '')
+        if code and code != last:
+            out += code
+            if len(out) == 4:
+                break
+        if letter not in 'HW':
+            last = code
+    return out.ljust(4, '0')
+
+
+def double_metaphone(name: str) -> Tuple[str, str]:
+    """Primary and alternate Double Metaphone keys (Lawrence Philips, 2000), four characters at most."""
+    word = _letters(name)
+    length = len(word)
+    last = length - 1
+    padded = word + '     '
+    primary = []
+    secondary = []
+
+    def at(pos: int, *subs: str) -> bool:
+        return pos >= 0 and any(padded.startswith(sub, pos) for sub in subs)
+
+    def vowel(pos: int) -> bool:
+        return 0 <= pos < length and word[pos] in _VOWELS
+
+    def add(main: str, alt: Optional[str] = None):
+        primary.append(main)
+        secondary.append(main if alt is None else alt)
+
+    slavo_germanic = 'W' in word or 'K' in word or 'CZ' in word or 'WITZ' in word
+    i = 0
+    if at(0, 'GN', 'KN', 'PN', 'WR', 'PS'):
+        i = 1
+    if at(0, 'X'):
+        add('S')
+        i = 1
+    while i < length:
+        c = word[i]
+        if c in _VOWELS:
+            if i == 0:
+                add('A')
+            i += 1
+        elif c == 'B':
+            add('P')
+            i += 2 if at(i + 1, 'B') else 1
+        elif c == 'C':
+            i = _metaphone_c(word, i, at, vowel, add)
+        elif c == 'D':
+            if at(i, 'DG'):
+                if at(i + 2, 'I', 'E', 'Y'):
+                    add('J')
+                    i += 3
+                else:
+                    add('TK')
+                    i += 2
+            elif at(i, 'DT', 'DD'):
+                add('T')
+                i += 2
+            else:
+                add('T')
+                i += 1
+        elif c == 'F':
+            add('F')
+            i += 2 if at(i + 1, 'F') else 1
+        elif c == 'G':
+            i = _metaphone_g(word, i, at, vowel, add, slavo_germanic)
+        elif c == 'H':
+            if (i == 0 or vowel(i - 1)) and vowel(i + 1):
+                add('H')
+                i += 2
+            else:
+                i += 1
+        elif c == 'J':
+            if at(i, 'JOSE') or at(0, 'SAN '):
+                if (i == 0 and at(i + 4, ' ')) or at(0, 'SAN '):
+                    add('H')
+                else:
+                    add('J', 'H')
+                i += 1
+                continue
+            if i == 0:
+                add('J', 'A')
+            elif vowel(i - 1) and not slavo_germanic and at(i + 1, 'A', 'O'):
+                add('J', 'H')
+            elif i == last:
+                add('J', '')
+            elif not at(i + 1, 'L', 'T', 'K', 'S', 'N', 'M', 'B', 'Z') and not at(i - 1, 'S', 'K', 'L'):
+                add('J')
+            i += 2 if at(i + 1, 'J') else 1
+        elif c == 'K':
+            add('K')
+            i += 2 if at(i + 1, 'K') else 1
+        elif c == 'L':
+            if at(i + 1, 'L'):
+                if (i == length - 3 and at(i - 1, 'ILLO', 'ILLA', 'ALLE')) or (
+                    (at(last - 1, 'AS', 'OS') or at(last, 'A', 'O')) and at(i - 1, 'ALLE')
+                ):
+                    add('L', '')
+                else:
+                    add('L')
+                i += 2
+            else:
+                add('L')
+                i += 1
+        elif c == 'M':
+            add('M')
+            i += 2 if (at(i - 1, 'UMB') and (i + 1 == last or at(i + 2, 'ER'))) or at(i + 1, 'M') else 1
+        elif c == 'N':
+            add('N')
+            i += 2 if at(i + 1, 'N') else 1
+        elif c == 'P':
+            if at(i + 1, 'H'):
+                add('F')
+                i += 2
+            else:
+                add('P')
+                i += 2 if at(i + 1, 'P', 'B') else 1
+        elif c == 'Q':
+            add('K')
+            i += 2 if at(i + 1, 'Q') else 1
+        elif c == 'R':
+            if i == last and not slavo_germanic and at(i - 2, 'IE') and not at(i - 4, 'ME', 'MA'):
+                add('', 'R')
+            else:
+                add('R')
+            i += 2 if at(i + 1, 'R') else 1
+        elif c == 'S':
+            i = _metaphone_s(word, i, at, vowel, add, slavo_germanic)
+        elif c == 'T':
+            if at(i, 'TION', 'TIA', 'TCH'):
+                add('X')
+                i += 3
+            elif at(i, 'TH', 'TTH'):
+                if at(i + 2, 'OM', 'AM') or at(0, 'VAN ', 'VON ', 'SCH'):
+                    add('T')
+                else:
+                    add('0', 'T')
+                i += 2
+            else:
+                add('T')
+                i += 2 if at(i + 1, 'T', 'D') else 1
+        elif c == 'V':
+            add('F')
+            i += 2 if at(i + 1, 'V') else 1
+        elif c == 'W':
+            if at(i, 'WR'):
+                add('R')
+                i += 2
+                continue
+            if i == 0 and (vowel(i + 1) or at(i, 'WH')):
+                if vowel(i + 1):
+                    add('A', 'F')
+                else:
+                    add('A')
+            if (i == last and vowel(i - 1)) or at(i - 1, 'EWSKI', 'EWSKY', 'OWSKI', 'OWSKY') or at(0, 'SCH'):
+                add('', 'F')
+                i += 1
+            elif at(i, 'WICZ', 'WITZ'):
+                add('TS', 'FX')
+                i += 4
+            else:
+                i += 1
+        elif c == 'X':
+            if not (i == last and (at(i - 3, 'IAU', 'EAU') or at(i - 2, 'AU', 'OU'))):
+                add('KS')
+            i += 2 if at(i + 1, 'C', 'X') else 1
+        elif c == 'Z':
+            if at(i + 1, 'H'):
+                add('J')
+                i += 2
+                continue
+            if at(i + 1, 'ZO', 'ZI', 'ZA') or (slavo_germanic and i > 0 and word[i - 1] != 'T'):
+                add('S', 'TS')
+            else:
+                add('S')
+            i += 2 if at(i + 1, 'Z') else 1
+        else:
+            i += 1
+    return ''.join(primary)[:4], ''.join(secondary)[:4]
+
+
+def _metaphone_c(word, i, at, vowel, add) -> int:
+    if i > 1 and not vowel(i - 2) and at(i - 1, 'ACH') and not at(i + 2, 'I') and (
+        not at(i + 2, 'E') or at(i - 2, 'BACHER', 'MACHER')
+    ):
+        add('K')
+        return i + 2
+    if i == 0 and at(i, 'CAESAR'):
+        add('S')
+        return i + 2
+    if at(i, 'CHIA'):
+        add('K')
+        return i + 2
+    if at(i, 'CH'):
+        if i > 0 and at(i, 'CHAE'):
+            add('K', 'X')
+        elif i == 0 and at(i + 1, 'HARAC', 'HARIS', 'HOR', 'HYM', 'HIA', 'HEM') and not at(0, 'CHORE'):
+            add('K')
+        elif at(0, 'VAN ', 'VON ', 'SCH') or at(i - 2, 'ORCHES', 'ARCHIT', 'ORCHID') or at(i + 2, 'T', 'S') or (
+            (at(i - 1, 'A', 'O', 'U', 'E') or i == 0) and at(i + 2, 'L', 'R', 'N', 'M', 'B', 'H', 'F', 'V', 'W', ' ')
+        ):
+            add('K')
+        elif i > 0:
+            add('K') if at(0, 'MC') else add('X', 'K')
+        else:
+            add('X')
+        return i + 2
+    if at(i, 'CZ') and not at(i - 2, 'WICZ'):
+        add('S', 'X')
+        return i + 2
+    if at(i + 1, 'CIA'):
+        add('X')
+        return i + 3
+    if at(i, 'CC') and not (i == 1 and word[0] == 'M'):
+        if at(i + 2, 'I', 'E', 'H') and not at(i + 2, 'HU'):
+            if (i == 1 and word[0] == 'A') or at(i - 1, 'UCCEE', 'UCCES'):
+                add('KS')
+            else:
+                add('X')
+            return i + 3
+        add('K')
+        return i + 2
+    if at(i, 'CK', 'CG', 'CQ'):
+        add('K')
+        return i + 2
+    if at(i, 'CI', 'CE', 'CY'):
+        if at(i, 'CIO', 'CIE', 'CIA'):
+            add('S', 'X')
+        else:
+            add('S')
+        return i + 2
+    add('K')
+    if at(i + 1, ' C', ' Q', ' G'):
+        return i + 3
+    if at(i + 1, 'C', 'K', 'Q') and not at(i + 1, 'CE', 'CI'):
+        return i + 2
+    return i + 1
+
+
+def _metaphone_g(word, i, at, vowel, add, slavo_germanic) -> int:
+    if at(i + 1, 'H'):
+        if i > 0 and not vowel(i - 1):
+            add('K')
+            return i + 2
+        if i == 0:
+            add('J' if at(i + 2, 'I') else 'K')
+            return i + 2
+        if at(i - 2, 'B', 'H', 'D') or at(i - 3, 'B', 'H', 'D') or at(i - 4, 'B', 'H'):
+            return i + 2
+        if i > 2 and at(i - 1, 'U') and at(i - 3, 'C', 'G', 'L', 'R', 'T'):
+            add('F')
+        elif word[i - 1] != 'I':
+            add('K')
+        return i + 2
+    if at(i + 1, 'N'):
+        if i == 1 and vowel(0) and not slavo_germanic:
+            add('KN', 'N')
+        elif not at(i + 2, 'EY') and not at(i + 1, 'Y') and not slavo_germanic:
+            add('N', 'KN')
+        else:
+            add('KN')
+        return i + 2
+    if at(i + 1, 'LI') and not slavo_germanic:
+        add('KL', 'L')
+        return i + 2
+    if i == 0 and at(i + 1, 'Y', 'ES', 'EP', 'EB', 'EL', 'EY', 'IB', 'IL', 'IN', 'IE', 'EI', 'ER'):
+        add('K', 'J')
+        return i + 2
+    if at(i + 1, 'ER', 'Y') and not at(0, 'DANGER', 'RANGER', 'MANGER') and not at(i - 1, 'E', 'I') and not at(
+        i - 1, 'RGY', 'OGY'
+    ):
+        add('K', 'J')
+        return i + 2
+    if at(i + 1, 'E', 'I', 'Y') or at(i - 1, 'AGGI', 'OGGI'):
+        if at(0, 'VAN ', 'VON ', 'SCH') or at(i + 1, 'ET'):
+            add('K')
+        elif at(i + 1, 'IER '):
+            add('J')
+        else:
+            add('J', 'K')
+        return i + 2
+    add('K')
+    return i + 2 if at(i + 1, 'G') else i + 1
+
+
+def _metaphone_s(word, i, at, vowel, add, slavo_germanic) -> int:
+    last = len(word) - 1
+    if at(i - 1, 'ISL', 'YSL'):
+        return i + 1
+    if i == 0 and at(i, 'SUGAR'):
+        add('X', 'S')
+        return i + 1
+    if at(i, 'SH'):
+        add('S' if at(i + 1, 'HEIM', 'HOEK', 'HOLM', 'HOLZ') else 'X')
+        return i + 2
+    if at(i, 'SIO', 'SIA'):
+        if slavo_germanic:
+            add('S')
+        else:
+            add('S', 'X')
+        return i + 3
+    if (i == 0 and at(i + 1, 'M', 'N', 'L', 'W')) or at(i + 1, 'Z'):
+        add('S', 'X')
+        return i + 2 if at(i + 1, 'Z') else i + 1
+    if at(i, 'SC'):
+        if at(i + 2, 'H'):
+            if at(i + 3, 'OO', 'ER', 'EN', 'UY', 'ED', 'EM'):
+                if at(i + 3, 'ER', 'EN'):
+                    add('X', 'SK')
+                else:
+                    add('SK')
+            elif i == 0 and not vowel(3) and not at(3, 'W'):
+                add('X', 'S')
+            else:
+                add('X')
+        elif at(i + 2, 'I', 'E', 'Y'):
+            add('S')
+        else:
+            add('SK')
+        return i + 3
+    if i == last and at(i - 2, 'AI', 'OI'):
+        add('', 'S')
+    else:
+        add('S')
+    return i + 2 if at(i + 1, 'S', 'Z') else i + 1
+
+
+def name_parts(indi: INDI) -> Iterator[Tuple[List[str], List[str]]]:
+    """Surnames and given names of every NAME, FONE and ROMN of ``indi``."""
+    for name in indi.name:
+        for piece in [name] + name.fone + name.romn:
+            yield _surnames(piece), _given_names(piece)
+
+
+def _surnames(piece: Tag) -> List[str]:
+    out = []
+    value = piece.value or ''
+    if value.count('/') >= 2:
+        out.append(value.split('/')[1])
+    if piece.surn is not None and piece.surn.value:
+        out.extend(piece.surn.value.split(','))
+    return _unique(normalize(item) for item in out)
+
+
+def _given_names(piece: Tag) -> List[str]:
+    out = []
+    value = piece.value or ''
+    out.extend(_SEPARATORS.split(value.split('/')[0]))
+    if piece.givn is not None and piece.givn.value:
+        out.extend(_SEPARATORS.split(piece.givn.value))
+    return _unique(normalize(item) for item in out)
+
+
+def _unique(items: Iterable[str]) -> List[str]:
+    out = []
+    for item in items:
+        if item and item != '?' and item not in out:
+            out.append(item)
+    return out
+
+
+class KeyIndex:
+    """Exact, prefix and phonetic lookups of one name field, mapping keys to entry numbers."""
+
+    def __init__(self):
+        self.exact: Dict[str, List[int]] = dict()
+        self.soundex: Dict[str, List[int]] = dict()
+        self.metaphone: Dict[str, List[int]] = dict()
+        self._codes: Dict[str, Tuple[str, Set[str]]] = dict()
+        self._sorted: Optional[List[str]] = None
+
+    def add(self, key: str, entry: int):
+        if key not in self.exact:
+            self.exact[key] = []
+            self._codes[key] = (soundex(key), {code for code in double_metaphone(key) if code})
+            self._sorted = None
+        self.exact[key].append(entry)
+        code, codes = self._codes[key]
+        if code:
+            self.soundex.setdefault(code, []).append(entry)
+        for code in codes:
+            self.metaphone.setdefault(code, []).append(entry)
+
+    def lookup(self, name: str, match: str = EXACT) -> Set[int]:
+        if match == EXACT:
+            return set(self.exact.get(normalize(name), ()))
+        if match == PREFIX:
+            return self._prefix(normalize(name))
+        if match == SOUNDEX:
+            return set(self.soundex.get(soundex(name), ()))
+        if match == METAPHONE:
+            out = set()
+            for code in set(double_metaphone(name)):
+                out.update(self.metaphone.get(code, ()))
+            return out
+        raise ValueError(f'Unknown match {match}, expected one of {", ".join(MATCHES)}')
+
+    def _prefix(self, prefix: str) -> Set[int]:
+        if self._sorted is None:
+            self._sorted = sorted(self.exact)
+        out = set()
+        for n in range(bisect_left(self._sorted, prefix), len(self._sorted)):
+            key = self._sorted[n]
+            if not key.startswith(prefix):
+                break
+            out.update(self.exact[key])
+        return out
+
+
+class NameIndex:
+    def __init__(self, individuals: Iterable[INDI] = ()):
+        self.individuals: List[INDI] = []
+        self.surnames = KeyIndex()
+        self.given_names = KeyIndex()
+        for indi in individuals:
+            self.add(indi)
+
+    def add(self, indi: INDI):
+        entry = len(self.individuals)
+        self.individuals.append(indi)
+        surnames = set()
+        given_names = set()
+        for surname_list, given_list in name_parts(indi):
+            surnames.update(surname_list)
+            given_names.update(given_list)
+        for surname in surnames:
+            self.surnames.add(surname, entry)
+        for given in given_names:
+            self.given_names.add(given, entry)
+
+    def search(self, surname: Optional[str] = None, given: Optional[str] = None, match: str = EXACT) -> List[INDI]:
+        """Individuals matching every name given, in file order."""
+        entries = None
+        if surname is not None:
+            entries = self.surnames.lookup(surname, match)
+        if given is not None:
+            found = self.given_names.lookup(given, match)
+            entries = found if entries is None else entries & found
+        if entries is None:
+            return []
+        return [self.individuals[entry] for entry in sorted(entries)]
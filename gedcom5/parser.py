@@ -1,5 +1,19 @@
-from typing import BinaryIO, Optional
+import asyncio
+import gc
+import sys
+import threading
+import weakref
+from time import perf_counter
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Type, \
+    Union
+from gedcom5.charset import CHUNK_SIZE, LineDecoder, UndecodableLine, iter_lines
+from gedcom5.diagnostics import BLANK_LINE, DANGLING_POINTER, LEVEL_JUMP, MISSING_LEVEL, MISSING_TAG, STRAY_CR, \
+    UNDECODABLE, UNEXPECTED_TAG, UNKNOWN_TAG, Diagnostic
 from gedcom5.gedcom import GEDCOM
+from gedcom5.incremental import record_digest, record_hashes, record_key, split_records
+from gedcom5.limits import LimitExceeded, LimitGuard, ParseLimits
+from gedcom5.progress import PROGRESS_EVERY, Progress, ProgressReporter
+from gedcom5.stats import ParseStats
 from gedcom5.tag import Tag, HEAD, SOUR, VERS, NAME, CORP, DATA, DATE, COPR, CONT, CONC, DEST, TIME, SUBM, SUBN, FILE, \
     GEDC, FORM, CHAR, LANG, PLAC, NOTE, FAM, RESN, HUSB, WIFE, CHIL, NCHI, REFN, TYPE, RIN, INDI, SEX, ALIA, ANCI, DESI, \
     RFN, AFN, OBJE, TITL, REPO, EVEN, AGNC, AUTH, ABBR, PUBL, TEXT, FAMF, TEMP, ORDI, ADDR, ADR1, ADR2, ADR3, CITY, \
@@ -7,7 +21,8 @@ from gedcom5.tag import Tag, HEAD, SOUR, VERS, NAME, CORP, DATA, DATE, COPR, CON
     ENGA, MARB, MARC, MARR, MARL, MARS, CAST, DSCR, EDUC, IDNO, NATI, NMR, OCCU, PROP, RESI, SSN, FACT, AGE, BIRT, CHR, \
     DEAT, BURI, CREM, ADOP, BAPM, BARM, BASM, BLES, CHRA, CONF, FCOM, ORDN, NATU, EMIG, IMMI, PROB, WILL, GRAD, RETI, \
     BAPL, CONL, ENDL, SLGC, SLGS, MEDI, NPFX, GIVN, NICK, SPFX, SURN, NSFX, FONE, ROMN, MAP, LATI, LONG, ROLE, QUAY, \
-    CALN, UnexpectedTag, PAGE, FAMS, ANCE, DESC
+    CALN, UnexpectedTag, PAGE, FAMS, ANCE, DESC, compact_tree
+from gedcom5.tokenizer import LEVEL, LINE, invalid_line, tokenize
 
 
 class UnexpectedLine(RuntimeError):
@@ -17,6 +32,31 @@ class UnexpectedLine(RuntimeError):
         self.line_num = line_num
 
 
+class CollectorPause:
+    """Keeps the cyclic garbage collector disabled while any parse that defers it is building"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.holds = 0
+        self.restore = False
+
+    def acquire(self):
+        with self.lock:
+            if self.holds == 0:
+                self.restore = gc.isenabled()
+                gc.disable()
+            self.holds += 1
+
+    def release(self):
+        with self.lock:
+            self.holds -= 1
+            if self.holds == 0 and self.restore:
+                gc.enable()
+
+
+COLLECTOR = CollectorPause()
+
+
 class ParseError(RuntimeError):
     def __init__(
         self,
@@ -33,6 +73,27 @@ class ParseError(RuntimeError):
         self.parent = parent
 
 
+class ParseAborted(ParseError):
+    def __init__(
+        self,
+        msg,
+        reason: str,
+        line_num: int,
+        records: int,
+        tags: int,
+        bytes_read: int,
+        elapsed: float,
+        gedcom: GEDCOM
+    ):
+        ParseError.__init__(self, msg, line_num=line_num)
+        self.reason = reason
+        self.records = records
+        self.tags = tags
+        self.bytes_read = bytes_read
+        self.elapsed = elapsed
+        self.gedcom = gedcom
+
+
 class GEDCOM5Parser:
 
     _tags = {
@@ -174,50 +235,444 @@ class GEDCOM5Parser:
         'DESC': DESC,
     }
 
-    def parse_string(self, doc: str, strict=False) -> GEDCOM:
+    def __init__(self, intern_values=False, weak_parents=False, defer_gc=False, compact=False):
+        self.intern_values = intern_values
+        self.weak_parents = weak_parents
+        self.defer_gc = defer_gc
+        self.compact = compact
+
+    def parse_string(
+        self, doc: str, strict=False, stats: Optional[ParseStats] = None,
+        progress: Optional[Callable[[Progress], None]] = None, progress_every: int = PROGRESS_EVERY,
+        limits: Optional[ParseLimits] = None, recover=False
+    ) -> GEDCOM:
+        return self.parse_lines(
+            doc.splitlines(), strict=strict, stats=stats, progress=progress, progress_every=progress_every,
+            limits=limits, recover=recover
+        )
+
+    def parse_lines(
+        self, lines: Iterable[str], strict=False, stats: Optional[ParseStats] = None,
+        progress: Optional[Callable[[Progress], None]] = None, progress_every: int = PROGRESS_EVERY,
+        limits: Optional[ParseLimits] = None, recover=False
+    ) -> GEDCOM:
+        reporter = ProgressReporter(progress, progress_every) if progress is not None else None
+        guard = limits.guard() if limits is not None else None
+        return self._parse(lines, strict=strict, stats=stats, reporter=reporter, guard=guard, recover=recover)
+
+    def _parse(
+        self, lines: Iterable[str], strict=False, stats: Optional[ParseStats] = None,
+        reporter: Optional[ProgressReporter] = None, guard: Optional[LimitGuard] = None, recover=False
+    ) -> GEDCOM:
+        start = perf_counter()
+        builder = TreeBuilder(
+            self._tags, GEDCOM(), strict=strict, stats=stats, guard=guard, recover=recover,
+            intern_values=self.intern_values, weak_parents=self.weak_parents, defer_gc=self.defer_gc,
+            compact=self.compact
+        )
+        builder.feed(self._wrap(lines, builder.gedcom, reporter, guard))
+        return self._finish(builder, reporter, start)
+
+    @staticmethod
+    def _wrap(
+        lines: Iterable[str], gedcom: GEDCOM, reporter: Optional[ProgressReporter], guard: Optional[LimitGuard]
+    ) -> Iterable[str]:
+        if guard is not None:
+            lines = guard.wrap(lines)
+        if reporter is not None:
+            lines = reporter.wrap(lines, gedcom)
+        return lines
+
+    @staticmethod
+    def _finish(builder: 'TreeBuilder', reporter: Optional[ProgressReporter], start: float) -> GEDCOM:
+        gedcom = builder.gedcom
+        stats = builder.stats
+        builder.finish()
+        if reporter is not None:
+            reporter.done(gedcom)
+        if stats is None:
+            builder.resolve()
+            return gedcom
+        stats.lines = builder.line_num
+        resolve_start = perf_counter()
+        builder.resolve()
+        stats.add('resolve', perf_counter() - resolve_start)
+        stats.add('total', perf_counter() - start)
+        return gedcom
+
+    def _build(self, gedcom: GEDCOM, lines: Iterable[str], strict=False, line_num=0) -> int:
+        builder = TreeBuilder(
+            self._tags, gedcom, strict=strict, line_num=line_num, intern_values=self.intern_values,
+            weak_parents=self.weak_parents, defer_gc=self.defer_gc, compact=self.compact
+        )
+        builder.feed(lines)
+        builder.finish()
+        return builder.line_num
+
+    def parse_stream(
+        self, fp: BinaryIO, strict=False, encoding: Optional[str] = None, stats: Optional[ParseStats] = None,
+        progress: Optional[Callable[[Progress], None]] = None, progress_every: int = PROGRESS_EVERY,
+        limits: Optional[ParseLimits] = None, recover=False
+    ) -> GEDCOM:
+        reporter = ProgressReporter(progress, progress_every, fp=fp) if progress is not None else None
+        guard = limits.guard(fp) if limits is not None else None
+        return self._parse(
+            iter_lines(fp, encoding=encoding, guard=guard, errors=_errors(recover)), strict=strict, stats=stats,
+            reporter=reporter, guard=guard, recover=recover
+        )
+
+    def parse_path(
+        self, path: str, strict=False, encoding: Optional[str] = None, stats: Optional[ParseStats] = None,
+        progress: Optional[Callable[[Progress], None]] = None, progress_every: int = PROGRESS_EVERY,
+        limits: Optional[ParseLimits] = None, recover=False
+    ) -> GEDCOM:
+        with open(path, 'rb') as fp:
+            return self.parse_stream(
+                fp, strict=strict, encoding=encoding, stats=stats, progress=progress, progress_every=progress_every,
+                limits=limits, recover=recover
+            )
+
+    async def parse_async(
+        self, source: Union[AsyncIterable[bytes], 'asyncio.StreamReader'], strict=False,
+        encoding: Optional[str] = None, stats: Optional[ParseStats] = None,
+        progress: Optional[Callable[[Progress], None]] = None, progress_every: int = PROGRESS_EVERY,
+        limits: Optional[ParseLimits] = None, chunk_size: int = CHUNK_SIZE, total_bytes: Optional[int] = None,
+        recover=False
+    ) -> GEDCOM:
+        bytes_read = 0
+
+        def position() -> int:
+            return bytes_read
+
+        reporter = None
+        if progress is not None:
+            reporter = ProgressReporter(progress, progress_every, position=position, total_bytes=total_bytes)
+        guard = limits.guard(position=position) if limits is not None else None
+        start = perf_counter()
+        builder = TreeBuilder(
+            self._tags, GEDCOM(), strict=strict, stats=stats, guard=guard, recover=recover,
+            intern_values=self.intern_values, weak_parents=self.weak_parents, defer_gc=self.defer_gc,
+            compact=self.compact
+        )
+        decoder = LineDecoder(encoding, guard=guard, errors=_errors(recover))
+        async for chunk in _read_chunks(source, chunk_size):
+            bytes_read += len(chunk)
+            try:
+                lines = decoder.feed(chunk)
+            except LimitExceeded as ex:
+                raise builder.aborted(ex)
+            except UndecodableLine as ex:
+                raise _undecodable(ex)
+            builder.feed(self._wrap(lines, builder.gedcom, reporter, guard))
+            await asyncio.sleep(0)
+        try:
+            lines = decoder.finish()
+        except UndecodableLine as ex:
+            raise _undecodable(ex)
+        builder.feed(self._wrap(lines, builder.gedcom, reporter, guard))
+        return self._finish(builder, reporter, start)
+
+    def reparse_lines(
+        self, lines: Iterable[str], previous: GEDCOM, hashes: Optional[Dict[str, str]] = None, strict=False
+    ) -> GEDCOM:
+        """Parse ``lines`` reusing the unchanged records of ``previous``.
+
+        Reused records are moved, so ``previous`` is consumed and left empty.
+        """
+        if hashes is None:
+            hashes = previous.hashes or record_hashes(previous)
+        seen = dict()
+        old = {record_key(record.xref_id, record.tag, seen): record for record in previous}
+        gedcom = GEDCOM()
+        reused = set()
+        seen = dict()
         line_num = 0
+        for record_lines in split_records(lines):
+            tokens = tokenize(record_lines[0])
+            key = record_key(tokens[1], tokens[2], seen) if tokens is not None else f'#{line_num}'
+            digest = record_digest(record_lines)
+            gedcom.hashes[key] = digest
+            record = old.get(key)
+            if record is not None and id(record) not in reused and hashes.get(key) == digest:
+                record.parent = gedcom
+                gedcom.append(record, strict=strict)
+                reused.add(id(record))
+                line_num += len(record_lines)
+            else:
+                line_num = self._build(gedcom, record_lines, strict=strict, line_num=line_num)
+        changed = {record.xref_id for record in previous if id(record) not in reused}
+        for item in previous._to_resolve:
+            record = item
+            while record.level > 0:
+                record = record.parent
+            if id(record) in reused:
+                if item.value in changed:
+                    item.ref = item.value
+                gedcom.register(item)
+        GEDCOM.__init__(previous)
+        gedcom.resolve(strict=strict)
+        return gedcom
+
+    def reparse_string(
+        self, doc: str, previous: GEDCOM, hashes: Optional[Dict[str, str]] = None, strict=False
+    ) -> GEDCOM:
+        return self.reparse_lines(doc.splitlines(), previous, hashes=hashes, strict=strict)
+
+    def reparse_path(
+        self, path: str, previous: GEDCOM, hashes: Optional[Dict[str, str]] = None, strict=False,
+        encoding: Optional[str] = None
+    ) -> GEDCOM:
+        with open(path, 'rb') as fp:
+            return self.reparse_lines(iter_lines(fp, encoding=encoding), previous, hashes=hashes, strict=strict)
+
+
+class TreeBuilder:
+    def __init__(
+        self, tags: Dict[str, Type[Tag]], gedcom: GEDCOM, strict=False, line_num=0,
+        stats: Optional[ParseStats] = None, guard: Optional[LimitGuard] = None, recover=False, intern_values=False,
+        weak_parents=False, defer_gc=False, compact=False
+    ):
+        self.gedcom = gedcom
+        self.strict = strict
+        self.recover = recover
+        self.intern_values = intern_values
+        self.weak_parents = weak_parents
+        self.defer_gc = defer_gc
+        self.compact = compact
+        self.strings: Dict[str, str] = dict()
+        self.pointers: List[Tuple[Tag, int, Optional[str], str]] = []
+        self.line_num = line_num
+        self.count = 0
+        self.stack = [gedcom]
+        self.stats = stats
+        self.guard = guard
+        self.tags = tags
+        self.unknown = Tag
+        self.line_match = LINE.fullmatch
+        self.max_depth = self.max_tags = sys.maxsize
+        if stats is not None:
+            self.line_match = stats.timed(self.line_match, 'tokenize')
+            self.tags = stats.factories(tags)
+            self.unknown = stats.unknown()
+        if guard is not None:
+            self.max_depth = guard.max_depth
+            self.max_tags = guard.max_tags
+
+    def feed(self, lines: Iterable[str]):
+        start = None
+        if self.stats is not None:
+            lines = self.stats.timed_iter(lines, 'read')
+            start = perf_counter()
+        defer_gc = self.defer_gc
+        if defer_gc:
+            COLLECTOR.acquire()
+        try:
+            if self.recover:
+                self._feed_recover(lines)
+            else:
+                self._feed(lines)
+        except UnexpectedLine as ex:
+            msg = f'Error at line {self.line_num}.\n{ex.line}\n{str(ex)}'
+            raise ParseError(msg, line_num=self.line_num, line=ex.line)
+        except UnexpectedTag as ex:
+            msg = f'Error at line {self.line_num}.\nUnexpected tag {ex.tag} in {ex.parent}'
+            raise ParseError(msg, line_num=self.line_num, tag=ex.tag, parent=ex.parent)
+        except UndecodableLine as ex:
+            raise _undecodable(ex)
+        except LimitExceeded as ex:
+            raise self.aborted(ex)
+        finally:
+            if defer_gc:
+                COLLECTOR.release()
+            if start is not None:
+                self.stats.add('build', perf_counter() - start)
+
+    def aborted(self, ex: LimitExceeded) -> 'ParseAborted':
+        msg = f'{str(ex)} at line {self.line_num}'
+        return ParseAborted(
+            msg, reason=ex.reason, line_num=self.line_num, records=len(self.gedcom), tags=self.count,
+            bytes_read=self.guard.bytes_read, elapsed=self.guard.elapsed, gedcom=self.gedcom
+        )
+
+    def resolve(self):
+        """Resolve pointers; in recover mode each dangling pointer is reported rather than raised"""
+        if not self.recover:
+            self.gedcom.resolve(strict=self.strict)
+            return
+        self.gedcom.resolve()
+        for entry, line_num, xref, line in self.pointers:
+            if isinstance(entry.ref, str):
+                message = f'Pointer {entry.ref} has no matching record'
+                self.gedcom.diagnostics.append(Diagnostic(line_num, DANGLING_POINTER, message, xref=xref, line=line))
+
+    def finish(self):
+        """Compact the last record once no more lines will be fed"""
+        if self.compact and len(self.stack) > 1:
+            compact_tree(self.stack[1])
+
+    def _feed(self, lines: Iterable[str]):
+        gedcom = self.gedcom
+        strict = self.strict
+        stack = self.stack
+        tags = self.tags
+        unknown = self.unknown
+        line_match = self.line_match
+        max_depth = self.max_depth
+        max_tags = self.max_tags
+        intern_values = self.intern_values
+        intern = self.strings.setdefault
+        weak_parents = self.weak_parents
+        compact = self.compact
+        line_num = self.line_num
+        count = self.count
         try:
-            gedcom = GEDCOM()
-            stack = [gedcom]
-            for line in doc.splitlines():
+            for line in lines:
                 line_num += 1
-                if line.startswith('\ufeff'):
-                    line = line[1:]
-                tokens = line.lstrip().split(' ')
-                if not tokens[0].isdigit():
-                    raise UnexpectedLine(line, line_num, 'First field is not a number')
-                level = int(tokens[0])
-                tokens = tokens[1:]
-                xref_id = tokens[0] if tokens[0].startswith('@') and tokens[0].endswith('@') else None
-                if xref_id:
-                    tokens = tokens[1:]
-                tag = tokens[0]
-                tokens = tokens[1:]
-                value = ' '.join(tokens) if tokens else None
+                match = line_match(line)
+                if match is None:
+                    raise UnexpectedLine(line, line_num, invalid_line(line))
+                level, xref_id, tag, value = match.groups()
+                level = int(level)
+                count += 1
+                if xref_id is not None:
+                    xref_id = intern(xref_id, xref_id)
+                if value is not None and (intern_values or value[:1] == '@'):
+                    value = intern(value, value)
+                if level > max_depth:
+                    raise LimitExceeded('max_depth', max_depth)
+                if count > max_tags:
+                    raise LimitExceeded('max_tags', max_tags)
+                if compact and level == 0 and len(stack) > 1:
+                    compact_tree(stack[1])
                 while stack[-1].level >= level:
                     stack.pop()
-                if tag in self._tags:
-                    entry = self._tags[tag](level=level, parent=stack[-1], xref_id=xref_id, value=value)
+                if tag in tags:
+                    entry = tags[tag](level=level, parent=stack[-1], xref_id=xref_id, value=value)
                 elif strict:
                     raise UnexpectedLine(line, line_num, 'Unknown tag')
                 else:
-                    entry = Tag(level=level, parent=stack[-1], xref_id=xref_id, tag=tag, value=value)
+                    entry = unknown(level=level, parent=stack[-1], xref_id=xref_id, tag=intern(tag, tag), value=value)
+                if weak_parents:
+                    entry._parent = weakref.ref(stack[-1])
                 stack[-1].append(entry, strict=strict)
                 stack.append(entry)
                 gedcom.register(entry)
-            gedcom.resolve(strict=strict)
-            return gedcom
-        except UnexpectedLine as ex:
-            msg = f'Error at line {line_num}.\n{ex.line}\n{str(ex)}'
-            raise ParseError(msg, line_num=line_num, line=ex.line)
-        except UnexpectedTag as ex:
-            msg = f'Error at line {line_num}.\nUnexpected tag {ex.tag} in {ex.parent}'
-            raise ParseError(msg, line_num=line_num, tag=ex.tag, parent=ex.parent)
+        finally:
+            self.line_num = line_num
+            self.count = count
 
-    def parse_stream(self, fp: BinaryIO, strict=False) -> GEDCOM:
-        doc = fp.read().decode('utf-8')
-        return self.parse_string(doc, strict=strict)
+    def _feed_recover(self, lines: Iterable[str]):
+        gedcom = self.gedcom
+        stack = self.stack
+        tags = self.tags
+        unknown = self.unknown
+        line_match = self.line_match
+        max_depth = self.max_depth
+        max_tags = self.max_tags
+        report = self._report
+        intern_values = self.intern_values
+        intern = self.strings.setdefault
+        weak_parents = self.weak_parents
+        compact = self.compact
+        line_num = self.line_num
+        count = self.count
+        try:
+            for line in lines:
+                line_num += 1
+                if line.endswith('\r'):
+                    report(line_num, STRAY_CR, 'Stray carriage return removed', line)
+                    line = line.rstrip('\r')
+                if '\ufffd' in line:
+                    report(line_num, UNDECODABLE, 'Undecodable bytes replaced with U+FFFD', line)
+                if not line.strip('\ufeff \t\r\n'):
+                    report(line_num, BLANK_LINE, 'Blank line skipped', line)
+                    continue
+                match = line_match(line)
+                if match is None:
+                    if LEVEL.match(line) is not None:
+                        report(line_num, MISSING_TAG, 'Line without a tag skipped', line)
+                        continue
+                    target = stack[-1]
+                    if isinstance(target, (CONT, CONC)):
+                        target = target.parent
+                    if target is gedcom:
+                        report(line_num, MISSING_LEVEL, 'Line without a level skipped', line)
+                        continue
+                    report(line_num, MISSING_LEVEL, f'Line without a level kept as CONT of {target.tag}', line)
+                    count += 1
+                    while stack[-1] is not target:
+                        stack.pop()
+                    entry = CONT(level=target.level + 1, parent=target, value=line.strip())
+                    if weak_parents:
+                        entry._parent = weakref.ref(target)
+                    target.append(entry)
+                    stack.append(entry)
+                    continue
+                level, xref_id, tag, value = match.groups()
+                level = int(level)
+                count += 1
+                if level > max_depth:
+                    raise LimitExceeded('max_depth', max_depth)
+                if count > max_tags:
+                    raise LimitExceeded('max_tags', max_tags)
+                if compact and level == 0 and len(stack) > 1:
+                    compact_tree(stack[1])
+                while stack[-1].level >= level:
+                    stack.pop()
+                if xref_id is not None:
+                    xref_id = intern(xref_id, xref_id)
+                if value is not None and (intern_values or value[:1] == '@'):
+                    value = intern(value, value)
+                if level > stack[-1].level + 1:
+                    report(line_num, LEVEL_JUMP, f'Level {level} lowered to {stack[-1].level + 1}', line)
+                    level = stack[-1].level + 1
+                if tag in tags:
+                    entry = tags[tag](level=level, parent=stack[-1], xref_id=xref_id, value=value)
+                    if weak_parents:
+                        entry._parent = weakref.ref(stack[-1])
+                    try:
+                        stack[-1].append(entry, strict=True)
+                    except UnexpectedTag:
+                        report(line_num, UNEXPECTED_TAG, f'Unexpected tag {tag} in {stack[-1].tag}', line, entry)
+                else:
+                    entry = unknown(level=level, parent=stack[-1], xref_id=xref_id, tag=intern(tag, tag), value=value)
+                    if weak_parents:
+                        entry._parent = weakref.ref(stack[-1])
+                    if not tag.startswith('_') and not (level == 0 and tag == 'TRLR'):
+                        report(line_num, UNKNOWN_TAG, f'Unknown tag {tag}', line, entry)
+                    stack[-1].append(entry)
+                stack.append(entry)
+                gedcom.register(entry)
+                if entry.ref is not None:
+                    self.pointers.append((entry, line_num, stack[1].xref_id, line))
+        finally:
+            self.line_num = line_num
+            self.count = count
 
-    def parse_path(self, path: str, strict=False) -> GEDCOM:
-        with open(path, 'rb') as fp:
-            return self.parse_stream(fp, strict=strict)
+    def _report(self, line_num: int, code: str, message: str, line: str, entry: Optional[Tag] = None):
+        record = self.stack[1] if len(self.stack) > 1 else entry
+        xref = record.xref_id if record is not None else None
+        self.gedcom.diagnostics.append(Diagnostic(line_num, code, message, xref=xref, line=line))
+
+
+def _errors(recover: bool) -> str:
+    return 'replace' if recover else 'strict'
+
+
+def _undecodable(ex: UndecodableLine) -> ParseError:
+    msg = f'Error at line {ex.line_num}.\n{ex.line}\n{str(ex)}'
+    return ParseError(msg, line_num=ex.line_num, line=ex.line)
+
+
+async def _read_chunks(
+    source: Union[AsyncIterable[bytes], 'asyncio.StreamReader'], chunk_size: int
+) -> AsyncIterator[bytes]:
+    if hasattr(source, 'read'):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
@@ -0,0 +1,143 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from gedcom5.diff import Change, records
+from gedcom5.gedcom import GEDCOM
+from gedcom5.parser import GEDCOM5Parser, ParseError
+from gedcom5.tag import Tag, UnexpectedTag
+
+_SEGMENT = re.compile(r'([^.\[\]]+)\[([0-9]+)\]')
+
+
+class PatchError(RuntimeError):
+    def __init__(self, change: Change, reason: str):
+        super().__init__(f'Cannot apply {change.op} to {change.xref} {change.path}: {reason}')
+        self.change = change
+
+
+def resolve_path(record: Tag, path: str) -> Optional[Tag]:
+    node = record
+    if not path:
+        return node
+    for segment in path.split('.'):
+        match = _SEGMENT.fullmatch(segment)
+        if match is None:
+            return None
+        tag, index = match.group(1), int(match.group(2))
+        found = [item for item in node if item.tag == tag]
+        if index >= len(found):
+            return None
+        node = found[index]
+    return node
+
+
+def apply(
+    gedcom: GEDCOM, changes: Iterable[Change], strict=False, parser: Optional[GEDCOM5Parser] = None
+) -> GEDCOM:
+    """Apply ``changes`` to ``gedcom`` as one batch: every change is checked before the tree is touched"""
+    parser = parser or GEDCOM5Parser()
+    by_key = records(gedcom)
+    targets: List[Tuple[Change, Optional[Tag], List[Tag]]] = []
+    for change in changes:
+        if change.op not in _OPS:
+            raise PatchError(change, 'unknown operation')
+        if change.op == 'add_record':
+            holder = GEDCOM()
+            try:
+                parser._build(holder, change.text, strict=strict)
+            except ParseError as ex:
+                raise PatchError(change, str(ex))
+            targets.append((change, None, holder._items))
+            continue
+        record = by_key.get(change.xref)
+        if record is None:
+            raise PatchError(change, 'record not found')
+        node = resolve_path(record, change.path)
+        if node is None:
+            raise PatchError(change, 'path not found')
+        items = _parse(parser, change.text) if change.op == 'add' else []
+        if strict:
+            _check(change, node, items)
+        targets.append((change, node, items))
+    try:
+        _change(gedcom, targets, strict)
+    except BaseException:
+        gedcom.reindex()
+        raise
+    gedcom.reindex(strict=strict)
+    return gedcom
+
+
+_OPS = ('replace', 'add', 'remove', 'renumber', 'add_record', 'remove_record')
+
+
+def _change(gedcom: GEDCOM, targets: List[Tuple[Change, Optional[Tag], List[Tag]]], strict=False):
+    dirty: Dict[int, Tag] = dict()
+    for change, node, items in targets:
+        if change.op == 'replace':
+            node.value = change.new
+            dirty[id(node)] = node
+            dirty[id(node.parent)] = node.parent
+        elif change.op == 'add':
+            for item in items:
+                item.parent = node
+                node.append(item)
+        elif change.op == 'remove':
+            _remove(node.parent, node)
+            dirty[id(node.parent)] = node.parent
+        elif change.op == 'renumber':
+            node.xref_id = change.new
+        elif change.op == 'add_record':
+            for item in items:
+                item.parent = gedcom
+                gedcom.append(item)
+        elif change.op == 'remove_record':
+            _remove(gedcom, node)
+    for node in dirty.values():
+        if isinstance(node, Tag):
+            _rebuild(node, strict)
+
+
+def _parse(parser: GEDCOM5Parser, lines: List[str]) -> List[Tag]:
+    holder = GEDCOM()
+    parser._build(holder, lines)
+    return holder._items
+
+
+def _check(change: Change, node: Tag, items: List[Tag]):
+    """Raise ``PatchError`` unless ``items`` and everything under them may be attached to ``node`` strictly"""
+    probe = _blank(node)
+    try:
+        for item in items:
+            item.parent = node
+            probe.append(item, strict=True)
+            pending = [item]
+            while pending:
+                child = pending.pop()
+                _rebuild(child, strict=True)
+                pending.extend(child._items)
+    except UnexpectedTag as ex:
+        raise PatchError(change, str(ex))
+
+
+def _remove(parent, node: Tag):
+    items = parent._items
+    for index, item in enumerate(items):
+        if item is node:
+            del items[index]
+            return
+
+
+def _rebuild(node: Tag, strict=False):
+    items = node._items
+    fresh = _blank(node)
+    node.__dict__.clear()
+    node.__dict__.update(fresh.__dict__)
+    for item in items:
+        node.append(item, strict=strict)
+
+
+def _blank(node: Tag) -> Tag:
+    if type(node) is Tag:
+        return Tag(level=node.level, parent=node.parent, xref_id=node.xref_id, tag=node.tag, value=node.value)
+    return type(node)(level=node.level, parent=node.parent, xref_id=node.xref_id, value=node.value)
@@ -0,0 +1,139 @@
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from gedcom5.tag import Tag, PLAC
+
+if TYPE_CHECKING:
+    from gedcom5.gedcom import GEDCOM
+
+
+def place_form(gedcom: 'GEDCOM') -> List[str]:
+    """Jurisdiction names from HEAD.PLAC.FORM, smallest first, e.g. ``['City', 'County', 'State', 'Country']``."""
+    form = gedcom.find_first('HEAD.PLAC.FORM')
+    return split_place(form.value) if form is not None and form.value else []
+
+
+def split_place(value: str) -> List[str]:
+    return [part.strip() for part in value.split(',')]
+
+
+def place_key(name: str) -> str:
+    return ' '.join(name.casefold().split())
+
+
+def places(gedcom: 'GEDCOM') -> Iterator[PLAC]:
+    """Every PLAC with a value outside the header, in file order."""
+    for record in gedcom:
+        if record.tag == 'HEAD':
+            continue
+        pending = [record]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, PLAC):
+                if item.value:
+                    yield item
+            else:
+                pending.extend(reversed(item._items))
+
+
+class Place:
+    """A jurisdiction in the place hierarchy.
+
+    ``events`` holds the tags (usually events) whose PLAC names exactly this place and ``count`` the number of
+    events here and in every place below.
+    """
+
+    def __init__(self, name: str, jurisdiction: Optional[str] = None, parent: Optional['Place'] = None):
+        self.name = name
+        self.jurisdiction = jurisdiction
+        self.parent = parent
+        self.children: Dict[str, Place] = dict()
+        self.events: List[Tag] = []
+        self.count = 0
+
+    def __repr__(self):
+        return f'Place({", ".join(reversed(self.path))!r})'
+
+    def __iter__(self) -> Iterator['Place']:
+        pending = [self]
+        while pending:
+            place = pending.pop()
+            yield place
+            pending.extend(reversed(list(place.children.values())))
+
+    @property
+    def path(self) -> List[str]:
+        """Names from the largest jurisdiction down to this place."""
+        out = []
+        place = self
+        while place.parent is not None:
+            out.append(place.name)
+            place = place.parent
+        return list(reversed(out))
+
+    def all_events(self) -> List[Tag]:
+        return [event for place in self for event in place.events]
+
+
+class PlaceIndex:
+    def __init__(self, gedcom: Optional['GEDCOM'] = None, form: Optional[List[str]] = None):
+        self.root = Place('')
+        self.form = form if form is not None else place_form(gedcom) if gedcom is not None else []
+        self._by_name: Dict[str, List[Place]] = dict()
+        self._by_value: Dict[str, Place] = dict()
+        if gedcom is not None:
+            for plac in places(gedcom):
+                self.add(plac)
+
+    def add(self, plac: PLAC):
+        form = split_place(plac.form.value) if plac.form is not None and plac.form.value else None
+        place = self.place(plac.value, form)
+        place.events.append(plac.parent)
+        while place is not None:
+            place.count += 1
+            place = place.parent
+
+    def place(self, value: str, form: Optional[List[str]] = None) -> Place:
+        """The node for a PLAC value, creating it and its parents on first sight."""
+        if form is None:
+            place = self._by_value.get(value)
+            if place is not None:
+                return place
+        jurisdictions = form if form is not None else self.form
+        parts = split_place(value)
+        place = self.root
+        for n in range(len(parts) - 1, -1, -1):
+            name = parts[n]
+            if not name:
+                continue
+            key = place_key(name)
+            child = place.children.get(key)
+            if child is None:
+                jurisdiction = jurisdictions[n] if n < len(jurisdictions) else None
+                child = Place(name, jurisdiction, place)
+                place.children[key] = child
+                self._by_name.setdefault(key, []).append(child)
+            place = child
+        if form is None:
+            self._by_value[value] = place
+        return place
+
+    def get(self, *names: str) -> Optional[Place]:
+        """Follow names from the largest jurisdiction down, e.g. ``get('England', 'Yorkshire')``."""
+        place = self.root
+        for name in names:
+            place = place.children.get(place_key(name))
+            if place is None:
+                return None
+        return place
+
+    def find(self, name: str, jurisdiction: Optional[str] = None) -> List[Place]:
+        """Every place with this name anywhere in the hierarchy, optionally of one jurisdiction type."""
+        found = self._by_name.get(place_key(name), [])
+        if jurisdiction is None:
+            return list(found)
+        return [place for place in found if place.jurisdiction is not None and
+                place_key(place.jurisdiction) == place_key(jurisdiction)]
+
+    def events(self, name: str, jurisdiction: Optional[str] = None) -> List[Tag]:
+        """Events placed in, or anywhere below, every place with this name."""
+        return [event for place in self.find(name, jurisdiction) for event in place.all_events()]
@@ -0,0 +1,79 @@
+import os
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+from gedcom5.gedcom import GEDCOM
+
+PROGRESS_EVERY = 10000
+
+
+class Progress:
+    def __init__(self, lines: int, records: int, bytes_read: Optional[int] = None, total_bytes: Optional[int] = None):
+        self.lines = lines
+        self.records = records
+        self.bytes_read = bytes_read
+        self.total_bytes = total_bytes
+
+    def __repr__(self):
+        return f'Progress(lines={self.lines}, records={self.records}, bytes_read={self.bytes_read}, ' \
+               f'total_bytes={self.total_bytes})'
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if self.bytes_read is None or not self.total_bytes:
+            return None
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+
+class ProgressReporter:
+    def __init__(
+        self, callback: Callable[[Progress], None], every: int = PROGRESS_EVERY, fp: Optional[BinaryIO] = None,
+        position: Optional[Callable[[], Optional[int]]] = None, total_bytes: Optional[int] = None
+    ):
+        self.callback = callback
+        self.every = max(every, 1)
+        self.fp = fp
+        self._position = position
+        self.total_bytes = stream_size(fp) if fp is not None else total_bytes
+        self.lines = 0
+
+    def position(self) -> Optional[int]:
+        if self._position is not None:
+            return self._position()
+        if self.fp is None:
+            return None
+        try:
+            return self.fp.tell()
+        except (OSError, ValueError):
+            return None
+
+    def wrap(self, lines: Iterable[str], gedcom: GEDCOM) -> Iterator[str]:
+        iterator = iter(lines)
+        every = self.every
+        while True:
+            batch = list(islice(iterator, every - self.lines % every))
+            if not batch:
+                return
+            yield from batch
+            self.lines += len(batch)
+            if self.lines % every == 0:
+                self.callback(Progress(self.lines, max(len(gedcom) - 1, 0), self.position(), self.total_bytes))
+
+    def done(self, gedcom: GEDCOM):
+        self.callback(Progress(self.lines, len(gedcom), self.position(), self.total_bytes))
+
+
+def stream_size(fp: BinaryIO) -> Optional[int]:
+    try:
+        return os.fstat(fp.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        if fp.seekable():
+            position = fp.tell()
+            size = fp.seek(0, os.SEEK_END)
+            fp.seek(position)
+            return size
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
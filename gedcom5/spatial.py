@@ -0,0 +1,96 @@
+from math import asin, cos, floor, radians, sin, sqrt
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from gedcom5.places import places
+from gedcom5.tag import Tag
+
+if TYPE_CHECKING:
+    from gedcom5.gedcom import GEDCOM
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195
+CELL_DEGREES = 1.0
+
+Point = Tuple[float, float, Tag]
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great circle (haversine) distance."""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+class SpatialIndex:
+    """A fixed grid over latitude/longitude holding the events whose PLAC has MAP coordinates."""
+
+    def __init__(self, gedcom: Optional['GEDCOM'] = None, cell_degrees: float = CELL_DEGREES):
+        self.cell_degrees = cell_degrees
+        self.cells: Dict[Tuple[int, int], List[Point]] = dict()
+        self.size = 0
+        if gedcom is not None:
+            for plac in places(gedcom):
+                coordinates = plac.map.coordinates if plac.map is not None else None
+                if coordinates is not None:
+                    self.add(coordinates[0], coordinates[1], plac.parent)
+
+    def __len__(self):
+        return self.size
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return floor(latitude / self.cell_degrees), floor(longitude / self.cell_degrees)
+
+    def add(self, latitude: float, longitude: float, event: Tag):
+        self.cells.setdefault(self._cell(latitude, longitude), []).append((latitude, longitude, event))
+        self.size += 1
+
+    def _points(self, south: float, west: float, north: float, east: float) -> Iterable[Point]:
+        south_cell, west_cell = self._cell(south, west)
+        north_cell, east_cell = self._cell(north, east)
+        span = (east_cell - west_cell + 1) * (north_cell - south_cell + 1)
+        if span > len(self.cells):
+            cells = [points for (row, column), points in self.cells.items()
+                     if south_cell <= row <= north_cell and west_cell <= column <= east_cell]
+        else:
+            cells = [self.cells.get((row, column), ()) for row in range(south_cell, north_cell + 1)
+                     for column in range(west_cell, east_cell + 1)]
+        for points in cells:
+            for point in points:
+                if south <= point[0] <= north and west <= point[1] <= east:
+                    yield point
+
+    def bbox(self, south: float, west: float, north: float, east: float) -> List[Tag]:
+        """Events inside the box; ``west > east`` means the box crosses the 180th meridian."""
+        if west > east:
+            points = list(self._points(south, west, north, 180.0)) + list(self._points(south, -180.0, north, east))
+        else:
+            points = list(self._points(south, west, north, east))
+        return [event for _, _, event in points]
+
+    def radius(self, latitude: float, longitude: float, km: float) -> List[Tuple[float, Tag]]:
+        """``(distance, event)`` pairs within ``km`` of the point, nearest first."""
+        dlat = km / KM_PER_DEGREE
+        south = max(-90.0, latitude - dlat)
+        north = min(90.0, latitude + dlat)
+        scale = cos(radians(max(abs(south), abs(north))))
+        if north >= 90.0 or south <= -90.0 or scale * 180.0 <= dlat:
+            boxes = [(-180.0, 180.0)]
+        else:
+            dlon = dlat / scale
+            west = longitude - dlon
+            east = longitude + dlon
+            if west < -180.0:
+                boxes = [(west + 360.0, 180.0), (-180.0, east)]
+            elif east > 180.0:
+                boxes = [(west, 180.0), (-180.0, east - 360.0)]
+            else:
+                boxes = [(west, east)]
+        out = []
+        for west, east in boxes:
+            for point_latitude, point_longitude, event in self._points(south, west, north, east):
+                distance = distance_km(latitude, longitude, point_latitude, point_longitude)
+                if distance <= km:
+                    out.append((distance, event))
+        out.sort(key=lambda item: item[0])
+        return out
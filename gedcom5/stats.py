@@ -0,0 +1,93 @@
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, Type, TypeVar
+
+from gedcom5.tag import Tag
+
+T = TypeVar('T')
+
+
+class ParseStats:
+    """Timings and counters collected by GEDCOM5Parser when passed as ``stats``"""
+
+    def __init__(self):
+        self.lines = 0
+        self.phases: Dict[str, float] = dict()
+        self.tag_counts: Dict[str, int] = dict()
+        self.tag_seconds: Dict[str, float] = dict()
+        self.unknown_tags: Dict[str, int] = dict()
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def timed_iter(self, iterable: Iterable[T], phase: str) -> Iterator[T]:
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += perf_counter() - start
+                    return
+                elapsed += perf_counter() - start
+                yield item
+        finally:
+            self.add(phase, elapsed)
+
+    def timed(self, func: Callable[..., T], phase: str) -> Callable[..., T]:
+        phases = self.phases
+        phases.setdefault(phase, 0.0)
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                phases[phase] += perf_counter() - start
+        return wrapper
+
+    def factory(self, cls: Type[Tag], name: str) -> Callable[..., Tag]:
+        counts = self.tag_counts
+        seconds = self.tag_seconds
+        counts.setdefault(name, 0)
+        seconds.setdefault(name, 0.0)
+
+        def wrapper(**kwargs):
+            start = perf_counter()
+            try:
+                return cls(**kwargs)
+            finally:
+                seconds[name] += perf_counter() - start
+                counts[name] += 1
+        return wrapper
+
+    def factories(self, tags: Dict[str, Type[Tag]]) -> Dict[str, Callable[..., Tag]]:
+        return {name: self.factory(cls, name) for name, cls in tags.items()}
+
+    def unknown(self) -> Callable[..., Tag]:
+        unknown_tags = self.unknown_tags
+        seconds = self.tag_seconds
+        seconds.setdefault('Tag', 0.0)
+
+        def wrapper(**kwargs):
+            start = perf_counter()
+            try:
+                return Tag(**kwargs)
+            finally:
+                seconds['Tag'] += perf_counter() - start
+                unknown_tags[kwargs['tag']] = unknown_tags.get(kwargs['tag'], 0) + 1
+        return wrapper
+
+    @property
+    def construct_seconds(self) -> float:
+        return sum(self.tag_seconds.values())
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            'lines': self.lines,
+            'phases': dict(self.phases, construct=self.construct_seconds),
+            'tag_counts': dict(self.tag_counts),
+            'tag_seconds': dict(self.tag_seconds),
+            'unknown_tags': dict(self.unknown_tags),
+        }
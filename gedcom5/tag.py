@@ -1,5 +1,6 @@
+import weakref
 from datetime import datetime
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Union, Dict, Tuple, Generator
 
 
 class UnexpectedTag(RuntimeError):
@@ -9,6 +10,24 @@ class UnexpectedTag(RuntimeError):
         self.parent = parent
 
 
+def parse_coordinate(value: Optional[str], positive: str, negative: str, limit: float) -> Optional[float]:
+    """Degrees from a MAP coordinate such as ``N51.5``; plain signed numbers are accepted too."""
+    if not value:
+        return None
+    value = value.strip().upper()
+    sign = 1.0
+    if value[:1] in (positive, negative):
+        sign = -1.0 if value[0] == negative else 1.0
+        value = value[1:]
+    try:
+        degrees = sign * float(value)
+    except ValueError:
+        return None
+    if degrees != degrees or abs(degrees) > limit:
+        return None
+    return degrees
+
+
 class Tag:
     """Base GEDCOM Tag representation"""
 
@@ -17,7 +36,7 @@ class Tag:
             xref_id: str = None, tag: str = None, value: str = None
     ):
         self.level = level
-        self.parent = parent
+        self._parent: Optional[Union['Tag', weakref.ref]] = parent
         self.xref_id = xref_id
         self.tag = tag
         self.ref: Optional[Union[str, 'Tag']] = None
@@ -27,6 +46,20 @@ class Tag:
         self.value = value
         self._items: List['Tag'] = []
 
+    @property
+    def parent(self) -> Optional['Tag']:
+        """The enclosing tag, or ``None`` once a weakly held parent has been freed"""
+        parent = self._parent
+        if type(parent) is weakref.ref:
+            return parent()
+        return parent
+
+    @parent.setter
+    def parent(self, parent: Optional['Tag']):
+        if type(self._parent) is weakref.ref and parent is not None:
+            parent = weakref.ref(parent)
+        self._parent = parent
+
     def __str__(self):
         out = f'{self.level}'
         if self.xref_id is not None:
@@ -73,6 +106,94 @@ class Tag:
         return default
 
 
+COMPACT_FIELDS: Dict[type, Dict[str, bool]] = dict()
+COMPACT_ROUTES: Dict[type, Dict[type, Optional[str]]] = dict()
+
+
+class CompactField:
+    """A typed attribute computed from the children of a tag that ``compact_tree`` has stripped it from"""
+
+    def __init__(self, name: str, many: bool):
+        self.name = name
+        self.many = many
+
+    def __get__(self, tag: Optional[Tag], owner: type = None):
+        if tag is None:
+            return self
+        tag_type = type(tag)
+        routes = COMPACT_ROUTES.get(tag_type)
+        if routes is None:
+            _fields(tag_type)
+            routes = COMPACT_ROUTES[tag_type]
+        name = self.name
+        items = []
+        for item in tag._items:
+            item_type = type(item)
+            if item_type not in routes:
+                routes[item_type] = _probe(tag_type(level=0, parent=None), item_type)
+            if routes[item_type] == name:
+                items.append(item)
+        if self.many:
+            return items
+        return items[-1] if len(items) > 0 else None
+
+
+def _probe(owner: Tag, item_type: type) -> Optional[str]:
+    """The typed attribute ``owner.append`` stores an ``item_type`` child in, if any"""
+    item = item_type(level=owner.level + 1, parent=None)
+    owner.append(item)
+    for name, value in vars(owner).items():
+        if name == '_items' or name == '_parent':
+            continue
+        if value is item or (type(value) is list and len(value) > 0 and value[-1] is item):
+            return name
+    return None
+
+
+def _fields(owner_type: type) -> Dict[str, bool]:
+    """Typed attributes of ``owner_type`` mapped to whether they hold a list"""
+    fields = COMPACT_FIELDS.get(owner_type)
+    if fields is None:
+        owner = owner_type(level=0, parent=None)
+        routes = COMPACT_ROUTES.setdefault(owner_type, dict())
+        fields = dict()
+        pending = [Tag]
+        while pending:
+            item_type = pending.pop()
+            pending.extend(item_type.__subclasses__())
+            if item_type not in routes:
+                routes[item_type] = name = _probe(owner, item_type)
+                if name is not None and not hasattr(owner_type, name):
+                    fields[name] = type(getattr(owner, name)) is list
+        for name, many in fields.items():
+            setattr(owner_type, name, CompactField(name, many))
+        COMPACT_FIELDS[owner_type] = fields
+    return fields
+
+
+def compact_tree(tag: Tag):
+    """Drop the typed attributes under ``tag``; they are then computed from the children on access"""
+    pending = [tag]
+    while pending:
+        node = pending.pop()
+        attrs = node.__dict__
+        for name in _fields(type(node)):
+            attrs.pop(name, None)
+        pending.extend(node._items)
+
+
+def expand_tree(tag: Tag):
+    """Store the typed attributes under a compacted ``tag`` again"""
+    pending = [tag]
+    while pending:
+        node = pending.pop()
+        attrs = node.__dict__
+        for name in _fields(type(node)):
+            if name not in attrs:
+                attrs[name] = getattr(node, name)
+        pending.extend(node._items)
+
+
 class AddressStructure:
     def __init__(self):
         self.addr: Optional[ADDR] = None
@@ -604,6 +725,63 @@ class SourceRepositoryCitation:
         return False
 
 
+class ContinuedText:
+    """Text held in a tag's value and continued over its CONT and CONC children"""
+
+    def __init__(self):
+        self._text_lines: Optional[List[str]] = None
+
+    @property
+    def value(self) -> Optional[str]:
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[str]):
+        self._value = value
+        self._text_lines = None
+
+    @property
+    def text_lines(self) -> List[str]:
+        """Lines of the text, CONC values joined onto the line before and each CONT starting a new line"""
+        if self._text_lines is None:
+            self._text_lines = continued_lines(self.value, self._items)
+        return list(self._text_lines)
+
+    @property
+    def full_text(self) -> str:
+        return '\n'.join(self.text_lines)
+
+
+class ContinuationLine:
+    """A CONT or CONC line; changing its value clears the text cached by its parent"""
+
+    @property
+    def value(self) -> Optional[str]:
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[str]):
+        self._value = value
+        parent = self.parent
+        if isinstance(parent, ContinuedText):
+            parent._text_lines = None
+
+
+def continued_lines(value: Optional[str], items: List[Tag]) -> List[str]:
+    lines: List[str] = []
+    parts = [value or '']
+    for item in items:
+        if isinstance(item, CONC):
+            parts.append(item.value or '')
+        elif isinstance(item, CONT):
+            lines.append(''.join(parts))
+            parts = [item.value or '']
+    line = ''.join(parts)
+    if len(line) > 0:
+        lines.append(line)
+    return lines
+
+
 class HEAD(Tag):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
@@ -663,13 +841,14 @@ class HEAD(Tag):
         return False
 
 
-class SOUR(Tag, SourceRepositoryCitation, ChangeDate, NoteStructure, MultimediaLink):
+class SOUR(Tag, SourceRepositoryCitation, ChangeDate, NoteStructure, MultimediaLink, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
         SourceRepositoryCitation.__init__(self)
         ChangeDate.__init__(self)
         NoteStructure.__init__(self)
         MultimediaLink.__init__(self)
+        ContinuedText.__init__(self)
         self.vers: Optional[VERS] = None
         self.name: Optional[NAME] = None
         self.corp: Optional[CORP] = None
@@ -688,6 +867,7 @@ class SOUR(Tag, SourceRepositoryCitation, ChangeDate, NoteStructure, MultimediaL
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, VERS):
             self.vers = item
             return True
@@ -985,13 +1165,15 @@ class DATE(Tag):
         return False
 
 
-class COPR(Tag):
+class COPR(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.lines: List[Union[CONT, CONC]] = []
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONT):
             self.lines.append(item)
             return True
@@ -1003,7 +1185,7 @@ class COPR(Tag):
         return False
 
 
-class CONT(Tag):
+class CONT(Tag, ContinuationLine):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
 
@@ -1014,7 +1196,7 @@ class CONT(Tag):
         return False
 
 
-class CONC(Tag):
+class CONC(Tag, ContinuationLine):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
 
@@ -1257,9 +1439,10 @@ class PLAC(Tag, NoteStructure):
             return NoteStructure.append(self, item, strict)
 
 
-class NOTE(Tag):
+class NOTE(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.lines: List[Union[CONT, CONC]] = []
         self.refn: List[REFN] = []
         self.rin: Optional[RIN] = None
@@ -1268,20 +1451,11 @@ class NOTE(Tag):
 
     @property
     def note(self) -> List[str]:
-        lines: List[str] = []
-        line = self.value or ''
-        for tag in self.lines:
-            if isinstance(tag, CONC):
-                line += tag.value
-            elif isinstance(tag, CONT):
-                lines.append(line)
-                line = tag.value
-        if len(line) > 0:
-            lines.append(line)
-        return lines
+        return self.text_lines
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONT):
             self.lines.append(item)
             return True
@@ -1491,7 +1665,33 @@ class INDI(
         self.refn: List[REFN] = []
         self.rin: Optional[RIN] = None
 
-    def is_private(self):
+    def is_private(self, seen: Optional[Dict[int, Optional[bool]]] = None):
+        if seen is None:
+            seen = dict()
+        key = id(self)
+        if key in seen:
+            return seen[key] is not False
+        seen[key] = None
+        stack = [(self, self._is_private())]
+        result = None
+        while stack:
+            indi, frame = stack[-1]
+            try:
+                parent = frame.send(result)
+            except StopIteration as stop:
+                stack.pop()
+                seen[id(indi)] = result = stop.value
+                continue
+            if id(parent) in seen:
+                result = seen[id(parent)] is not False
+            else:
+                seen[id(parent)] = None
+                stack.append((parent, parent._is_private()))
+                result = None
+        return seen[key]
+
+    def _is_private(self) -> Generator['INDI', bool, bool]:
+        """Yields each parent whose privacy is needed and is sent the answer, keeping deep ancestries off the stack"""
         year_minus_100 = datetime.now().year - 100
         year_minus_60 = year_minus_100 + 40
         year_minus_140 = year_minus_100 - 40
@@ -1505,14 +1705,14 @@ class INDI(
             for famc in self.famc:
                 if isinstance(famc.ref, FAM):
                     if famc.ref.husb is not None and isinstance(famc.ref.husb.ref, INDI):
-                        if famc.ref.husb.ref.is_private():
+                        if (yield famc.ref.husb.ref):
                             return True
                         if 0 < (famc.ref.husb.ref.birth_year or 0) <= year_minus_140:
                             return False
                         if 0 < (famc.ref.husb.ref.death_year or 0) <= year_minus_100:
                             return False
                     if famc.ref.wife is not None and isinstance(famc.ref.wife.ref, INDI):
-                        if famc.ref.wife.ref.is_private():
+                        if (yield famc.ref.wife.ref):
                             return True
                         if 0 < (famc.ref.wife.ref.birth_year or 0) <= year_minus_140:
                             return False
@@ -1726,14 +1926,16 @@ class OBJE(Tag, NoteStructure, SourceCitation, ChangeDate):
             return ChangeDate.append(self, item, strict)
 
 
-class TITL(Tag, IndividualEventDetail):
+class TITL(Tag, IndividualEventDetail, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
         IndividualEventDetail.__init__(self)
+        ContinuedText.__init__(self)
         self.text: List[Union[CONC, CONT]] = []
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONC):
             self.text.append(item)
             return True
@@ -1815,13 +2017,15 @@ class AGNC(Tag):
         return False
 
 
-class AUTH(Tag):
+class AUTH(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.text: List[Union[CONC, CONT]] = []
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONC):
             self.text.append(item)
             return True
@@ -1844,13 +2048,15 @@ class ABBR(Tag):
         return False
 
 
-class PUBL(Tag):
+class PUBL(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.text: List[Union[CONC, CONT]] = []
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONC):
             self.text.append(item)
             return True
@@ -1862,13 +2068,15 @@ class PUBL(Tag):
         return False
 
 
-class TEXT(Tag):
+class TEXT(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.lines: List[Union[CONT, CONC]] = []
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONT):
             self.lines.append(item)
             return True
@@ -1913,9 +2121,10 @@ class ORDI(Tag):
         return False
 
 
-class ADDR(Tag):
+class ADDR(Tag, ContinuedText):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
+        ContinuedText.__init__(self)
         self.cont: List[CONT] = []
         self.adr1: Optional[ADR1] = None
         self.adr2: Optional[ADR2] = None
@@ -1927,6 +2136,7 @@ class ADDR(Tag):
 
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
+        self._text_lines = None
         if isinstance(item, CONT):
             self.cont.append(item)
             return True
@@ -2960,6 +3170,22 @@ class MAP(Tag):
         self.lati: Optional[LATI] = None
         self.long: Optional[LONG] = None
 
+    @property
+    def latitude(self) -> Optional[float]:
+        return self.lati.degrees if self.lati is not None else None
+
+    @property
+    def longitude(self) -> Optional[float]:
+        return self.long.degrees if self.long is not None else None
+
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        latitude = self.latitude
+        longitude = self.longitude
+        if latitude is None or longitude is None:
+            return None
+        return latitude, longitude
+
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
         if isinstance(item, LATI):
@@ -2977,6 +3203,11 @@ class LATI(Tag):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
 
+    @property
+    def degrees(self) -> Optional[float]:
+        """``N51.5`` as 51.5 and ``S33.9`` as -33.9"""
+        return parse_coordinate(self.value, 'N', 'S', 90.0)
+
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
         if strict:
@@ -2988,6 +3219,11 @@ class LONG(Tag):
     def __init__(self, level: Optional[int] = 0, parent: Optional[Tag] = None, xref_id: str = None, value: str = None):
         Tag.__init__(self, level=level, parent=parent, xref_id=xref_id, tag=self.__class__.__name__, value=value)
 
+    @property
+    def degrees(self) -> Optional[float]:
+        """``E0.12`` as 0.12 and ``W0.12`` as -0.12"""
+        return parse_coordinate(self.value, 'E', 'W', 180.0)
+
     def append(self, item: Tag, strict=False):
         Tag.append(self, item)
         if strict:
@@ -0,0 +1,20 @@
+import re
+from typing import Optional, Tuple
+
+LINE = re.compile(r'[\ufeff\s]*([0-9]+) (?:(@[^ ]*@) )?([^ ]+)(?: (.*))?', re.DOTALL)
+RECORD = re.compile(r'[\ufeff\s]*0 ')
+LEVEL = re.compile(r'[\ufeff\s]*[0-9]+( |$)')
+
+
+def tokenize(line: str) -> Optional[Tuple[int, Optional[str], str, Optional[str]]]:
+    match = LINE.fullmatch(line)
+    if match is None:
+        return None
+    level, xref_id, tag, value = match.groups()
+    return int(level), xref_id, tag, value
+
+
+def invalid_line(line: str) -> str:
+    if LEVEL.match(line) is None:
+        return 'First field is not a number'
+    return 'Missing tag'
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from gedcom5.gedcom import GEDCOM
+from gedcom5.incremental import record_key
+from gedcom5.links import RECIPROCAL, asymmetry
+from gedcom5.tag import Tag, INDI
+
+ANY = '*'
+
+CARDINALITY = {
+    'HEAD': ('SOUR', 'DEST', 'DATE', 'SUBM', 'SUBN', 'FILE', 'COPR', 'GEDC', 'CHAR', 'LANG', 'PLAC', 'NOTE'),
+    'GEDC': ('VERS', 'FORM'),
+    'INDI': ('RESN', 'SEX', 'RFN', 'AFN', 'RIN', 'CHAN'),
+    'FAM': ('RESN', 'HUSB', 'WIFE', 'NCHI', 'RIN', 'CHAN'),
+}
+
+HEAD_REQUIRED = ('GEDC', 'GEDC.VERS', 'GEDC.FORM', 'CHAR')
+
+
+class UnknownRule(RuntimeError):
+    def __init__(self, name):
+        super().__init__(f'Unknown validation rule {name}')
+        self.name = name
+
+
+class Finding:
+    """A rule violation found by the validator.
+
+    ``xref`` and ``path`` locate the offending tag the same way as :class:`gedcom5.diff.Change`.
+    """
+
+    def __init__(self, rule: str, message: str, xref: Optional[str] = None, path: str = ''):
+        self.rule = rule
+        self.message = message
+        self.xref = xref
+        self.path = path
+
+    def __eq__(self, other):
+        return isinstance(other, Finding) and self.as_dict() == other.as_dict()
+
+    def __str__(self):
+        location = '.'.join(part for part in (self.xref, self.path) if part)
+        return f'{location}: {self.message} [{self.rule}]' if location else f'{self.message} [{self.rule}]'
+
+    def __repr__(self):
+        return f'Finding({self.as_dict()!r})'
+
+    def as_dict(self) -> Dict[str, Optional[str]]:
+        return {'rule': self.rule, 'message': self.message, 'xref': self.xref, 'path': self.path}
+
+
+class Rule:
+    def __init__(self, name: str, tags: Tuple[str, ...], check: Callable[[Tag, GEDCOM], Iterable[str]]):
+        self.name = name
+        self.tags = tags
+        self.check = check
+
+
+RULES: Dict[str, Rule] = dict()
+
+
+def rule(name: str, *tags: str):
+    """Register a check run for every tag in ``tags``, every tag for ``ANY``, or once on the GEDCOM for none."""
+    def register(check: Callable[[Tag, GEDCOM], Iterable[str]]):
+        RULES[name] = Rule(name, tags, check)
+        return check
+    return register
+
+
+class Validator:
+    def __init__(self, rules: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()):
+        names = list(RULES) if rules is None else list(rules)
+        for name in list(names) + list(exclude):
+            if name not in RULES:
+                raise UnknownRule(name)
+        self.rules = [RULES[name] for name in names if name not in exclude]
+        self._root = [item for item in self.rules if not item.tags]
+        self._any = [item for item in self.rules if ANY in item.tags]
+        self._by_tag: Dict[str, List[Rule]] = defaultdict(list)
+        for item in self.rules:
+            for tag in item.tags:
+                if tag != ANY:
+                    self._by_tag[tag].append(item)
+
+    def validate(self, gedcom: GEDCOM) -> List[Finding]:
+        findings = []
+        for item in self._root:
+            findings.extend(Finding(item.name, message) for message in item.check(gedcom, gedcom))
+        seen = dict()
+        for record in gedcom:
+            xref = record_key(record.xref_id, record.tag, seen)
+            for tag, path in _walk(record):
+                for item in self._by_tag.get(tag.tag, ()):
+                    findings.extend(Finding(item.name, message, xref, path) for message in item.check(tag, gedcom))
+                for item in self._any:
+                    findings.extend(Finding(item.name, message, xref, path) for message in item.check(tag, gedcom))
+        return findings
+
+
+def validate(gedcom: GEDCOM, rules: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> List[Finding]:
+    return Validator(rules, exclude).validate(gedcom)
+
+
+def _walk(record: Tag) -> Iterator[Tuple[Tag, str]]:
+    pending = [(record, '')]
+    while pending:
+        tag, path = pending.pop()
+        yield tag, path
+        counts = dict()
+        children = []
+        for item in tag:
+            n = counts.get(item.tag, 0)
+            counts[item.tag] = n + 1
+            children.append((item, f'{path}.{item.tag}[{n}]' if path else f'{item.tag}[{n}]'))
+        pending.extend(reversed(children))
+
+
+@rule('head-missing')
+def head_missing(gedcom: GEDCOM, _: GEDCOM) -> Iterator[str]:
+    if not gedcom.head:
+        yield 'Missing HEAD record'
+
+
+@rule('head-required', 'HEAD')
+def head_required(head: Tag, _: GEDCOM) -> Iterator[str]:
+    for path in HEAD_REQUIRED:
+        if head.find_first(path) is None:
+            yield f'Missing HEAD.{path}'
+
+
+@rule('cardinality', *CARDINALITY)
+def cardinality(tag: Tag, _: GEDCOM) -> Iterator[str]:
+    single = CARDINALITY[tag.tag]
+    counts = dict()
+    for item in tag:
+        if item.tag in single:
+            counts[item.tag] = counts.get(item.tag, 0) + 1
+    for child, count in counts.items():
+        if count > 1:
+            yield f'{tag.tag} has {count} {child} tags, at most 1 allowed'
+
+
+@rule('dangling-pointer', ANY)
+def dangling_pointer(tag: Tag, _: GEDCOM) -> Iterator[str]:
+    if isinstance(tag.ref, str) and tag.ref != '@@':
+        yield f'{tag.tag} points to missing record {tag.ref}'
+
+
+@rule('family-links', *RECIPROCAL)
+def family_links(tag: Tag, _: GEDCOM) -> Iterator[str]:
+    entry = asymmetry(tag)
+    if entry is not None:
+        yield entry.message
+
+
+@rule('death-before-birth', 'INDI')
+def death_before_birth(indi: INDI, _: GEDCOM) -> Iterator[str]:
+    birth = indi.birth_year
+    death = indi.death_year
+    if birth is not None and death is not None and death < birth:
+        yield f'Death year {death} is before birth year {birth}'
+
+
+@rule('date-in-future', 'DATE')
+def date_in_future(date: Tag, _: GEDCOM) -> Iterator[str]:
+    year = getattr(date, 'year', None)
+    if year is not None and year > datetime.now().year:
+        yield f'Date {date.value} is in the future'
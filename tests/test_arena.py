@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from gedcom5.arena import NONE, Arena, ArenaGEDCOM, Node, Record
+from gedcom5.parser import GEDCOM5Parser, ParseError
+from gedcom5.tag import FAM, INDI, Tag
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '555SAMPLE.GED')
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '0 @I1@ INDI',
+    '1 NAME John /Smith/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '1 FAMS @F1@',
+    '1 _CUSTOM one',
+    '0 @I2@ INDI',
+    '1 NAME Jane /Smith/',
+    '1 FAMC @F1@',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '1 CHIL @I2@',
+    '0 TRLR',
+])
+
+
+class TestCase:
+
+    def test_arrays(self):
+        arena = Arena()
+        arena.load(MSG.splitlines())
+        assert len(arena) == 15
+        assert list(arena.records) == [0, 2, 8, 11, 14]
+        assert arena.parent[5] == 4 and arena.parent[4] == 2 and arena.parent[2] == NONE
+        assert list(arena.children(2)) == [3, 4, 6, 7]
+        assert arena.next_sibling[0] == 2 and arena.next_sibling[14] == NONE
+        assert arena.end(2) == 8
+        assert arena.strings.count('@F1@') == 1
+        assert arena.text(3) == '1 NAME John /Smith/'
+
+    def test_invalid_line(self):
+        with pytest.raises(ParseError) as error:
+            ArenaGEDCOM.from_string('0 HEAD\nnonsense')
+        assert error.value.line_num == 2
+
+    def test_views(self):
+        gedcom = ArenaGEDCOM.from_string(MSG)
+        assert len(gedcom) == 5
+        assert [str(r) for r in gedcom.indi] == ['0 @I1@ INDI', '0 @I2@ INDI']
+        node = gedcom.find_first('INDI.BIRT.DATE')
+        assert type(node) is Node
+        assert node.value == '1 JAN 1900'
+        assert node.parent.parent is gedcom.indi[0]
+        assert gedcom.indi[0].find_first('_CUSTOM').value == 'one'
+        assert gedcom.xref('@F1@').as_text() == '0 @F1@ FAM\n1 HUSB @I1@\n1 CHIL @I2@'
+        assert gedcom.xref('@X1@') is None
+
+    def test_lazy_records(self):
+        gedcom = ArenaGEDCOM.from_string(MSG)
+        john, jane = gedcom.indi
+        assert isinstance(john, INDI) and isinstance(john, Record)
+        assert isinstance(gedcom.fam[0], FAM)
+        assert john._tag is None
+        assert john.birth_year == 1900
+        assert type(john.materialize()) is INDI
+        assert john.materialize().parent is gedcom
+        assert john.fams[0].ref is gedcom.fam[0]
+        assert jane._tag is None
+        assert john.fams[0].ref.chil[0].ref is jane
+        assert jane.famc[0].ref.husb.ref is john
+        assert isinstance(john[-1], Tag) and john[-1].tag == '_CUSTOM'
+
+    def test_sample(self):
+        tree = GEDCOM5Parser().parse_path(SAMPLE)
+        gedcom = ArenaGEDCOM.from_path(SAMPLE)
+        assert [r.as_text() for r in gedcom] == [r.as_text() for r in tree]
+        assert [i.materialize().as_text() for i in gedcom.indi] == [i.as_text() for i in tree.indi]
+        assert [i.is_private() for i in gedcom.indi] == [i.is_private() for i in tree.indi]
+
+    def test_record_lists_built_once(self):
+        gedcom = ArenaGEDCOM.from_string(MSG)
+        assert gedcom.indi is gedcom.indi
+        assert gedcom.fam is gedcom.fam
+        assert gedcom.repo is gedcom.repo and gedcom.repo == []
+        assert [str(r) for r in gedcom.head + gedcom.indi + gedcom.fam] == [str(r) for r in gedcom.records[:4]]
@@ -0,0 +1,94 @@
+import asyncio
+from os.path import dirname, join
+
+import pytest
+
+from gedcom5.limits import ParseLimits
+from gedcom5.parser import GEDCOM5Parser, ParseAborted, ParseError
+from gedcom5.stats import ParseStats
+
+PATH = join(dirname(__file__), '555SAMPLE.GED')
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def byte_chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+class TestCase:
+
+    def test_stream_reader(self):
+        with open(PATH, 'rb') as fp:
+            data = fp.read()
+
+        async def main():
+            return await GEDCOM5Parser().parse_async(stream_reader(data), chunk_size=100)
+        gedcom = asyncio.run(main())
+        expected = GEDCOM5Parser().parse_path(PATH)
+        assert [record.as_text() for record in gedcom] == [record.as_text() for record in expected]
+
+    def test_async_iterator(self):
+        data = '0 HEAD\r\n1 CHAR UTF-8\r\n0 @I1@ INDI\r\n1 NAME Jörg /Müller/\r\n0 TRLR\r\n'.encode('utf-8')
+
+        async def main():
+            return await GEDCOM5Parser().parse_async(byte_chunks(data, 3))
+        gedcom = asyncio.run(main())
+        assert gedcom.indi[0].name[0].value == 'Jörg /Müller/'
+
+    def test_yields_to_event_loop(self):
+        data = ''.join(f'0 @I{i}@ INDI\n1 NAME N{i}\n' for i in range(200)).encode('utf-8')
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            gedcom = await GEDCOM5Parser().parse_async(byte_chunks(data, 256), chunk_size=256)
+            task.cancel()
+            return gedcom
+        gedcom = asyncio.run(main())
+        assert len(gedcom.indi) == 200
+        assert len(ticks) > 1
+
+    def test_progress_and_stats(self):
+        data = ''.join(f'0 @I{i}@ INDI\n' for i in range(10)).encode('utf-8')
+        reports = []
+        stats = ParseStats()
+
+        async def main():
+            return await GEDCOM5Parser().parse_async(
+                byte_chunks(data, 20), progress=reports.append, progress_every=4, stats=stats,
+                total_bytes=len(data)
+            )
+        asyncio.run(main())
+        assert [report.lines for report in reports] == [4, 8, 10]
+        assert reports[-1].fraction == 1.0
+        assert stats.lines == 10
+        assert stats.tag_counts['INDI'] == 10
+
+    def test_limits(self):
+        data = ''.join(f'0 @I{i}@ INDI\n' for i in range(10)).encode('utf-8')
+
+        async def main():
+            return await GEDCOM5Parser().parse_async(byte_chunks(data, 20), limits=ParseLimits(max_lines=5))
+        with pytest.raises(ParseAborted) as info:
+            asyncio.run(main())
+        assert info.value.reason == 'max_lines'
+        assert len(info.value.gedcom.indi) == 5
+
+    def test_error(self):
+        async def main():
+            return await GEDCOM5Parser().parse_async(byte_chunks(b'0 HEAD\nX\n', 4))
+        with pytest.raises(ParseError) as info:
+            asyncio.run(main())
+        assert info.value.line_num == 2
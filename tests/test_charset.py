@@ -0,0 +1,101 @@
+import codecs
+from io import BytesIO
+
+import pytest
+
+from gedcom5.charset import PEEK_SIZE, LineDecoder, UndecodableLine, detect_encoding, iter_lines
+from gedcom5.parser import GEDCOM5Parser
+
+
+class TestCase:
+
+    def test_ansel_decode(self):
+        assert b'Ren\xe2ee \xa1\xe2od\xe2z Fran\xf0cois'.decode('ansel') == 'Renée Łódź François'
+
+    def test_ansel_encode(self):
+        assert 'Renée Łódź'.encode('ansel') == b'Ren\xe2ee \xa1\xe2od\xe2z'
+
+    def test_ansel_round_trip(self):
+        text = 'Æsir Øresund © 1900 ß'
+        assert text.encode('ansel').decode('ansel') == text
+
+    def test_ansel_undefined(self):
+        with pytest.raises(UnicodeDecodeError):
+            b'\x80'.decode('ansel')
+        assert b'a\x80b'.decode('ansel', 'replace') == 'a\ufffdb'
+        assert b'a\x80b'.decode('ansel', 'ignore') == 'ab'
+
+    def test_ansel_incremental(self):
+        decoder = codecs.getincrementaldecoder('ansel')()
+        assert decoder.decode(b'Ren\xe2') == 'Ren'
+        assert decoder.decode(b'e', final=True) == 'é'
+
+    @pytest.mark.parametrize('head,expected', [
+        (codecs.BOM_UTF8 + b'0 HEAD', ('utf-8', 3)),
+        (codecs.BOM_UTF16_LE + '0 HEAD'.encode('utf-16-le'), ('utf-16-le', 2)),
+        (codecs.BOM_UTF16_BE + '0 HEAD'.encode('utf-16-be'), ('utf-16-be', 2)),
+        ('0 HEAD'.encode('utf-16-le'), ('utf-16-le', 0)),
+        (b'0 HEAD\r\n1 CHAR ANSEL\r\n', ('ansel', 0)),
+        (b'0 HEAD\n1 CHAR ASCII\n', ('ascii', 0)),
+        (b'0 HEAD\n1 CHAR UNICODE\n', ('utf-8', 0)),
+        (b'0 HEAD\n', ('utf-8', 0)),
+    ])
+    def test_detect_encoding(self, head, expected):
+        assert detect_encoding(head) == expected
+
+    def test_iter_lines_chunk_boundaries(self):
+        padding = [f'1 NOTE {n:05d}' for n in range(PEEK_SIZE // 10)]
+        lines = [
+            '0 HEAD', '1 CHAR UTF-8', *padding, '0 @I1@ INDI', '1 NAME Ren\u00e9e /\u0141\u00f3d\u017a/', '1 NOTE \u20ac'
+        ]
+        data = '\r\n'.join(lines).encode('utf-8') + b'\r\n'
+        assert len(data) > PEEK_SIZE
+        assert list(iter_lines(BytesIO(data), chunk_size=1)) == lines
+
+    @pytest.mark.parametrize('encoding,data,expected', [
+        (
+            'utf-8', b'0 HEAD\r\n1 NAME Ren\xc3\xa9e \xe2\x82\xac\r\n1 NOTE x\r\n',
+            ['0 HEAD', '1 NAME Ren\u00e9e \u20ac', '1 NOTE x']
+        ),
+        (
+            'ansel', b'0 HEAD\r\n1 NAME Ren\xe2ee /M\xe8uller/\r\n1 NOTE x\r',
+            ['0 HEAD', '1 NAME Ren\u00e9e /M\u00fcller/', '1 NOTE x']
+        ),
+        ('utf-16-le', '0 HEAD\r\n1 NAME Zo\u00eb\r\n'.encode('utf-16-le'), ['0 HEAD', '1 NAME Zo\u00eb']),
+    ])
+    def test_line_decoder_single_bytes(self, encoding, data, expected):
+        decoder = LineDecoder(encoding)
+        lines = []
+        for n in range(len(data)):
+            lines.extend(decoder.feed(data[n:n + 1]))
+        lines.extend(decoder.finish())
+        assert lines == expected
+
+    @pytest.mark.parametrize('encoding,data', [
+        ('utf-8', b'0 HEAD\r\n1 NOTE x\r\n1 NAME Ren\xe9e\r\n0 TRLR\r\n'),
+        ('ansel', b'0 HEAD\r\n1 NOTE x\r\n1 NAME Ren\x80e\r\n0 TRLR\r\n'),
+    ])
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+    def test_undecodable_line(self, encoding, data, chunk_size):
+        decoder = LineDecoder(encoding)
+        with pytest.raises(UndecodableLine) as info:
+            for n in range(0, len(data), chunk_size):
+                decoder.feed(data[n:n + chunk_size])
+        assert info.value.line_num == 3
+        assert info.value.line == '1 NAME Ren'
+        assert list(iter_lines(BytesIO(data), encoding=encoding, errors='replace'))[2] == '1 NAME Ren\ufffde'
+
+    def test_parse_ansel(self):
+        msg = b'0 HEAD\r\n1 CHAR ANSEL\r\n0 @I1@ INDI\r\n1 NAME Ren\xe2ee /M\xe8uller/\r\n'
+        gedcom = GEDCOM5Parser().parse_stream(BytesIO(msg))
+        assert gedcom.indi[0].name[0].value == 'Renée /Müller/'
+
+    def test_parse_utf16(self):
+        msg = '\r\n'.join(['0 HEAD', '1 CHAR UNICODE', '0 @I1@ INDI', '1 NAME Zoë']).encode('utf-16')
+        gedcom = GEDCOM5Parser().parse_stream(BytesIO(msg))
+        assert gedcom.indi[0].name[0].value == 'Zoë'
+
+    def test_parse_explicit_encoding(self):
+        msg = '\n'.join(['0 HEAD', '1 CHAR UTF-8', '0 @I1@ INDI', '1 NAME Zoë']).encode('latin-1')
+        gedcom = GEDCOM5Parser().parse_stream(BytesIO(msg), encoding='latin-1')
+        assert gedcom.indi[0].name[0].value == 'Zoë'
@@ -0,0 +1,65 @@
+import os
+
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.tag import BIRT, DATE, INDI, CompactField, Tag, compact_tree, expand_tree
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '555SAMPLE.GED')
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 NAME John /Smith/',
+    '1 SEX M',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '1 BIRT',
+    '2 DATE 2 JAN 1900',
+    '1 FAMS @F1@',
+    '1 _CUSTOM one',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+])
+
+
+class TestCase:
+
+    def test_records_compacted(self):
+        gedcom = GEDCOM5Parser(compact=True).parse_string(MSG)
+        indi = gedcom.indi[0]
+        assert 'birt' not in vars(indi) and 'sex' not in vars(indi)
+        assert isinstance(INDI.__dict__['birt'], CompactField)
+        assert [str(b) for b in indi.birt] == ['1 BIRT', '1 BIRT']
+        assert str(indi.sex) == '1 SEX M'
+        assert indi.resn is None and indi.alia == []
+        assert indi.birth_year == 1900
+        assert indi.fams[0].ref is gedcom.fam[0]
+        assert gedcom.fam[0].husb.ref is indi
+        assert [item.tag for item in indi] == ['NAME', 'SEX', 'BIRT', 'BIRT', 'FAMS', '_CUSTOM']
+
+    def test_same_as_expanded(self):
+        expanded = GEDCOM5Parser().parse_path(SAMPLE)
+        compacted = GEDCOM5Parser(compact=True).parse_path(SAMPLE)
+        assert [r.as_text() for r in compacted] == [r.as_text() for r in expanded]
+        for a, b in zip(compacted.indi, expanded.indi):
+            assert (a.birth_year, a.death_year, a.full_name) == (b.birth_year, b.death_year, b.full_name)
+            assert [f.ref.xref_id for f in a.famc] == [f.ref.xref_id for f in b.famc]
+            assert len(vars(a)) < len(vars(b))
+
+    def test_append_after_compact(self):
+        indi = INDI(xref_id='@I1@')
+        compact_tree(indi)
+        birt = BIRT(level=1, parent=indi)
+        indi.append(birt)
+        date = DATE(level=2, parent=birt, value='1900')
+        birt.append(date)
+        indi.append(Tag(level=1, parent=indi, tag='_X'))
+        assert indi.birt == [birt]
+        assert indi.birt[0].date is date
+        assert indi.birth_year == 1900
+
+    def test_expand(self):
+        gedcom = GEDCOM5Parser(compact=True).parse_string(MSG)
+        indi = gedcom.indi[0]
+        expand_tree(indi)
+        assert len(vars(indi)['birt']) == 2
+        assert vars(indi[2])['date'].value == '1 JAN 1900'
+        assert indi.birth_year == 1900
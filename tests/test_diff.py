@@ -0,0 +1,78 @@
+import json
+
+from gedcom5.diff import Change, diff
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.patch import apply
+
+OLD = '\n'.join([
+    '0 HEAD',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '1 OCCU Farmer',
+    '1 OCCU Miller',
+    '0 @I2@ INDI',
+    '1 NAME Sue /SMITH/',
+    '0 @N1@ NOTE Old note',
+])
+
+NEW = '\n'.join([
+    '0 HEAD',
+    '0 @I1@ INDI',
+    '1 NAME Robert /BROWN/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1901',
+    '2 PLAC London',
+    '1 OCCU Farmer',
+    '1 DEAT',
+    '0 @I9@ INDI',
+    '1 NAME Sue /SMITH/',
+    '0 @I3@ INDI',
+    '1 NAME Tom /BROWN/',
+])
+
+
+class TestCase:
+
+    def test_identical(self):
+        parser = GEDCOM5Parser()
+        assert diff(parser.parse_string(OLD), parser.parse_string(OLD)) == []
+
+    def test_changes(self):
+        parser = GEDCOM5Parser()
+        changes = diff(parser.parse_string(OLD), parser.parse_string(NEW))
+        assert [change.as_dict() for change in changes] == [
+            {'op': 'replace', 'xref': '@I1@', 'path': 'NAME[0]', 'old': 'Bob /BROWN/', 'new': 'Robert /BROWN/'},
+            {'op': 'replace', 'xref': '@I1@', 'path': 'BIRT[0].DATE[0]', 'old': '1 JAN 1900', 'new': '1 JAN 1901'},
+            {'op': 'add', 'xref': '@I1@', 'path': 'BIRT[0]', 'text': ['2 PLAC London']},
+            {'op': 'add', 'xref': '@I1@', 'text': ['1 DEAT']},
+            {'op': 'remove', 'xref': '@I1@', 'path': 'OCCU[1]'},
+            {'op': 'renumber', 'xref': '@I2@', 'old': '@I2@', 'new': '@I9@'},
+            {'op': 'add_record', 'xref': '@I3@', 'text': ['0 @I3@ INDI', '1 NAME Tom /BROWN/']},
+            {'op': 'remove_record', 'xref': '@N1@'},
+        ]
+
+    def test_records_without_xref(self):
+        parser = GEDCOM5Parser()
+        changes = diff(parser.parse_string('0 HEAD\n1 CHAR ANSEL'), parser.parse_string('0 HEAD\n1 CHAR UTF-8'))
+        assert changes == [Change('replace', 'HEAD#0', path='CHAR[0]', old='ANSEL', new='UTF-8')]
+
+    def test_json_round_trip(self):
+        parser = GEDCOM5Parser()
+        changes = diff(parser.parse_string(OLD), parser.parse_string(NEW))
+        data = json.loads(json.dumps([change.as_dict() for change in changes]))
+        assert [Change.from_dict(item) for item in data] == changes
+
+    def test_record_tag_changed(self):
+        parser = GEDCOM5Parser()
+        old = parser.parse_string('0 @X1@ INDI\n1 NOTE same')
+        new = parser.parse_string('0 @X1@ FAM\n1 NOTE same')
+        changes = diff(old, new)
+        assert changes == [
+            Change('remove_record', '@X1@'),
+            Change('add_record', '@X1@', text=['0 @X1@ FAM', '1 NOTE same']),
+        ]
+        apply(old, changes)
+        assert [r.as_text() for r in old] == ['0 @X1@ FAM\n1 NOTE same']
+        assert old.fam[0].xref_id == '@X1@' and old.indi == []
@@ -0,0 +1,70 @@
+from benchmarks.synthetic import Generator
+from gedcom5.duplicates import candidate_pairs, features, find_duplicates
+from gedcom5.parser import GEDCOM5Parser
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 NAME John /Smith/',
+    '1 SEX M',
+    '1 BIRT',
+    '2 DATE 12 MAR 1850',
+    '2 PLAC Leeds, Yorkshire, England',
+    '1 FAMC @F1@',
+    '0 @I2@ INDI',
+    '1 NAME John Henry /Smyth/',
+    '1 SEX M',
+    '1 BIRT',
+    '2 DATE 1851',
+    '2 PLAC Leeds',
+    '0 @I3@ INDI',
+    '1 NAME Mary /Smith/',
+    '1 SEX F',
+    '1 BIRT',
+    '2 DATE 1850',
+    '0 @I4@ INDI',
+    '1 NAME John /Smith/',
+    '1 SEX M',
+    '1 BIRT',
+    '2 DATE 1890',
+    '0 @I5@ INDI',
+    '1 NAME Thomas /Smith/',
+    '1 FAMS @F1@',
+    '0 @I6@ INDI',
+    '1 NAME John /Jones/',
+    '1 BIRT',
+    '2 DATE 1850',
+    '0 @F1@ FAM',
+    '1 HUSB @I5@',
+    '1 CHIL @I1@',
+])
+
+
+class TestCase:
+
+    def test_find(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        found = find_duplicates(gedcom)
+        assert [(m.first.xref_id, m.second.xref_id) for m in found] == [('@I1@', '@I2@')]
+        assert 0.8 <= found[0].score < 1.0
+
+    def test_blocking(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        people = [features(n, indi) for n, indi in enumerate(gedcom.indi)]
+        pairs = {tuple(sorted((a[0], b[0]))) for a, b in candidate_pairs(people)}
+        assert pairs == {(0, 1), (0, 2), (1, 2)}
+
+    def test_features(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        person = features(0, gedcom.indi[0])
+        assert person[1] == {'smith'}
+        assert person[4] == 1850
+        assert person[6] == ('leeds', 'yorkshire', 'england')
+        assert person[8] == {'thomas smith'}
+
+    def test_processes(self):
+        gedcom = GEDCOM5Parser().parse_string(Generator(3000, seed=7).text())
+        serial = find_duplicates(gedcom, threshold=0.7)
+        parallel = find_duplicates(gedcom, threshold=0.7, processes=2)
+        assert [(m.first.xref_id, m.second.xref_id, m.score) for m in serial] == [
+            (m.first.xref_id, m.second.xref_id, m.score) for m in parallel
+        ]
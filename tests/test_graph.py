@@ -0,0 +1,110 @@
+from gedcom5.graph import ancestors, children, cycles, descendants, parents
+from gedcom5.parser import GEDCOM5Parser
+
+TREE = '\n'.join([
+    '0 @I1@ INDI',
+    '1 FAMC @F1@',
+    '0 @I2@ INDI',
+    '1 FAMS @F1@',
+    '1 FAMC @F2@',
+    '0 @I3@ INDI',
+    '1 FAMS @F1@',
+    '0 @I4@ INDI',
+    '1 FAMS @F2@',
+    '0 @F1@ FAM',
+    '1 HUSB @I2@',
+    '1 WIFE @I3@',
+    '1 CHIL @I1@',
+    '0 @F2@ FAM',
+    '1 HUSB @I4@',
+    '1 CHIL @I2@',
+])
+
+CYCLE = '\n'.join([
+    '0 @I1@ INDI',
+    '1 FAMC @F1@',
+    '1 FAMS @F2@',
+    '0 @I2@ INDI',
+    '1 FAMC @F2@',
+    '1 FAMS @F1@',
+    '0 @I3@ INDI',
+    '1 FAMC @F1@',
+    '0 @I4@ INDI',
+    '1 FAMC @F3@',
+    '1 FAMS @F3@',
+    '0 @F1@ FAM',
+    '1 HUSB @I2@',
+    '1 CHIL @I1@',
+    '1 CHIL @I3@',
+    '0 @F2@ FAM',
+    '1 HUSB @I1@',
+    '1 CHIL @I2@',
+    '0 @F3@ FAM',
+    '1 HUSB @I4@',
+    '1 CHIL @I4@',
+])
+
+
+def xrefs(items):
+    return [item.xref_id for item in items]
+
+
+class TestCase:
+
+    def test_parents_children(self):
+        gedcom = GEDCOM5Parser().parse_string(TREE)
+        i1, i2, i3, i4 = gedcom.indi
+        assert xrefs(parents(i1)) == ['@I2@', '@I3@']
+        assert xrefs(children(i2)) == ['@I1@']
+
+    def test_ancestors_descendants(self):
+        gedcom = GEDCOM5Parser().parse_string(TREE)
+        i1, i2, i3, i4 = gedcom.indi
+        assert xrefs(ancestors(i1)) == ['@I2@', '@I3@', '@I4@']
+        assert xrefs(descendants(i4)) == ['@I2@', '@I1@']
+
+    def test_no_cycles(self):
+        assert cycles(GEDCOM5Parser().parse_string(TREE)) == []
+
+    def test_cycles(self):
+        gedcom = GEDCOM5Parser().parse_string(CYCLE)
+        found = cycles(gedcom)
+        assert [(sorted(xrefs(c.individuals)), sorted(xrefs(c.families))) for c in found] == [
+            (['@I1@', '@I2@'], ['@F1@', '@F2@']),
+            (['@I4@'], ['@F3@']),
+        ]
+
+    def test_traversal_terminates_on_cycles(self):
+        gedcom = GEDCOM5Parser().parse_string(CYCLE)
+        i1, i2, i3, i4 = gedcom.indi
+        assert xrefs(ancestors(i3)) == ['@I2@', '@I1@']
+        assert xrefs(descendants(i1)) == ['@I2@', '@I3@']
+        assert xrefs(ancestors(i4)) == []
+
+    def test_is_private_terminates_on_cycles(self):
+        gedcom = GEDCOM5Parser().parse_string(CYCLE)
+        assert all(indi.is_private() is True for indi in gedcom.indi)
+
+    def test_deep_chain(self):
+        lines = []
+        for i in range(5000):
+            lines += [f'0 @I{i}@ INDI', f'1 FAMC @F{i}@', f'0 @F{i}@ FAM', f'1 HUSB @I{i + 1}@']
+        lines += ['0 @I5000@ INDI', '1 FAMC @F0@']
+        gedcom = GEDCOM5Parser().parse_string('\n'.join(lines))
+        found = cycles(gedcom)
+        assert len(found) == 1
+        assert len(found[0].individuals) == 5000
+        assert len(list(ancestors(gedcom.indi[0]))) == 5000
+
+    def test_is_private_deep_chain(self):
+        lines = []
+        for i in range(3000):
+            lines += [f'0 @I{i}@ INDI', f'1 FAMC @F{i}@', f'0 @F{i}@ FAM', f'1 WIFE @I{i + 1}@']
+        lines += ['0 @I3000@ INDI', '1 BIRT', '2 DATE 1800']
+        gedcom = GEDCOM5Parser().parse_string('\n'.join(lines))
+        assert gedcom.indi[0].is_private() is True
+        assert gedcom.indi[2999].is_private() is False
+        lines[-1] = '2 DATE 2000'
+        gedcom = GEDCOM5Parser().parse_string('\n'.join(lines))
+        assert gedcom.indi[0].is_private() is True
+        assert gedcom.indi[2999].is_private() is True
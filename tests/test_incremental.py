@@ -0,0 +1,84 @@
+from gedcom5.gedcom import GEDCOM
+from gedcom5.incremental import record_hashes, split_records
+from gedcom5.parser import GEDCOM5Parser
+
+VERSION_1 = [
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/',
+    '1 FAMS @F1@',
+    '0 @I2@ INDI',
+    '1 NAME Mary /SMITH/',
+    '1 FAMS @F1@',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '1 WIFE @I2@',
+    '0 TRLR',
+]
+
+
+class TestCase:
+
+    def test_split_records(self):
+        assert [record[0] for record in split_records(VERSION_1)] == [
+            '0 HEAD', '0 @I1@ INDI', '0 @I2@ INDI', '0 @F1@ FAM', '0 TRLR'
+        ]
+
+    def test_unchanged_records_are_reused(self):
+        parser = GEDCOM5Parser()
+        previous = parser.reparse_lines(VERSION_1, GEDCOM())
+        lines = list(VERSION_1)
+        lines[6] = '1 NAME Mary /JONES/'
+        old = list(previous)
+        gedcom = parser.reparse_lines(lines, previous)
+        assert [item.tag for item in gedcom] == ['HEAD', 'INDI', 'INDI', 'FAM', 'TRLR']
+        assert gedcom[0] is old[0]
+        assert gedcom.indi[0] is old[1]
+        assert gedcom.indi[1] is not old[2]
+        assert gedcom.indi[1].name[0].value == 'Mary /JONES/'
+        assert gedcom.fam[0] is old[3]
+        assert gedcom.fam[0].wife.ref is gedcom.indi[1]
+        assert gedcom.fam[0].husb.ref is gedcom.indi[0]
+        assert gedcom.indi[1].fams[0].ref is gedcom.fam[0]
+        assert gedcom.fam[0].parent is gedcom
+
+    def test_removed_record_unresolves_pointers(self):
+        parser = GEDCOM5Parser()
+        previous = parser.reparse_lines(VERSION_1, GEDCOM())
+        gedcom = parser.reparse_lines(VERSION_1[:5] + VERSION_1[8:], previous)
+        assert len(gedcom.indi) == 1
+        assert gedcom.fam[0].wife.ref == '@I2@'
+
+    def test_hashes_from_plain_parse(self):
+        parser = GEDCOM5Parser()
+        previous = parser.parse_lines(VERSION_1)
+        assert record_hashes(previous) == parser.reparse_lines(VERSION_1, GEDCOM()).hashes
+        records = list(previous)
+        gedcom = parser.reparse_lines(VERSION_1, previous)
+        assert all(new is old for new, old in zip(gedcom, records))
+
+    def test_explicit_hashes(self):
+        parser = GEDCOM5Parser()
+        previous = parser.parse_lines(VERSION_1)
+        records = list(previous)
+        gedcom = parser.reparse_lines(VERSION_1, previous, hashes={})
+        assert not any(new is old for new, old in zip(gedcom, records))
+
+    def test_previous_is_consumed(self):
+        parser = GEDCOM5Parser()
+        previous = parser.parse_lines(VERSION_1)
+        gedcom = parser.reparse_lines(VERSION_1, previous)
+        assert len(previous) == 0 and previous.indi == [] and previous.hashes == {}
+        assert all(record.parent is gedcom for record in gedcom)
+
+    def test_repeated_xref_parsed_fresh(self):
+        parser = GEDCOM5Parser()
+        previous = parser.parse_lines(VERSION_1)
+        old = previous.indi[0]
+        lines = VERSION_1[:5] + VERSION_1[2:5] + VERSION_1[5:]
+        gedcom = parser.reparse_lines(lines, previous)
+        first, second = gedcom.indi[0], gedcom.indi[1]
+        assert first is old
+        assert second is not first
+        assert second.as_text() == first.as_text()
@@ -0,0 +1,39 @@
+from gedcom5.parser import GEDCOM5Parser
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 BIRT',
+    '2 PLAC Leeds, Yorkshire, England',
+    '1 FAMS @F1@',
+    '1 _CUSTOM one',
+    '0 @I2@ INDI',
+    '1 BIRT',
+    '2 PLAC Leeds, Yorkshire, England',
+    '1 FAMS @F1@',
+    '1 _CUSTOM two',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+])
+
+
+class TestCase:
+
+    def test_pointers_and_tags(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        i1, i2 = gedcom.indi
+        assert i1.fams[0].value is i2.fams[0].value
+        assert i1.xref_id is gedcom.fam[0].husb.value
+        assert i1[-1].tag is i2[-1].tag
+        assert i1.birt[0].plac.value is not i2.birt[0].plac.value
+
+    def test_values(self):
+        gedcom = GEDCOM5Parser(intern_values=True).parse_string(MSG)
+        i1, i2 = gedcom.indi
+        assert i1.birt[0].plac.value is i2.birt[0].plac.value
+        assert i1.fams[0].ref is gedcom.fam[0]
+
+    def test_recover(self):
+        gedcom = GEDCOM5Parser(intern_values=True).parse_string(MSG, recover=True)
+        i1, i2 = gedcom.indi
+        assert i1.birt[0].plac.value is i2.birt[0].plac.value
+        assert i1.fams[0].value is i2.fams[0].value
@@ -0,0 +1,114 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+
+from gedcom5.limits import CancelToken, ParseLimits
+from gedcom5.parser import GEDCOM5Parser, ParseAborted, ParseError
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '3 TIME 12:00',
+    '0 @I2@ INDI',
+    '1 NAME Mary /SMITH/',
+    '0 TRLR',
+])
+
+
+class TestCase:
+
+    def test_within_limits(self):
+        limits = ParseLimits(max_lines=9, max_bytes=1000, max_depth=3, max_tags=9, timeout=60)
+        gedcom = GEDCOM5Parser().parse_string(MSG, limits=limits)
+        assert len(gedcom) == 4
+
+    def test_max_lines(self):
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_string(MSG, limits=ParseLimits(max_lines=5, check_every=2))
+        assert ex.value.reason == 'max_lines'
+        assert ex.value.line_num == 5
+        assert ex.value.records == 2
+        assert ex.value.tags == 5
+        assert len(ex.value.gedcom.indi) == 1
+        assert isinstance(ex.value, ParseError)
+
+    def test_max_depth(self):
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_string(MSG, limits=ParseLimits(max_depth=2))
+        assert ex.value.reason == 'max_depth'
+        assert ex.value.line_num == 6
+
+    def test_max_tags(self):
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_string(MSG, limits=ParseLimits(max_tags=3))
+        assert ex.value.reason == 'max_tags'
+        assert ex.value.tags == 4
+
+    def test_max_bytes(self):
+        data = MSG.encode('utf-8')
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_stream(BytesIO(data), limits=ParseLimits(max_bytes=len(data) - 1))
+        assert ex.value.reason == 'max_bytes'
+        assert ex.value.bytes_read == len(data)
+
+    def test_deadline(self):
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_string(MSG, limits=ParseLimits(timeout=-1))
+        assert ex.value.reason == 'deadline'
+        assert ex.value.elapsed >= 0
+
+    def test_cancel(self):
+        token = CancelToken()
+
+        def lines():
+            for index, line in enumerate(MSG.splitlines()):
+                if index == 4:
+                    token.cancel()
+                yield line
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_lines(lines(), limits=ParseLimits(cancel=token, check_every=2))
+        assert ex.value.reason == 'cancel'
+        assert ex.value.line_num == 4
+
+    def test_limits_checked_within_a_line(self):
+        data = b'0 HEAD\n1 NOTE ' + b'x' * (8 << 20)
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_stream(BytesIO(data), limits=ParseLimits(max_bytes=100000))
+        assert ex.value.reason == 'max_bytes'
+        assert ex.value.bytes_read < 200000
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_stream(BytesIO(data), limits=ParseLimits(timeout=-1))
+        assert ex.value.reason == 'deadline'
+        assert ex.value.bytes_read < 200000
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_stream(BytesIO(data), limits=ParseLimits(cancel=token))
+        assert ex.value.reason == 'cancel'
+
+    def test_max_line_length(self):
+        limits = ParseLimits(max_line_length=1000)
+        data = b'0 HEAD\n1 NOTE ' + b'x' * (1 << 20)
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_stream(BytesIO(data), limits=limits)
+        assert ex.value.reason == 'max_line_length'
+        assert ex.value.bytes_read < 200000
+        with pytest.raises(ParseAborted) as ex:
+            GEDCOM5Parser().parse_string('0 HEAD\n1 NOTE ' + 'x' * 1000, limits=limits)
+        assert ex.value.reason == 'max_line_length'
+        assert len(GEDCOM5Parser().parse_string(MSG, limits=limits)) == 4
+
+    def test_async_max_bytes(self):
+        data = b'0 HEAD\n1 NOTE ' + b'x' * (1 << 20)
+
+        async def chunks():
+            for start in range(0, len(data), 4096):
+                yield data[start:start + 4096]
+        with pytest.raises(ParseAborted) as ex:
+            asyncio.run(GEDCOM5Parser().parse_async(chunks(), limits=ParseLimits(max_bytes=50000)))
+        assert ex.value.reason == 'max_bytes'
+        assert ex.value.bytes_read < 60000
@@ -0,0 +1,57 @@
+from gedcom5.links import check, repair
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.validate import validate
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 SEX F',
+    '1 FAMS @F1@',
+    '0 @I2@ INDI',
+    '1 FAMC @F1@',
+    '0 @I3@ INDI',
+    '1 SEX M',
+    '0 @I4@ INDI',
+    '1 FAMS @F1@',
+    '0 @F1@ FAM',
+    '1 HUSB @I3@',
+    '1 CHIL @I4@',
+])
+
+
+class TestCase:
+
+    def test_check(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        found = [(entry.source.xref_id, entry.item.tag, entry.target.xref_id) for entry in check(gedcom)]
+        assert found == [
+            ('@I1@', 'FAMS', '@F1@'),
+            ('@I2@', 'FAMC', '@F1@'),
+            ('@I4@', 'FAMS', '@F1@'),
+            ('@F1@', 'HUSB', '@I3@'),
+            ('@F1@', 'CHIL', '@I4@'),
+        ]
+        assert check(gedcom)[0].message == '@F1@ has no HUSB/WIFE pointing back to @I1@'
+
+    def test_repair(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        added = repair(gedcom)
+        assert [(item.parent.xref_id, str(item)) for item in added] == [
+            ('@F1@', '1 WIFE @I1@'),
+            ('@F1@', '1 CHIL @I2@'),
+            ('@I3@', '1 FAMS @F1@'),
+            ('@I4@', '1 FAMC @F1@'),
+        ]
+        fam = gedcom.fam[0]
+        assert fam.wife.ref is gedcom.indi[0]
+        assert [chil.ref.xref_id for chil in fam.chil] == ['@I4@', '@I2@']
+        assert gedcom.indi[2].fams[0].ref is fam
+        remaining = check(gedcom)
+        assert [(entry.source.xref_id, entry.item.tag) for entry in remaining] == [('@I4@', 'FAMS')]
+        assert [f.message for f in validate(gedcom, rules=['family-links'])] == [
+            '@F1@ has no HUSB/WIFE pointing back to @I4@'
+        ]
+
+    def test_symmetric(self):
+        gedcom = GEDCOM5Parser().parse_string('0 @I1@ INDI\n1 FAMC @F1@\n0 @F1@ FAM\n1 CHIL @I1@')
+        assert check(gedcom) == []
+        assert repair(gedcom) == []
@@ -0,0 +1,112 @@
+import pytest
+
+from gedcom5.merge import MergeError, XrefAllocator, merge
+from gedcom5.parser import GEDCOM5Parser
+
+BASE = '\n'.join([
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '0 @I1@ INDI',
+    '1 NAME John /Smith/',
+    '1 FAMS @F1@',
+    '0 @I2@ INDI',
+    '1 NAME Ann /Brown/',
+    '1 FAMS @F1@',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '1 WIFE @I2@',
+    '0 @S1@ SOUR',
+    '1 TITL Parish register',
+    '0 TRLR',
+])
+
+OTHER = '\n'.join([
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '0 @I1@ INDI',
+    '1 NAME Jane /Smith/',
+    '1 FAMC @F1@',
+    '1 SOUR @S1@',
+    '0 @I2@ INDI',
+    '1 NAME John /Smith/',
+    '1 FAMS @F1@',
+    '1 OCCU Miller',
+    '0 @F1@ FAM',
+    '1 HUSB @I2@',
+    '1 CHIL @I1@',
+    '0 @S1@ SOUR',
+    '1 TITL Census',
+    '0 @N7@ NOTE Text',
+    '0 TRLR',
+])
+
+
+def parse(text):
+    return GEDCOM5Parser().parse_string(text)
+
+
+class TestCase:
+
+    def test_allocator(self):
+        allocator = XrefAllocator(['@I1@', '@I7@', '@F2@', '@SUB@'])
+        assert allocator.allocate('@I1@') == '@I8@'
+        assert allocator.allocate('@I3@') == '@I9@'
+        assert allocator.allocate('@F1@') == '@F3@'
+        assert allocator.allocate('@N1@') == '@N1@'
+
+    def test_merge(self):
+        base = parse(BASE)
+        remap = merge(base, parse(OTHER))
+        assert remap == {'@I1@': '@I3@', '@I2@': '@I4@', '@F1@': '@F2@', '@S1@': '@S2@'}
+        assert [record.xref_id for record in base] == [
+            None, '@I1@', '@I2@', '@F1@', '@S1@', '@I3@', '@I4@', '@F2@', '@S2@', '@N7@', None
+        ]
+        assert base[-1].tag == 'TRLR'
+        assert len(base.head) == 1
+        jane = base.indi[2]
+        assert jane.famc[0].value == '@F2@'
+        assert jane.famc[0].ref is base.fam[1]
+        assert jane.sour[0].ref.titl.value == 'Census'
+        assert base.fam[1].husb.ref is base.indi[3]
+        assert base.fam[0].husb.ref is base.indi[0]
+
+    def test_unify(self):
+        base = parse(BASE)
+        other = parse(OTHER)
+        remap = merge(base, other, unify=[(base.indi[0], other.indi[1])])
+        assert remap['@I2@'] == '@I1@'
+        assert len(base.indi) == 3
+        john = base.indi[0]
+        assert [str(item) for item in john] == [
+            '1 NAME John /Smith/', '1 FAMS @F1@', '1 FAMS @F2@', '1 OCCU Miller'
+        ]
+        assert john.fams[1].ref is base.fam[1]
+        assert base.fam[1].husb.ref is john
+        assert base.indi[0].find_first('OCCU').value == 'Miller'
+
+    def test_unify_needs_xref(self):
+        base = parse(BASE)
+        other = parse(OTHER)
+        with pytest.raises(MergeError):
+            merge(base, other, unify=[(base.head[0], other.head[0])])
+
+    def test_renumber_avoids_other_xrefs(self):
+        base = parse('\n'.join(['0 HEAD', '0 @I1@ INDI', '1 NAME Base /Person/', '0 TRLR']))
+        other = parse('\n'.join([
+            '0 HEAD',
+            '0 @I2@ INDI',
+            '1 NAME Husband /Other/',
+            '1 FAMS @F1@',
+            '0 @I1@ INDI',
+            '1 NAME Wife /Other/',
+            '1 FAMS @F1@',
+            '0 @F1@ FAM',
+            '1 HUSB @I2@',
+            '1 WIFE @I1@',
+            '0 TRLR',
+        ]))
+        remap = merge(base, other)
+        assert remap == {'@I1@': '@I3@'}
+        assert [indi.xref_id for indi in base.indi] == ['@I1@', '@I2@', '@I3@']
+        assert base.fam[0].husb.ref is base.indi[1]
+        assert base.fam[0].wife.ref is base.indi[2]
@@ -0,0 +1,82 @@
+import pytest
+
+from gedcom5.names import METAPHONE, PREFIX, SOUNDEX, double_metaphone, normalize, soundex
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.tag import INDI
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 NAME John Paul /Smith/',
+    '0 @I2@ INDI',
+    '1 NAME Mary /Schmidt/',
+    '1 NAME Maria /Smythe/',
+    '0 @I3@ INDI',
+    '1 NAME Jörg /Müller/',
+    '2 GIVN Georg',
+    '2 SURN Mueller,Miller',
+    '0 @I4@ INDI',
+    '1 NAME /山田/',
+    '2 ROMN Taro /Yamada/',
+    '3 TYPE romaji',
+    '0 @I5@ INDI',
+    '1 NAME Catherine /Smithson/',
+])
+
+
+def xrefs(items):
+    return [item.xref_id for item in items]
+
+
+class TestCase:
+
+    def test_soundex(self):
+        assert [soundex(name) for name in ('Robert', 'Rupert', 'Ashcraft', 'Tymczak', 'Pfister', 'Lee', '')] == [
+            'R163', 'R163', 'A261', 'T522', 'P236', 'L000', ''
+        ]
+
+    def test_double_metaphone(self):
+        assert double_metaphone('Smith') == ('SM0', 'XMT')
+        assert double_metaphone('Schmidt') == ('XMT', 'SMT')
+        assert double_metaphone('Katherine') == double_metaphone('Catherine') == ('K0RN', 'KTRN')
+        assert double_metaphone('Wasserman') == ('ASRM', 'FSRM')
+        assert double_metaphone('Arnow') == ('ARN', 'ARNF')
+        assert double_metaphone('Gallegos') == ('KLKS', 'KKS')
+
+    def test_normalize(self):
+        assert normalize("  O'Brien  Müller ") == 'obrien muller'
+
+    def test_exact(self):
+        index = GEDCOM5Parser().parse_string(MSG).name_index()
+        assert xrefs(index.search('smith')) == ['@I1@']
+        assert xrefs(index.search('MULLER')) == ['@I3@']
+        assert xrefs(index.search('Miller')) == ['@I3@']
+        assert xrefs(index.search('Yamada')) == ['@I4@']
+        assert xrefs(index.search('山田')) == ['@I4@']
+        assert xrefs(index.search(given='Paul')) == ['@I1@']
+        assert xrefs(index.search(given='Georg')) == ['@I3@']
+
+    def test_prefix(self):
+        index = GEDCOM5Parser().parse_string(MSG).name_index()
+        assert xrefs(index.search('Smi', match=PREFIX)) == ['@I1@', '@I5@']
+        assert xrefs(index.search('Sm', given='Ma', match=PREFIX)) == ['@I2@']
+        assert index.search('Zz', match=PREFIX) == []
+
+    def test_phonetic(self):
+        index = GEDCOM5Parser().parse_string(MSG).name_index()
+        assert xrefs(index.search('Smyth', match=SOUNDEX)) == ['@I1@', '@I2@']
+        assert xrefs(index.search('Schmitt', match=METAPHONE)) == ['@I1@', '@I2@']
+        assert xrefs(index.search(given='Katherine', match=METAPHONE)) == ['@I5@']
+
+    def test_cache(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        index = gedcom.name_index()
+        assert gedcom.name_index() is index
+        indi = INDI(xref_id='@I6@')
+        gedcom.append(indi)
+        assert gedcom.name_index() is not index
+
+    def test_unknown_match(self):
+        index = GEDCOM5Parser().parse_string(MSG).name_index()
+        with pytest.raises(ValueError):
+            index.search('Smith', match='fuzzy')
+        assert index.search() == []
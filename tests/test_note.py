@@ -1,4 +1,7 @@
+from gedcom5.diff import diff
 from gedcom5.parser import GEDCOM5Parser
+from gedcom5.patch import apply
+from gedcom5.tag import CONT
 from tests.structures import note_structure, source_citation, change_date
 
 
@@ -104,3 +107,48 @@ class TestCase:
         ])
         gedcom = parser.parse_string(msg, strict=True)
         assert gedcom[0].note == []
+
+    def test_note_cached(self):
+        parser = GEDCOM5Parser()
+        msg = '\n'.join([
+            '0 NOTE First',
+            '1 CONC  line',
+            '1 CONC',
+        ])
+        gedcom = parser.parse_string(msg, strict=True)
+        note = gedcom[0]
+        assert note.note == ['First line']
+        note.note.append('changed')
+        assert note.note == ['First line']
+        cont = CONT(level=1, parent=note, value='Second line')
+        note.append(cont)
+        assert note.note == ['First line', 'Second line']
+        assert note.full_text == 'First line\nSecond line'
+
+    def test_long_note(self):
+        parser = GEDCOM5Parser()
+        msg = '\n'.join(['0 NOTE start'] + ['1 CONC ' + 'x' * 20] * 10000 + ['1 CONT end'])
+        gedcom = parser.parse_string(msg, strict=True)
+        assert gedcom[0].note == ['start' + 'x' * 200000, 'end']
+
+    def test_note_follows_value_changes(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('0 @N1@ NOTE first\n1 CONT second\n1 CONC  half')
+        note = gedcom.note[0]
+        assert note.note == ['first', 'second half']
+        note.value = 'start'
+        assert note.note == ['start', 'second half']
+        note.lines[1].value = ' whole'
+        assert note.note == ['start', 'second whole']
+        assert note.full_text == 'start\nsecond whole'
+
+    def test_note_after_patch(self):
+        parser = GEDCOM5Parser()
+        old = parser.parse_string('0 @N1@ NOTE first\n1 CONT second')
+        new = parser.parse_string('0 @N1@ NOTE first\n1 CONT changed\n1 CONT third')
+        assert old.note[0].note == ['first', 'second']
+        apply(old, diff(old, new))
+        assert old.note[0].as_text() == new.note[0].as_text()
+        assert old.note[0].note == ['first', 'changed', 'third']
+        apply(old, diff(old, parser.parse_string('0 @N1@ NOTE first')))
+        assert old.note[0].note == ['first']
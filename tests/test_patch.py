@@ -0,0 +1,109 @@
+import pytest
+
+from gedcom5.diff import Change, diff
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.patch import PatchError, apply
+from tests.test_diff import NEW, OLD
+
+
+class TestCase:
+
+    def test_apply_diff(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string(OLD)
+        new = parser.parse_string(NEW)
+        apply(gedcom, diff(gedcom, new))
+        assert diff(gedcom, new) == []
+        assert [indi.xref_id for indi in gedcom.indi] == ['@I1@', '@I9@', '@I3@']
+        assert gedcom.note == []
+        assert set(gedcom._xref) == {'@I1@', '@I9@', '@I3@'}
+
+    def test_typed_attributes(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string(OLD)
+        apply(gedcom, [
+            Change('replace', '@I1@', path='BIRT[0].DATE[0]', new='ABT 1850'),
+            Change('add', '@I1@', path='BIRT[0]', text=['2 PLAC London']),
+            Change('remove', '@I1@', path='OCCU[0]'),
+        ])
+        indi = gedcom.indi[0]
+        assert indi.birth_year == 1850
+        assert indi.birt[0].date.type == 'ABT'
+        assert indi.birth_place == 'London'
+        assert [occu.value for occu in indi.occu] == ['Miller']
+
+    def test_references(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('\n'.join([
+            '0 @I1@ INDI',
+            '1 FAMC @F1@',
+            '0 @F1@ FAM',
+        ]))
+        apply(gedcom, [
+            Change('add_record', '@F2@', text=['0 @F2@ FAM', '1 CHIL @I1@']),
+            Change('replace', '@I1@', path='FAMC[0]', old='@F1@', new='@F2@'),
+            Change('remove_record', '@F1@'),
+        ])
+        assert [fam.xref_id for fam in gedcom.fam] == ['@F2@']
+        assert gedcom.indi[0].famc[0].ref is gedcom.fam[0]
+        assert gedcom.fam[0].chil[0].ref is gedcom.indi[0]
+
+    def test_renumber_keeps_pointers(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('\n'.join([
+            '0 @I1@ INDI',
+            '1 FAMC @F1@',
+            '0 @F1@ FAM',
+        ]))
+        apply(gedcom, [
+            Change('renumber', '@F1@', old='@F1@', new='@F7@'),
+            Change('replace', '@I1@', path='FAMC[0]', old='@F1@', new='@F7@'),
+        ])
+        assert gedcom.indi[0].famc[0].ref is gedcom.fam[0]
+        assert gedcom.fam[0].xref_id == '@F7@'
+
+    def test_indexes_resolved_before_mutation(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('0 @I1@ INDI\n1 OCCU A\n1 OCCU B\n1 OCCU C')
+        apply(gedcom, [Change('remove', '@I1@', path='OCCU[0]'), Change('remove', '@I1@', path='OCCU[1]')])
+        assert [occu.value for occu in gedcom.indi[0].occu] == ['C']
+
+    def test_missing_path(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string(OLD)
+        with pytest.raises(PatchError):
+            apply(gedcom, [Change('remove', '@I1@', path='DEAT[0]')])
+        with pytest.raises(PatchError):
+            apply(gedcom, [Change('remove_record', '@X1@')])
+
+    def test_strict_add(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('0 @I1@ INDI\n1 BIRT\n2 DATE 1900', strict=True)
+        change = Change('add', '@I1@', path='BIRT[0]', text=['2 PLAC London', '3 MAP', '4 LATI N51.5'])
+        apply(gedcom, [change], strict=True)
+        assert gedcom.indi[0].birt[0].plac.value == 'London'
+        assert gedcom.indi[0].birt[0].plac.map.lati.value == 'N51.5'
+        with pytest.raises(PatchError):
+            apply(gedcom, [Change('add', '@I1@', path='BIRT[0]', text=['2 SEX M'])], strict=True)
+        with pytest.raises(PatchError):
+            apply(gedcom, [Change('add', '@I1@', path='BIRT[0]', text=['2 PLAC Leeds', '3 SEX M'])], strict=True)
+        assert [str(item) for item in gedcom.indi[0].birt[0]] == ['2 DATE 1900', '2 PLAC London']
+
+    def test_failed_batch_leaves_tree_untouched(self):
+        parser = GEDCOM5Parser()
+        gedcom = parser.parse_string('0 @I1@ INDI\n1 NAME John /Smith/\n1 BIRT\n2 DATE 1900', strict=True)
+        changes = [
+            Change('renumber', '@I1@', old='@I1@', new='@I2@'),
+            Change('replace', '@I1@', path='NAME[0]', old='John /Smith/', new='Jack /Smith/'),
+            Change('add', '@I1@', path='BIRT[0]', text=['2 SEX M']),
+        ]
+        with pytest.raises(PatchError):
+            apply(gedcom, changes, strict=True)
+        indi = gedcom.indi[0]
+        assert indi.xref_id == '@I1@'
+        assert indi.name[0].value == 'John /Smith/'
+        assert [str(item) for item in indi.birt[0]] == ['2 DATE 1900']
+        assert gedcom._xref == {'@I1@': indi}
+        with pytest.raises(PatchError):
+            apply(gedcom, [Change('add_record', '@F1@', text=['0 @F1@ FAM', '1 SEX M'])], strict=True)
+        assert gedcom.fam == [] and '@F1@' not in gedcom._xref
@@ -0,0 +1,77 @@
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.places import PlaceIndex, split_place
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '1 PLAC',
+    '2 FORM City, County, State, Country',
+    '0 @I1@ INDI',
+    '1 BIRT',
+    '2 PLAC Leeds, Yorkshire, England, UK',
+    '1 DEAT',
+    '2 PLAC Bradford,  yorkshire , England, UK',
+    '0 @I2@ INDI',
+    '1 BIRT',
+    '2 PLAC Leeds, Yorkshire, England, UK',
+    '1 RESI',
+    '2 PLAC , Yorkshire, England, UK',
+    '1 BURI',
+    '2 PLAC York, Yorkshire, England, UK',
+    '0 @I3@ INDI',
+    '1 BIRT',
+    '2 PLAC Boston, Suffolk, Massachusetts, USA',
+    '1 DEAT',
+    '2 PLAC St Mary, Boston',
+    '3 FORM Parish, Town',
+    '0 @F1@ FAM',
+    '1 MARR',
+    '2 PLAC Leeds, Yorkshire, England, UK',
+])
+
+
+class TestCase:
+
+    def test_split(self):
+        assert split_place(' Leeds ,Yorkshire,, UK') == ['Leeds', 'Yorkshire', '', 'UK']
+
+    def test_hierarchy(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        index = gedcom.place_index()
+        assert index.form == ['City', 'County', 'State', 'Country']
+        yorkshire = index.get('UK', 'England', 'Yorkshire')
+        assert yorkshire.jurisdiction == 'County'
+        assert yorkshire.count == 6
+        assert sorted(yorkshire.children) == ['bradford', 'leeds', 'york']
+        leeds = index.get('uk', 'england', 'yorkshire', 'leeds')
+        assert leeds.jurisdiction == 'City'
+        assert leeds.count == 3
+        assert [event.tag for event in leeds.events] == ['BIRT', 'BIRT', 'MARR']
+        assert leeds.path == ['UK', 'England', 'Yorkshire', 'Leeds']
+        assert [event.tag for event in yorkshire.events] == ['RESI']
+        assert index.root.count == 8
+
+    def test_queries(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        index = gedcom.place_index()
+        events = index.events('Yorkshire', jurisdiction='County')
+        assert sorted(event.tag for event in events) == ['BIRT', 'BIRT', 'BURI', 'DEAT', 'MARR', 'RESI']
+        assert index.events('Yorkshire', jurisdiction='City') == []
+        assert [place.path for place in index.find('Boston')] == [
+            ['USA', 'Massachusetts', 'Suffolk', 'Boston'], ['Boston']
+        ]
+        st_mary = index.get('Boston', 'St Mary')
+        assert st_mary.jurisdiction == 'Parish'
+        assert index.find('Boston', jurisdiction='town')[0].path == ['Boston']
+        assert index.get('UK', 'Wales') is None
+
+    def test_cached(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert gedcom.place_index() is gedcom.place_index()
+        gedcom.invalidate()
+        assert gedcom.place_index().root.count == 8
+
+    def test_without_form(self):
+        gedcom = GEDCOM5Parser().parse_string('0 @I1@ INDI\n1 BIRT\n2 PLAC Leeds, England')
+        index = PlaceIndex(gedcom)
+        assert index.form == []
+        assert index.get('England', 'Leeds').jurisdiction is None
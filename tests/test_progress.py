@@ -0,0 +1,40 @@
+from io import BytesIO
+from os.path import dirname, join
+
+from gedcom5.parser import GEDCOM5Parser
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/',
+    '0 @I2@ INDI',
+    '1 NAME Mary /SMITH/',
+    '0 TRLR',
+])
+
+
+class TestCase:
+
+    def test_parse_string(self):
+        reports = []
+        GEDCOM5Parser().parse_string(MSG, progress=reports.append, progress_every=2)
+        assert [(report.lines, report.records) for report in reports] == [(2, 1), (4, 2), (6, 3), (6, 4)]
+        assert all(report.bytes_read is None and report.fraction is None for report in reports)
+
+    def test_parse_stream(self):
+        data = MSG.encode('utf-8')
+        reports = []
+        GEDCOM5Parser().parse_stream(BytesIO(data), progress=reports.append, progress_every=4)
+        assert [report.lines for report in reports] == [4, 6]
+        assert reports[-1].total_bytes == len(data)
+        assert reports[-1].bytes_read == len(data)
+        assert reports[-1].fraction == 1.0
+        assert reports[-1].records == 4
+
+    def test_parse_path(self):
+        reports = []
+        gedcom = GEDCOM5Parser().parse_path(join(dirname(__file__), '555SAMPLE.GED'), progress=reports.append)
+        assert len(reports) == 1
+        assert reports[0].lines == 97
+        assert reports[0].records == len(gedcom)
+        assert reports[0].total_bytes == reports[0].bytes_read > 0
@@ -0,0 +1,98 @@
+from io import BytesIO
+
+import pytest
+
+from gedcom5.diagnostics import BLANK_LINE, DANGLING_POINTER, LEVEL_JUMP, MISSING_LEVEL, MISSING_TAG, STRAY_CR, \
+    UNDECODABLE, UNEXPECTED_TAG, UNKNOWN_TAG
+from gedcom5.parser import GEDCOM5Parser, ParseError
+
+LINES = [
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/\r',
+    '3 SURN BROWN',
+    '1 NOTE First line',
+    'second line',
+    '1',
+    '1 BOGUS value',
+    '1 _UID 1234',
+    '1 FAMC @F1@',
+    '2 CHIL @I1@',
+    '0 @F1@ FAM',
+    '1 CHIL @I1@',
+    '0 TRLR',
+]
+
+
+class TestCase:
+
+    def test_recover(self):
+        gedcom = GEDCOM5Parser().parse_lines(LINES, recover=True)
+        assert [(d.line_num, d.code, d.xref) for d in gedcom.diagnostics] == [
+            (3, BLANK_LINE, None),
+            (5, STRAY_CR, '@I1@'),
+            (6, LEVEL_JUMP, '@I1@'),
+            (8, MISSING_LEVEL, '@I1@'),
+            (9, MISSING_TAG, '@I1@'),
+            (10, UNKNOWN_TAG, '@I1@'),
+            (13, UNEXPECTED_TAG, '@I1@'),
+        ]
+        indi = gedcom.indi[0]
+        assert indi.name[0].value == 'Bob /BROWN/'
+        assert indi.name[0].find_first('SURN').level == 2
+        assert indi.note[0].find_first('CONT').value == 'second line'
+        assert indi.famc[0].ref is gedcom.fam[0]
+        assert len(gedcom) == 4
+
+    def test_strict_raises(self):
+        with pytest.raises(ParseError) as info:
+            GEDCOM5Parser().parse_lines(LINES, strict=True)
+        assert info.value.line_num == 3
+
+    def test_clean_file_has_no_diagnostics(self):
+        gedcom = GEDCOM5Parser().parse_string('0 HEAD\n1 CHAR UTF-8\n0 @I1@ INDI\n1 SEX M\n0 TRLR', recover=True)
+        assert gedcom.diagnostics == []
+
+    def test_missing_level_before_first_record(self):
+        gedcom = GEDCOM5Parser().parse_string('junk\n0 HEAD', recover=True)
+        assert [d.code for d in gedcom.diagnostics] == [MISSING_LEVEL]
+        assert gedcom.diagnostics[0].message == 'Line without a level skipped'
+        assert len(gedcom) == 1
+
+    def test_stream(self):
+        data = '0 HEAD\n\n0 @I1@ INDI\n2 SEX M\n'.encode('utf-8')
+        gedcom = GEDCOM5Parser().parse_stream(BytesIO(data), recover=True)
+        assert [d.code for d in gedcom.diagnostics] == [BLANK_LINE, LEVEL_JUMP]
+        assert gedcom.indi[0].sex.value == 'M'
+
+    def test_as_dict(self):
+        gedcom = GEDCOM5Parser().parse_string('0 HEAD\n\n', recover=True)
+        assert gedcom.diagnostics[0].as_dict() == {
+            'line_num': 2, 'code': BLANK_LINE, 'message': 'Blank line skipped', 'xref': None, 'line': ''
+        }
+        assert str(gedcom.diagnostics[0]) == 'line 2: blank-line: Blank line skipped'
+
+    def test_dangling_pointers(self):
+        lines = ['0 @I1@ INDI', '1 FAMC @F1@', '1 FAMS @F9@', '0 @F1@ FAM', '1 HUSB @I7@', '0 TRLR']
+        gedcom = GEDCOM5Parser().parse_lines(lines, recover=True)
+        assert [(d.line_num, d.code, d.xref, d.line) for d in gedcom.diagnostics] == [
+            (3, DANGLING_POINTER, '@I1@', '1 FAMS @F9@'),
+            (5, DANGLING_POINTER, '@F1@', '1 HUSB @I7@'),
+        ]
+        assert gedcom.diagnostics[0].message == 'Pointer @F9@ has no matching record'
+        assert gedcom.indi[0].famc[0].ref is gedcom.fam[0]
+        assert gedcom.indi[0].fams[0].ref == '@F9@'
+
+    def test_undecodable_bytes(self):
+        data = b'0 HEAD\n1 CHAR UTF-8\n0 @I1@ INDI\n1 NAME J\xe9r /X/\n1 SEX M\n0 TRLR\n'
+        gedcom = GEDCOM5Parser().parse_stream(BytesIO(data), recover=True)
+        assert [(d.line_num, d.code, d.xref) for d in gedcom.diagnostics] == [(4, UNDECODABLE, '@I1@')]
+        assert gedcom.indi[0].name[0].value == 'J\ufffdr /X/'
+        assert gedcom.indi[0].sex.value == 'M'
+        for strict in (False, True):
+            with pytest.raises(ParseError) as info:
+                GEDCOM5Parser().parse_stream(BytesIO(data), strict=strict)
+            assert info.value.line_num == 4
+            assert info.value.line == '1 NAME J'
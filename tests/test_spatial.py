@@ -0,0 +1,75 @@
+from benchmarks.synthetic import Generator
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.places import places
+from gedcom5.spatial import SpatialIndex, distance_km
+from gedcom5.tag import LATI, LONG, parse_coordinate
+
+
+def event(tag, place, latitude, longitude):
+    return [f'1 {tag}', f'2 PLAC {place}', '3 MAP', f'4 LATI {latitude}', f'4 LONG {longitude}']
+
+
+MSG = '\n'.join(
+    ['0 @I1@ INDI'] + event('BIRT', 'London', 'N51.5072', 'W0.1276') + event('DEAT', 'Paris', 'N48.8566', 'E2.3522') +
+    ['0 @I2@ INDI'] + event('BIRT', 'Oxford', 'N51.7520', 'W1.2577') + event('RESI', 'Sydney', 'S33.8688', 'E151.2093') +
+    ['0 @I3@ INDI'] + event('BIRT', 'Suva', 'S18.1248', 'E178.4501') + event('DEAT', 'Apia', 'S13.8333', 'W171.7500') +
+    ['0 @I4@ INDI', '1 BIRT', '2 PLAC Nowhere', '3 MAP', '4 LATI bogus', '4 LONG W1']
+)
+
+
+def names(events):
+    return [item.plac.value for item in events]
+
+
+class TestCase:
+
+    def test_parse_coordinate(self):
+        assert parse_coordinate('N51.5', 'N', 'S', 90.0) == 51.5
+        assert parse_coordinate('s33.9', 'N', 'S', 90.0) == -33.9
+        assert parse_coordinate('-12.25', 'N', 'S', 90.0) == -12.25
+        assert parse_coordinate('N91', 'N', 'S', 90.0) is None
+        assert parse_coordinate('Nx', 'N', 'S', 90.0) is None
+        assert parse_coordinate(None, 'N', 'S', 90.0) is None
+        assert LONG(value='W0.12').degrees == -0.12
+        assert LATI(value='').degrees is None
+
+    def test_map(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        birt = gedcom.indi[0].birt[0]
+        assert birt.plac.map.coordinates == (51.5072, -0.1276)
+        assert gedcom.indi[3].birt[0].plac.map.coordinates is None
+        assert gedcom.indi[3].birt[0].plac.map.longitude == -1.0
+
+    def test_bbox(self):
+        index = GEDCOM5Parser().parse_string(MSG).spatial_index()
+        assert len(index) == 6
+        assert names(index.bbox(50, -2, 52, 3)) == ['London', 'Oxford']
+        assert sorted(names(index.bbox(45, -5, 55, 5))) == ['London', 'Oxford', 'Paris']
+        assert sorted(names(index.bbox(-20, 170, -10, -170))) == ['Apia', 'Suva']
+
+    def test_radius(self):
+        index = GEDCOM5Parser().parse_string(MSG).spatial_index()
+        found = index.radius(51.5072, -0.1276, 100)
+        assert names(event for _, event in found) == ['London', 'Oxford']
+        assert found[0][0] == 0.0
+        assert 75 < found[1][0] < 85
+        assert sorted(names(event for _, event in index.radius(-16, 180, 1200))) == ['Apia', 'Suva']
+        assert names(event for _, event in index.radius(89.9, 0, 100)) == []
+
+    def test_distance(self):
+        assert 340 < distance_km(51.5072, -0.1276, 48.8566, 2.3522) < 345
+
+    def test_matches_scan(self):
+        gedcom = GEDCOM5Parser().parse_string(Generator(2000, seed=3).text())
+        index = gedcom.spatial_index()
+        points = [(plac.map.coordinates, plac.parent) for plac in places(gedcom) if plac.map is not None]
+        assert len(index) == len(points) > 0
+        latitude, longitude = points[0][0]
+        expected = {id(item) for (lat, lon), item in points if distance_km(latitude, longitude, lat, lon) <= 500}
+        assert {id(item) for _, item in index.radius(latitude, longitude, 500)} == expected
+        expected = {id(item) for (lat, lon), item in points if 40 <= lat <= 55 and -10 <= lon <= 10}
+        assert {id(item) for item in index.bbox(40, -10, 55, 10)} == expected
+
+    def test_cell_size(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert names(SpatialIndex(gedcom, cell_degrees=10).bbox(50, -2, 52, 3)) == ['London', 'Oxford']
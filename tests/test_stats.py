@@ -0,0 +1,42 @@
+from io import BytesIO
+
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.stats import ParseStats
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '0 @I1@ INDI',
+    '1 NAME Bob /BROWN/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '1 _UID 1234',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '0 TRLR',
+])
+
+
+class TestCase:
+
+    def test_counts(self):
+        stats = ParseStats()
+        gedcom = GEDCOM5Parser().parse_string(MSG, stats=stats)
+        assert len(gedcom) == 4
+        assert stats.lines == 9
+        assert stats.tag_counts['INDI'] == 1
+        assert stats.tag_counts['DATE'] == 1
+        assert stats.tag_counts['SOUR'] == 0
+        assert stats.unknown_tags == {'_UID': 1, 'TRLR': 1}
+
+    def test_phases(self):
+        stats = ParseStats()
+        GEDCOM5Parser().parse_stream(BytesIO(MSG.encode('utf-8')), stats=stats)
+        assert set(stats.phases) == {'read', 'tokenize', 'build', 'resolve', 'total'}
+        assert all(seconds >= 0 for seconds in stats.phases.values())
+        assert stats.phases['total'] >= stats.phases['build']
+        assert stats.construct_seconds <= stats.phases['build']
+        assert stats.as_dict()['phases']['construct'] == stats.construct_seconds
+
+    def test_disabled(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert gedcom.fam[0].husb.ref is gedcom.indi[0]
@@ -0,0 +1,31 @@
+from benchmarks.synthetic import Generator
+from gedcom5.graph import cycles
+from gedcom5.links import check
+from gedcom5.parser import GEDCOM5Parser
+
+
+class TestCase:
+
+    def test_deterministic(self):
+        assert Generator(individuals=50, seed=1).text() == Generator(individuals=50, seed=1).text()
+        assert Generator(individuals=50, seed=1).text() != Generator(individuals=50, seed=2).text()
+
+    def test_parses_strictly(self):
+        lines = list(Generator(individuals=200).lines())
+        assert lines[-1] == '0 TRLR'
+        gedcom = GEDCOM5Parser().parse_lines(lines[:-1], strict=True)
+        assert len(gedcom.indi) == 200
+        assert len(gedcom.fam) == 66
+        assert len(gedcom.sour) == 10
+        assert len(gedcom.note) == 20
+        assert all(isinstance(fam.husb.ref, type(gedcom.indi[0])) for fam in gedcom.fam)
+
+    def test_consistent_families(self):
+        gedcom = GEDCOM5Parser().parse_string(Generator(individuals=1000, seed=4).text())
+        assert check(gedcom) == []
+        assert list(cycles(gedcom)) == []
+        assert sum(len(fam.chil) for fam in gedcom.fam) > 500
+        for fam in gedcom.fam:
+            spouses = [spouse.ref for spouse in (fam.husb, fam.wife) if spouse is not None]
+            for chil in fam.chil:
+                assert all(spouse.birth_year < chil.ref.birth_year for spouse in spouses)
@@ -0,0 +1,56 @@
+from gedcom5.parser import GEDCOM5Parser
+
+
+class TestCase:
+
+    def test_head_copr(self):
+        msg = '\n'.join([
+            '0 HEAD',
+            '1 COPR Copyright',
+            '2 CONC  2024',
+            '2 CONT All rights reserved',
+        ])
+        gedcom = GEDCOM5Parser().parse_string(msg, strict=True)
+        assert gedcom.head[0].copr.text_lines == ['Copyright 2024', 'All rights reserved']
+        assert gedcom.head[0].copr.full_text == 'Copyright 2024\nAll rights reserved'
+
+    def test_source_record(self):
+        msg = '\n'.join([
+            '0 @S1@ SOUR',
+            '1 AUTH Jane',
+            '2 CONC  Doe',
+            '1 TITL Parish',
+            '2 CONT Register',
+            '1 PUBL Printed',
+            '2 CONC  1900',
+            '1 TEXT Baptised',
+            '2 CONC  here',
+            '2 CONT by the vicar',
+        ])
+        sour = GEDCOM5Parser().parse_string(msg, strict=True).sour[0]
+        assert sour.auth.full_text == 'Jane Doe'
+        assert sour.titl.text_lines == ['Parish', 'Register']
+        assert sour.publ.full_text == 'Printed 1900'
+        assert sour.text[0].text_lines == ['Baptised here', 'by the vicar']
+        assert sour.text_lines == []
+
+    def test_source_citation(self):
+        msg = '\n'.join([
+            '0 @I1@ INDI',
+            '1 SOUR A description',
+            '2 CONC  of the source',
+            '2 CONT continued',
+        ])
+        indi = GEDCOM5Parser().parse_string(msg, strict=True).indi[0]
+        assert indi.sour[0].text_lines == ['A description of the source', 'continued']
+
+    def test_addr(self):
+        msg = '\n'.join([
+            '0 @R1@ REPO',
+            '1 NAME Archive',
+            '1 ADDR 1 High Street',
+            '2 CONT Leeds',
+            '2 CITY Leeds',
+        ])
+        repo = GEDCOM5Parser().parse_string(msg, strict=True).repo[0]
+        assert repo.addr.text_lines == ['1 High Street', 'Leeds']
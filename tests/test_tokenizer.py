@@ -0,0 +1,37 @@
+import pytest
+
+from gedcom5.parser import GEDCOM5Parser, ParseError
+from gedcom5.tokenizer import tokenize
+
+
+class TestCase:
+
+    @pytest.mark.parametrize('line,expected', [
+        ('0 HEAD', (0, None, 'HEAD', None)),
+        ('\ufeff0 HEAD', (0, None, 'HEAD', None)),
+        ('0 @I1@ INDI', (0, '@I1@', 'INDI', None)),
+        ('  2 DATE 1 JAN 1900', (2, None, 'DATE', '1 JAN 1900')),
+        ('1 CONC  of  the  note. ', (1, None, 'CONC', ' of  the  note. ')),
+        ('0 NOTE ', (0, None, 'NOTE', '')),
+        ('1 FAMC @F1@', (1, None, 'FAMC', '@F1@')),
+    ])
+    def test_tokenize(self, line, expected):
+        assert tokenize(line) == expected
+
+    @pytest.mark.parametrize('line', ['', 'ABC', '0', 'X HEAD'])
+    def test_tokenize_invalid(self, line):
+        assert tokenize(line) is None
+
+    def test_values_preserved(self):
+        msg = '\n'.join([
+            '0 NOTE  Two  spaces ',
+            '1 CONC  and  more',
+        ])
+        gedcom = GEDCOM5Parser().parse_string(msg, strict=True)
+        assert gedcom[0].note == [' Two  spaces  and  more']
+
+    def test_missing_tag(self):
+        with pytest.raises(ParseError) as ex:
+            GEDCOM5Parser().parse_string('0 HEAD\n1', strict=True)
+        assert ex.value.line_num == 2
+        assert 'Missing tag' in str(ex.value)
@@ -0,0 +1,54 @@
+from gedcom5.links import repair
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.tag import INDI
+from tests.test_graph import CYCLE
+
+MSG = '\n'.join([
+    '0 @C@ INDI',
+    '1 FAMC @F2@',
+    '0 @B@ INDI',
+    '1 FAMC @F1@',
+    '1 FAMS @F2@',
+    '0 @A@ INDI',
+    '1 FAMS @F1@',
+    '0 @X@ INDI',
+    '1 FAMS @F2@',
+    '0 @F1@ FAM',
+    '1 HUSB @A@',
+    '1 CHIL @B@',
+    '0 @F2@ FAM',
+    '1 HUSB @B@',
+    '1 WIFE @X@',
+    '1 CHIL @C@',
+])
+
+
+def xrefs(items):
+    return [item.xref_id for item in items]
+
+
+class TestCase:
+
+    def test_order(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert xrefs(gedcom.topological_order()) == ['@A@', '@X@', '@B@', '@C@']
+        assert [gedcom.generation(indi) for indi in gedcom.indi] == [2, 1, 0, 0]
+
+    def test_cached_until_append(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        order = gedcom.topological_order()
+        assert gedcom.topological_order() is order
+        gedcom.append(INDI(xref_id='@D@'))
+        assert xrefs(gedcom.topological_order()) == ['@A@', '@X@', '@D@', '@B@', '@C@']
+        assert gedcom.topological_order() is not order
+
+    def test_cycles_last(self):
+        gedcom = GEDCOM5Parser().parse_string(CYCLE)
+        assert xrefs(gedcom.topological_order()) == ['@I1@', '@I2@', '@I3@', '@I4@']
+        assert [gedcom.generation(indi) for indi in gedcom.indi] == [None, None, None, None]
+
+    def test_invalidated_by_repair(self):
+        gedcom = GEDCOM5Parser().parse_string('0 @P@ INDI\n1 FAMS @F1@\n0 @K@ INDI\n0 @F1@ FAM\n1 CHIL @K@')
+        assert gedcom.generation(gedcom.indi[1]) == 0
+        repair(gedcom)
+        assert gedcom.generation(gedcom.indi[1]) == 1
@@ -0,0 +1,86 @@
+from os.path import dirname, join
+
+import pytest
+
+from gedcom5.parser import GEDCOM5Parser
+from gedcom5.validate import Finding, RULES, UnknownRule, Validator, rule, validate
+
+MSG = '\n'.join([
+    '0 HEAD',
+    '1 GEDC',
+    '2 VERS 5.5.1',
+    '0 @I1@ INDI',
+    '1 SEX M',
+    '1 SEX F',
+    '1 BIRT',
+    '2 DATE 1 JAN 1900',
+    '1 DEAT',
+    '2 DATE 1850',
+    '1 FAMS @F1@',
+    '1 FAMC @F9@',
+    '0 @I2@ INDI',
+    '1 FAMC @F1@',
+    '0 @F1@ FAM',
+    '1 CHIL @I3@',
+    '0 @I3@ INDI',
+    '0 TRLR',
+])
+
+
+class TestCase:
+
+    def test_sample_is_clean(self):
+        gedcom = GEDCOM5Parser().parse_path(join(dirname(__file__), '555SAMPLE.GED'))
+        assert validate(gedcom) == []
+
+    def test_findings(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert [(f.rule, f.xref, f.path) for f in validate(gedcom)] == [
+            ('head-required', 'HEAD#0', ''),
+            ('head-required', 'HEAD#0', ''),
+            ('cardinality', '@I1@', ''),
+            ('death-before-birth', '@I1@', ''),
+            ('family-links', '@I1@', 'FAMS[0]'),
+            ('dangling-pointer', '@I1@', 'FAMC[0]'),
+            ('family-links', '@I2@', 'FAMC[0]'),
+            ('family-links', '@F1@', 'CHIL[0]'),
+        ]
+
+    def test_messages(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        messages = [f.message for f in validate(gedcom)]
+        assert messages[:4] == [
+            'Missing HEAD.GEDC.FORM',
+            'Missing HEAD.CHAR',
+            'INDI has 2 SEX tags, at most 1 allowed',
+            'Death year 1850 is before birth year 1900',
+        ]
+        assert messages[4] == '@F1@ has no HUSB/WIFE pointing back to @I1@'
+        assert messages[5] == 'FAMC points to missing record @F9@'
+        assert messages[7] == '@I3@ has no FAMC pointing back to @F1@'
+
+    def test_selective(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        assert [f.rule for f in validate(gedcom, rules=['cardinality'])] == ['cardinality']
+        findings = Validator(exclude=['family-links', 'head-required']).validate(gedcom)
+        assert [f.rule for f in findings] == ['cardinality', 'death-before-birth', 'dangling-pointer']
+
+    def test_missing_head(self):
+        gedcom = GEDCOM5Parser().parse_string('0 @I1@ INDI')
+        assert validate(gedcom) == [Finding('head-missing', 'Missing HEAD record')]
+
+    def test_unknown_rule(self):
+        with pytest.raises(UnknownRule):
+            Validator(rules=['nope'])
+
+    def test_register(self):
+        @rule('test-no-name', 'INDI')
+        def no_name(indi, _):
+            if not indi.name:
+                yield 'INDI has no NAME'
+        try:
+            gedcom = GEDCOM5Parser().parse_string('0 @I1@ INDI\n1 NAME A /B/\n0 @I2@ INDI')
+            findings = validate(gedcom, rules=['test-no-name'])
+            assert [(f.xref, str(f)) for f in findings] == [('@I2@', '@I2@: INDI has no NAME [test-no-name]')]
+        finally:
+            del RULES['test-no-name']
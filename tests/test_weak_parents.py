@@ -0,0 +1,87 @@
+import gc
+
+import pytest
+
+from gedcom5.parser import COLLECTOR, GEDCOM5Parser, ParseError
+
+MSG = '\n'.join([
+    '0 @I1@ INDI',
+    '1 NAME John /Smith/',
+    '2 SURN Smith',
+    '1 _CUSTOM value',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+])
+
+
+class TestCase:
+
+    def test_weak_parents(self):
+        gedcom = GEDCOM5Parser(weak_parents=True).parse_string(MSG)
+        indi = gedcom.indi[0]
+        assert indi.parent is gedcom
+        assert indi.name[0].parent is indi
+        assert indi.name[0].surn.parent is indi.name[0]
+        assert indi[-1].parent is indi
+        assert indi.name[0].__dict__['_parent'] is not indi
+        assert gedcom.fam[0].husb.ref is indi
+
+    def test_freed_parent(self):
+        gedcom = GEDCOM5Parser(weak_parents=True).parse_string('0 @I1@ INDI\n1 NAME John /Smith/')
+        name = gedcom.indi[0].name[0]
+        del gedcom
+        gc.collect()
+        assert name.parent is None
+
+    def test_assignment_stays_weak(self):
+        gedcom = GEDCOM5Parser(weak_parents=True).parse_string(MSG)
+        indi, fam = gedcom.indi[0], gedcom.fam[0]
+        name = indi.name[0]
+        name.parent = fam
+        assert name.parent is fam
+        assert name.__dict__['_parent'] is not fam
+
+    def test_strong_by_default(self):
+        gedcom = GEDCOM5Parser().parse_string(MSG)
+        name = gedcom.indi[0].name[0]
+        assert name.__dict__['_parent'] is gedcom.indi[0]
+        del gedcom
+        assert name.parent.xref_id == '@I1@'
+
+    def test_defer_gc(self):
+        assert gc.isenabled()
+        with pytest.raises(ParseError):
+            GEDCOM5Parser(defer_gc=True).parse_string('0 HEAD\nbad')
+        assert gc.isenabled()
+        gc.disable()
+        try:
+            GEDCOM5Parser(defer_gc=True).parse_string(MSG)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_gc_untouched_by_default(self):
+        seen = []
+
+        def lines():
+            for line in MSG.splitlines():
+                seen.append(gc.isenabled())
+                yield line
+        GEDCOM5Parser().parse_lines(lines())
+        assert all(seen)
+
+    def test_overlapping_deferrals(self):
+        seen = []
+
+        def lines():
+            for line in MSG.splitlines():
+                seen.append(gc.isenabled())
+                yield line
+        COLLECTOR.acquire()
+        try:
+            GEDCOM5Parser(defer_gc=True).parse_lines(lines())
+            assert not gc.isenabled()
+        finally:
+            COLLECTOR.release()
+        assert gc.isenabled()
+        assert not any(seen)